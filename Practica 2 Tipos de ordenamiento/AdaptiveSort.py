@@ -0,0 +1,209 @@
+import math # Para estimar el costo de Radix Sort frente a los ordenamientos por comparación.
+
+try: # NumPy es opcional: solo lo necesita el motor vectorizado de Radix Sort.
+    import numpy as np
+except ImportError: # Sin NumPy, Radix Sort solo se elige para enteros no negativos (motor de Python).
+    np = None
+
+from Inserción import insertion_sort
+from ModuleLoader import load_module
+from QuickSort import quick_sort
+from RadixSort import radix_sort
+
+natural_merging = load_module("Natural merging.py").natural_merging
+
+SAMPLE_SIZE = 256 # Elementos que se inspeccionan para perfilar la entrada.
+SAMPLE_WINDOWS = 8 # Ventanas contiguas en las que se reparte la muestra (conservan el orden local).
+SMALL_INPUT = 32 # Hasta este tamaño, Insertion Sort es lo más rápido (sin sobrecosto de recursión ni buffers).
+PRESORTED_DESCENT_RATIO = 0.05 # Con menos descensos que esto (o más de 1 - esto) la entrada está casi ordenada.
+RADIX_MIN_SIZE = 1024 # Por debajo, preparar las pasadas de Radix Sort no compensa.
+DUPLICATE_RATIO = 0.5 # Con más duplicados que esto, la partición en tres vías de Introsort brilla.
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1 # Rango que NumPy puede representar sin objetos.
+
+
+def profile_input(arr, key=None, sample_size=SAMPLE_SIZE): # Perfil barato de la entrada a partir de una muestra.
+    """
+    Inspecciona a lo sumo 'sample_size' elementos (repartidos en SAMPLE_WINDOWS ventanas
+    contiguas a lo largo de la lista) y estima las características que deciden el algoritmo.
+
+    Args:
+        arr: La lista a ordenar.
+        key: Función de clave; si se da, el perfil se calcula sobre las claves de la muestra.
+        sample_size: Número máximo de elementos inspeccionados.
+
+    Returns:
+        dict: size (n), sample_size, element_type (nombre del tipo, o "mixed"),
+              min/max (solo para números), descent_ratio (fracción de pares consecutivos
+              descendentes), estimated_runs (tramos naturales estimados en toda la lista) y
+              duplicate_ratio (fracción de repetidos en la muestra; None si no son hashables).
+    """
+    n = len(arr)
+    if n <= sample_size: # Entrada pequeña: la muestra es la lista completa.
+        windows = [(0, n)]
+    else: # Ventanas contiguas repartidas uniformemente.
+        width = sample_size // SAMPLE_WINDOWS
+        windows = [((n - width) * w // (SAMPLE_WINDOWS - 1), (n - width) * w // (SAMPLE_WINDOWS - 1) + width)
+                   for w in range(SAMPLE_WINDOWS)]
+
+    sample = [] # Elementos (o claves) inspeccionados.
+    descents = pairs = 0 # Pares consecutivos descendentes y pares totales dentro de las ventanas.
+    for lo, hi in windows:
+        window = arr[lo:hi]
+        if key is not None: # La clave solo se calcula para la muestra.
+            window = [key(value) for value in window]
+        for i in range(1, len(window)):
+            if window[i] < window[i - 1]:
+                descents += 1
+        pairs += max(len(window) - 1, 0)
+        sample += window
+
+    types = {type(value) for value in sample}
+    element_type = types.pop().__name__ if len(types) == 1 else ("mixed" if types else None)
+    numeric = element_type in ("int", "float")
+    descent_ratio = descents / pairs if pairs else 0.0
+    try:
+        duplicate_ratio = 1 - len(set(sample)) / len(sample) if sample else 0.0
+    except TypeError: # Elementos no hashables (listas, diccionarios...).
+        duplicate_ratio = None
+
+    return {
+        "size": n,
+        "sample_size": len(sample),
+        "element_type": element_type,
+        "min": min(sample) if numeric and sample else None,
+        "max": max(sample) if numeric and sample else None,
+        "descent_ratio": descent_ratio,
+        "estimated_runs": max(1, round(min(descent_ratio, 1 - descent_ratio) * n)),
+        "duplicate_ratio": duplicate_ratio,
+    }
+
+
+def _radix_engine(arr, profile): # Motor de Radix Sort aplicable a 'arr', o None si no conviene.
+    """
+    La muestra sugiere números; aquí se verifica la lista COMPLETA (un tipo distinto en una
+    posición no muestreada rompería Radix Sort) y se estima si compensa frente a Introsort.
+    """
+    n = profile["size"]
+    if profile["element_type"] == "int":
+        if not all(type(value) is int for value in arr): # Ni bool, ni flotantes, ni otros tipos.
+            return None
+        low, high = min(arr), max(arr) # Rango exacto de los enteros.
+        if np is not None and INT64_MIN <= low and high <= INT64_MAX:
+            return "numpy" # Pasadas vectorizadas de 8 bits: mucho más rápido que comparar en Python.
+        # Motor de Python (base 10): una pasada por dígito del máximo. Compensa si hay menos
+        # dígitos que la mitad de las ~log2(n) comparaciones por elemento de un ordenamiento por comparación.
+        if low >= 0 and len(str(high)) <= math.log2(n) / 2:
+            return "python"
+        return None
+    if profile["element_type"] == "float" and np is not None:
+        if all(type(value) is float for value in arr):
+            return "numpy"
+    return None
+
+
+def choose_algorithm(arr, key=None, stable=False): # Decide qué algoritmo usar y por qué.
+    """
+    Elige el algoritmo para 'arr' a partir de profile_input:
+
+    1. n <= SMALL_INPUT: insertion_sort (la entrada es pequeña).
+    2. Pocos descensos (o casi todos): natural_merging (la entrada ya está casi ordenada,
+       o casi invertida, y la Fusión Natural la resuelve en ~O(n)).
+    3. Números (sin key=) con n >= RADIX_MIN_SIZE: radix_sort, con el motor de NumPy si está
+       disponible o el de Python para enteros no negativos con pocos dígitos.
+    4. stable=True: natural_merging (Introsort no es estable).
+    5. Muchos duplicados: Introsort (la partición en tres vías los coloca de una vez).
+    6. Caso general: Introsort.
+
+    Returns:
+        dict: algorithm ("insertion_sort", "natural_merging", "radix_sort" o "introsort"),
+              engine (motor de radix_sort, o None), reason (explicación) y profile.
+    """
+    profile = profile_input(arr, key)
+    n = profile["size"]
+    descent_ratio = profile["descent_ratio"]
+    presorted = descent_ratio <= PRESORTED_DESCENT_RATIO or descent_ratio >= 1 - PRESORTED_DESCENT_RATIO
+    engine = None
+    if n >= RADIX_MIN_SIZE and not presorted and key is None:
+        engine = _radix_engine(arr, profile) # Solo se verifica la lista completa si Radix Sort es candidato.
+
+    if n <= SMALL_INPUT:
+        algorithm, reason = "insertion_sort", f"entrada pequeña (n={n} <= {SMALL_INPUT})"
+    elif presorted:
+        algorithm = "natural_merging"
+        reason = (f"casi ordenada: {descent_ratio:.1%} de descensos en la muestra "
+                  f"(~{profile['estimated_runs']} tramos naturales)")
+    elif engine is not None:
+        algorithm = "radix_sort"
+        reason = f"{n} números de tipo {profile['element_type']}: Radix Sort no compara (motor {engine})"
+    elif stable:
+        algorithm, reason = "natural_merging", "se pidió un ordenamiento estable (Introsort no lo es)"
+    elif profile["duplicate_ratio"] is not None and profile["duplicate_ratio"] >= DUPLICATE_RATIO:
+        algorithm = "introsort"
+        reason = f"{profile['duplicate_ratio']:.0%} de duplicados: la partición en tres vías los agrupa de una vez"
+    else:
+        algorithm, reason = "introsort", "datos desordenados: Introsort, O(n log n) garantizado"
+
+    return {"algorithm": algorithm, "engine": engine, "reason": reason, "profile": profile}
+
+
+def resolve_algorithm(arr, key=None, reverse=False, stable=False): # La llamada concreta que haría sort().
+    """
+    Decide el algoritmo para 'arr' (ver choose_algorithm) sin ordenar nada.
+
+    Returns:
+        tuple: (decisión, función, kwargs); sort(arr, key, reverse, stable) equivale a
+               función(arr, **kwargs). Instrumentation.count_operations lo usa para decidir
+               sobre la entrada real antes de envolver sus elementos.
+    """
+    decision = choose_algorithm(arr, key, stable)
+    algorithm = decision["algorithm"]
+    if algorithm == "insertion_sort":
+        return decision, insertion_sort, {"key": key, "reverse": reverse}
+    if algorithm == "natural_merging":
+        return decision, natural_merging, {"key": key, "reverse": reverse}
+    if algorithm == "radix_sort":
+        return decision, radix_sort, {"engine": decision["engine"], "reverse": reverse}
+    return decision, quick_sort, {"mode": "introsort", "key": key, "reverse": reverse}
+
+
+def sort(arr, key=None, reverse=False, stable=False, return_decision=False): # Punto de entrada único.
+    """
+    Ordena 'arr' in-place con el algoritmo más adecuado según una muestra de la entrada
+    (ver choose_algorithm), para no tener que elegir el algoritmo a mano en cada llamada.
+
+    Args:
+        arr: La lista a ordenar.
+        key: Función que extrae la clave de comparación de cada elemento.
+        reverse: Si es True, ordena de mayor a menor.
+        stable: Si es True, solo se eligen algoritmos estables.
+        return_decision: Si es True, también retorna la decisión (algoritmo, motor, motivo y perfil).
+
+    Returns:
+        La lista ordenada; con return_decision=True, la tupla (lista, decisión).
+    """
+    decision, algorithm, kwargs = resolve_algorithm(arr, key, reverse, stable)
+    algorithm(arr, **kwargs)
+    if return_decision:
+        return arr, decision
+    return arr
+
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
+if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
+    import random
+
+    casos = { # Cargas de trabajo distintas: cada una debería tomar un camino distinto.
+        "pequeña": [5, 3, 9, 1, 7],
+        "casi ordenada": list(range(5000)) + [3, 1, 2],
+        "enteros aleatorios": [random.randint(0, 10**6) for _ in range(5000)],
+        "cadenas aleatorias": [str(random.random()) for _ in range(5000)],
+        "muchos duplicados": [random.choice("abc") for _ in range(5000)],
+    }
+    for nombre, datos in casos.items():
+        _, decision = sort(datos, return_decision=True)
+        print(f"{nombre:>20}: {decision['algorithm']:<16} ({decision['reason']})")
+        assert all(datos[i] <= datos[i + 1] for i in range(len(datos) - 1))
+
+    registros = [(random.randint(0, 9), i) for i in range(1000)] # Registros con clave repetida.
+    _, decision = sort(registros, key=lambda r: r[0], stable=True, return_decision=True)
+    print(f"{'registros (estable)':>20}: {decision['algorithm']:<16} ({decision['reason']})")
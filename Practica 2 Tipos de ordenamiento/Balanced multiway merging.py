@@ -1,6 +1,9 @@
 import heapq # Importa el módulo heapq para usar una cola de prioridad (min-heap).
 
-def balanced_multiway_merging(arr, k): # Define la función principal para la Fusión Múltiple Balanceada.
+from KeySupport import sort_with_key # Interfaz común key=/reverse=.
+from LoserTree import get_merge, loser_tree_merge # Núcleo de fusión k-vías con árbol de perdedores.
+
+def balanced_multiway_merging(arr, k, backend="heapq", key=None, reverse=False): # Define la función principal para la Fusión Múltiple Balanceada.
     """
     Ordena una lista de elementos utilizando el algoritmo de Fusión Múltiple Balanceada.
     Asume que la lista se puede dividir en 'k' tramos iniciales.
@@ -8,10 +11,24 @@ def balanced_multiway_merging(arr, k): # Define la función principal para la Fu
     Args:
         arr: La lista de elementos a ordenar.
         k: El número de sublistas (tramos) a mezclar simultáneamente.
+        backend: Núcleo de la fusión k-vías: "heapq" (cola de prioridad con tuplas) o
+                 "loser_tree" (árbol de perdedores: ~log2 k comparaciones por elemento y
+                 ninguna tupla por elemento; conviene con k grande o comparaciones costosas).
+        key: Función que extrae la clave de comparación de cada elemento (se calcula una sola vez por elemento).
+        reverse: Si es True, ordena de mayor a menor.
 
     Returns:
         La lista ordenada.
+
+    Estable: sí (los tramos son contiguos, se ordenan de forma estable y en empate gana el tramo anterior).
     """
+    if backend not in ("heapq", "loser_tree"): # Valida el núcleo de fusión.
+        raise ValueError("Backend de fusión no válido. Use 'heapq' o 'loser_tree'.")
+    if key is not None or reverse: # Con clave u orden inverso se usa la interfaz común (ver KeySupport.py).
+        return sort_with_key(arr, key, reverse, lambda data: balanced_multiway_merging(data, k, backend),
+                             lambda keys, data: _balanced_multiway_merging_keyed(keys, data, k, backend),
+                             in_place=False)
+
     n = len(arr) # Obtiene la longitud de la lista.
     if n <= 1: # Si la lista tiene 0 o 1 elemento, ya está ordenada.
         return arr # Retorna la lista tal cual.
@@ -33,6 +50,9 @@ def balanced_multiway_merging(arr, k): # Define la función principal para la Fu
         runs.append(current_run) # Añade el tramo ordenado a la lista de tramos.
 
     # Paso 2: Realizar la fusión múltiple de los tramos.
+    if backend == "loser_tree": # Fusión con el árbol de perdedores (ver LoserTree.py).
+        return list(loser_tree_merge(*runs))
+
     # Se usa una cola de prioridad (min-heap) para eficientemente encontrar el siguiente elemento más pequeño
     # entre todos los tramos.
 
@@ -59,10 +79,23 @@ def balanced_multiway_merging(arr, k): # Define la función principal para la Fu
 
     return sorted_result # Retorna la lista completamente ordenada.
 
----
-### Ejemplo de Uso
-
-```python
+def _balanced_multiway_merging_keyed(keys, values, k, backend): # Fusión Múltiple Balanceada según 'keys'.
+    """
+    Los tramos son listas de índices ordenadas por su clave (keys.__getitem__ solo lee el
+    arreglo de claves: la función 'key' del usuario no se vuelve a llamar), se fusionan con el
+    backend elegido y al final los índices se traducen a los elementos.
+    """
+    n = len(keys)
+    if n <= 1:
+        return list(values)
+    k = max(k, 2) # Igual que en balanced_multiway_merging: al menos una fusión binaria.
+    chunk_size = (n + k - 1) // k
+    key_of = keys.__getitem__ # Clave de un índice, leída del arreglo de claves.
+    runs = [sorted(range(i, min(i + chunk_size, n)), key=key_of) for i in range(0, n, chunk_size)]
+    merged = get_merge(backend)(*runs, key=key_of)
+    return [values[i] for i in merged]
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
 if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
     lista_desordenada = [9, 1, 7, 3, 5, 2, 8, 4, 6, 0, 10, 11, 12, 13, 14, 15] # Lista de ejemplo.
     k_val = 3 # Número de tramos a mezclar.
@@ -81,6 +114,15 @@ if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute
     lista_ordenada_grande = balanced_multiway_merging(lista_grande, k_val_2)
     print(f"Lista ordenada (Balanced Multiway Merging): {lista_ordenada_grande}")
 
+    print("\n--- Ejemplo con el árbol de perdedores (backend='loser_tree') ---") # Imprime un separador.
+    lista_ordenada_lt = balanced_multiway_merging(lista_grande, k_val_2, backend="loser_tree")
+    print(f"Lista ordenada (Loser Tree): {lista_ordenada_lt}")
+
+    print("\n--- Ejemplo con key= y reverse= ---") # Imprime un separador.
+    eventos = [("login", 3), ("error", 9), ("logout", 3), ("warning", 5), ("debug", 1)] # (evento, prioridad).
+    por_prioridad = balanced_multiway_merging(eventos, 2, backend="loser_tree", key=lambda e: e[1], reverse=True)
+    print(f"Por prioridad, descendente: {por_prioridad}") # 'login' sigue antes que 'logout'.
+
     print("\n--- Ejemplo con lista vacía ---") # Imprime un separador.
     lista_vacia = []
     print(f"Lista vacía: {lista_vacia}")
@@ -0,0 +1,296 @@
+import argparse
+import csv
+import json
+import math
+import multiprocessing
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+try: # NumPy es opcional: sin él se omiten los motores vectorizados.
+    import numpy as np
+except ImportError:
+    np = None
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "sawtooth", "few_unique", "organ_pipe", "nearly_sorted")
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUADRATIC = {"bubble_sort", "selection_sort", "insertion_sort"} # O(n²): son los que suelen agotar el tiempo.
+FEW_UNIQUE_VALUES = 10 # Valores distintos en la distribución "few_unique".
+CSV_FIELDS = ("algorithm", "distribution", "size", "status", "repeats", "median_seconds", "min_seconds",
+              "throughput", "peak_memory_bytes", "error")
+
+
+def algorithms(): # Registro de todos los ordenamientos: nombre -> función que ordena una lista y la retorna.
+    """
+    Importa cada módulo de ordenamiento de la carpeta y retorna un diccionario nombre -> f(lista),
+    donde f retorna la lista ordenada (la misma, si el algoritmo ordena in-place).
+    Se construye dentro de cada proceso hijo, así que no necesita ser serializable.
+    """
+    from ModuleLoader import load_module
+
+    import AdaptiveSort
+    import Inserción
+    import Intercambio
+    import MergeSort
+    import QuickSort
+    import RadixSort
+    import Selección
+
+    natural = load_module("Natural merging.py")
+    straight = load_module("Straight merging.py")
+    tree = load_module("Ordenamiento de árbol.py")
+    balanced = load_module("Balanced multiway merging.py")
+
+    registry = {
+        "bubble_sort": Intercambio.bubble_sort,
+        "selection_sort": Selección.selection_sort,
+        "insertion_sort": Inserción.insertion_sort,
+        "quick_sort": QuickSort.quick_sort,
+        "introsort": lambda arr: QuickSort.quick_sort(arr, mode="introsort"),
+        "merge_sort": MergeSort.merge_sort,
+        "merge_sort_buffered": lambda arr: MergeSort.merge_sort(arr, mode="buffered"),
+        "merge_sort_parallel": lambda arr: MergeSort.merge_sort(arr, mode="parallel"),
+        "straight_merging": straight.straight_merging,
+        "natural_merging": natural.natural_merging,
+        "tree_sort": tree.tree_sort,
+        "tree_sort_balanced": lambda arr: tree.tree_sort(arr, mode="balanced"),
+        "radix_sort": RadixSort.radix_sort,
+        "balanced_multiway_merging": lambda arr: balanced.balanced_multiway_merging(arr, 8),
+        "adaptive_sort": AdaptiveSort.sort,
+        "builtin_sorted": sorted, # Referencia: TimSort en C.
+    }
+    if np is not None:
+        registry["radix_sort_numpy"] = lambda arr: RadixSort.radix_sort(arr, engine="numpy")
+    return registry
+
+
+def generate(distribution, n, seed=0, swaps=10): # Genera 'n' enteros no negativos con la distribución pedida.
+    """
+    Args:
+        distribution: Una de DISTRIBUTIONS.
+        n: Número de elementos.
+        seed: Semilla: la misma semilla produce exactamente los mismos datos.
+        swaps: Intercambios aleatorios aplicados a una lista ordenada en "nearly_sorted".
+
+    Returns:
+        list of int: Los datos de entrada.
+    """
+    rng = random.Random(seed)
+    if distribution == "random":
+        return [rng.randrange(1 << 31) for _ in range(n)]
+    if distribution == "sorted":
+        return list(range(n))
+    if distribution == "reversed":
+        return list(range(n, 0, -1))
+    if distribution == "sawtooth": # Rampas ascendentes de ~sqrt(n) elementos.
+        period = max(1, math.isqrt(n))
+        return [i % period for i in range(n)]
+    if distribution == "few_unique":
+        return [rng.randrange(FEW_UNIQUE_VALUES) for _ in range(n)]
+    if distribution == "organ_pipe": # Sube hasta la mitad y luego baja.
+        return [min(i, n - 1 - i) for i in range(n)]
+    if distribution == "nearly_sorted":
+        data = list(range(n))
+        for _ in range(swaps if n > 1 else 0):
+            i, j = rng.randrange(n), rng.randrange(n)
+            data[i], data[j] = data[j], data[i]
+        return data
+    raise ValueError(f"Distribución no válida. Use una de: {', '.join(DISTRIBUTIONS)}.")
+
+
+def _run_case(conn, algorithm, distribution, n, repeats, seed, swaps, verify): # Cuerpo del proceso hijo.
+    """
+    Genera los datos, avisa al padre (a partir de ahí corre el tiempo límite) y mide:
+    'repeats' ejecuciones cronometradas sobre copias nuevas de los datos y una ejecución extra
+    con tracemalloc para el pico de memoria (tracemalloc ralentiza, por eso no se cronometra).
+    """
+    try:
+        sort = algorithms()[algorithm]
+        data = generate(distribution, n, seed, swaps)
+        conn.send("ready")
+
+        times = []
+        result = None
+        for _ in range(repeats):
+            copy = data[:] # La copia no se cronometra.
+            start = time.perf_counter()
+            result = sort(copy)
+            times.append(time.perf_counter() - start)
+
+        if verify and list(result) != sorted(data):
+            raise AssertionError("el resultado no está ordenado")
+
+        copy = data[:]
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        sort(copy)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        conn.send({"status": "ok", "times": times, "peak_memory_bytes": peak})
+    except BaseException as error: # RecursionError, MemoryError, tipos no soportados, etc.
+        conn.send({"status": "error", "error": f"{type(error).__name__}: {error}"})
+    finally:
+        conn.close()
+
+
+def measure(algorithm, distribution, n, repeats=5, timeout=30.0, seed=0, swaps=10, verify=True):
+    """
+    Mide un caso (algoritmo, distribución, tamaño) en un proceso aparte, para poder cortarlo
+    si supera 'timeout' segundos (sin contar la generación de los datos) y para que su memoria
+    no contamine los demás casos.
+
+    Returns:
+        dict: Una fila de resultados (ver CSV_FIELDS); status es "ok", "timeout" o "error".
+    """
+    row = dict.fromkeys(CSV_FIELDS)
+    row.update(algorithm=algorithm, distribution=distribution, size=n, repeats=repeats)
+
+    parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_run_case,
+                                      args=(child_conn, algorithm, distribution, n, repeats, seed, swaps, verify))
+    process.start()
+    child_conn.close()
+    try:
+        message = parent_conn.recv() # "ready" cuando los datos ya están generados (o un error).
+        if message == "ready":
+            if parent_conn.poll(timeout):
+                message = parent_conn.recv()
+            else:
+                message = {"status": "timeout", "error": f"más de {timeout} s"}
+    except EOFError: # El hijo murió sin responder (por ejemplo, sin memoria).
+        message = {"status": "error", "error": f"el proceso terminó con código {process.exitcode}"}
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        parent_conn.close()
+
+    row["status"] = message["status"]
+    row["error"] = message.get("error")
+    if message["status"] == "ok":
+        median = statistics.median(message["times"])
+        row["median_seconds"] = median
+        row["min_seconds"] = min(message["times"])
+        row["throughput"] = n / median if median > 0 else math.inf
+        row["peak_memory_bytes"] = message["peak_memory_bytes"]
+    return row
+
+
+def run_benchmark(algorithm_names=None, distributions=DISTRIBUTIONS, sizes=DEFAULT_SIZES, repeats=5, timeout=30.0,
+                  seed=0, swaps=10, verify=True, progress=None):
+    """
+    Ejecuta todos los casos. Para cada algoritmo y distribución los tamaños van de menor a
+    mayor; en cuanto uno agota el tiempo o falla, los tamaños mayores se marcan "skipped"
+    (un Bubble Sort que no termina con 10⁵ elementos tampoco terminará con 10⁶).
+
+    Args:
+        algorithm_names: Algoritmos a medir (por defecto, todos los de algorithms()).
+        distributions: Distribuciones de entrada (ver DISTRIBUTIONS).
+        sizes: Tamaños de entrada.
+        repeats: Ejecuciones cronometradas por caso (se reporta la mediana).
+        timeout: Tiempo límite por caso, en segundos.
+        seed: Semilla de los datos.
+        swaps: Intercambios de la distribución "nearly_sorted".
+        verify: Si es True, comprueba que cada resultado está ordenado.
+        progress: Función opcional que recibe cada fila en cuanto se mide.
+
+    Returns:
+        dict: {"metadata": ..., "results": [filas]}.
+    """
+    names = list(algorithm_names or algorithms())
+    results = []
+    for algorithm in names:
+        for distribution in distributions:
+            failed = False
+            for n in sorted(sizes):
+                if failed:
+                    row = dict.fromkeys(CSV_FIELDS)
+                    row.update(algorithm=algorithm, distribution=distribution, size=n, status="skipped",
+                               error="un tamaño menor agotó el tiempo o falló")
+                else:
+                    row = measure(algorithm, distribution, n, repeats, timeout, seed, swaps, verify)
+                    failed = row["status"] != "ok"
+                results.append(row)
+                if progress is not None:
+                    progress(row)
+
+    metadata = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "numpy": np.__version__ if np is not None else None,
+        "cpu_count": multiprocessing.cpu_count(),
+        "repeats": repeats,
+        "timeout": timeout,
+        "seed": seed,
+        "swaps": swaps,
+    }
+    return {"metadata": metadata, "results": results}
+
+
+def write_json(path, report): # Guarda el reporte completo (metadatos y filas) en JSON.
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def write_csv(path, report): # Guarda las filas del reporte en CSV (una fila por caso).
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(report["results"])
+
+
+def _print_row(row): # Muestra una fila en la consola mientras avanza el benchmark.
+    if row["status"] == "ok":
+        detail = (f"mediana {row['median_seconds'] * 1000:10.3f} ms  {row['throughput']:14,.0f} elem/s  "
+                  f"pico {row['peak_memory_bytes'] / 1024:10,.1f} KiB")
+    else:
+        detail = f"{row['status']}: {row['error']}"
+    print(f"{row['algorithm']:>26} {row['distribution']:>14} {row['size']:>10,}  {detail}", flush=True)
+
+
+def main(argv=None): # Línea de comandos del benchmark.
+    parser = argparse.ArgumentParser(description="Benchmark de los algoritmos de ordenamiento.")
+    parser.add_argument("--algorithms", nargs="+", help="algoritmos a medir (por defecto, todos)")
+    parser.add_argument("--distributions", nargs="+", default=list(DISTRIBUTIONS), choices=DISTRIBUTIONS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeats", type=int, default=5, help="ejecuciones cronometradas por caso")
+    parser.add_argument("--timeout", type=float, default=30.0, help="segundos por caso")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--swaps", type=int, default=10, help="intercambios en 'nearly_sorted'")
+    parser.add_argument("--no-verify", action="store_true", help="no comprobar que el resultado está ordenado")
+    parser.add_argument("--json", help="archivo JSON de salida")
+    parser.add_argument("--csv", help="archivo CSV de salida")
+    parser.add_argument("--list", action="store_true", help="lista los algoritmos disponibles y termina")
+    args = parser.parse_args(argv)
+
+    available = algorithms()
+    if args.list:
+        for name in available:
+            print(f"{name}{'  (cuadrático)' if name in QUADRATIC else ''}")
+        return None
+    unknown = set(args.algorithms or ()) - set(available)
+    if unknown:
+        parser.error(f"algoritmos desconocidos: {', '.join(sorted(unknown))}")
+
+    report = run_benchmark(args.algorithms, args.distributions, args.sizes, args.repeats, args.timeout,
+                           args.seed, args.swaps, not args.no_verify, progress=_print_row)
+    if args.json:
+        write_json(args.json, report)
+    if args.csv:
+        write_csv(args.csv, report)
+    return report
+
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
+if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
+    # Ejemplos:
+    #   python Benchmark.py --list
+    #   python Benchmark.py --sizes 10 1000 100000 --repeats 3 --json resultados.json --csv resultados.csv
+    #   python Benchmark.py --algorithms introsort natural_merging --distributions random sorted
+    main()
@@ -0,0 +1,133 @@
+# Entradas con protocolo de buffer para los ordenamientos in-place de esta carpeta.
+#
+# insertion_sort, quick_sort, straight_merging, natural_merging y radix_sort aceptan, además
+# de listas (y de cualquier secuencia mutable, como UserList), cualquier objeto escribible con
+# protocolo de buffer: array.array, memoryview, bytearray, mmap y arreglos de NumPy. Los datos se ordenan en su lugar, sin convertirlos a
+# una lista de objetos int (con 10⁸ enteros, esa lista ocuparía varios GB).
+#
+#   - as_sequence(arr) da una vista indexable de la entrada sin copiarla: las listas,
+#     array.array y arreglos de NumPy se usan tal cual; los buffers (mmap, bytearray...) se
+#     envuelven en un memoryview de una dimensión, y las demás secuencias mutables se usan
+#     tal cual.
+#   - allocate_like(arr, n) reserva los buffers auxiliares con el mismo tipo compacto que la
+#     entrada (mismo typecode de array.array, mismo formato de memoryview, mismo dtype de
+#     NumPy), en lugar de [0] * n.
+#   - copy_range(arr, lo, hi) copia un tramo: en memoryview y NumPy una rebanada es una
+#     vista, no una copia, y los algoritmos que guardan un tramo aparte la necesitan.
+#
+# Las asignaciones por rebanada entre buffers del mismo tipo (incluso solapadas, como el
+# desplazamiento de la inserción binaria) se copian en bloque, en C.
+
+import array
+from collections.abc import MutableSequence
+
+try: # NumPy es opcional: solo se usa si la entrada ya es un arreglo de NumPy.
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def as_sequence(arr): # Vista indexable y escribible de 'arr', sin copiar los datos.
+    """
+    Args:
+        arr: Una lista, un array.array, un arreglo de NumPy de una dimensión, cualquier
+             objeto escribible con protocolo de buffer (memoryview, bytearray, mmap...) o
+             cualquier otra secuencia mutable (UserList...).
+
+    Returns:
+        'arr' mismo si ya es una lista, un array.array, un arreglo de NumPy o una secuencia
+        mutable sin protocolo de buffer; si tiene buffer, un memoryview de una dimensión
+        sobre su memoria (escribir en él modifica 'arr').
+
+    Raises:
+        TypeError: Si 'arr' no es una secuencia mutable ni tiene protocolo de buffer, o es de solo lectura.
+        ValueError: Si el buffer tiene más de una dimensión.
+    """
+    if isinstance(arr, (list, array.array)):
+        return arr
+    if np is not None and isinstance(arr, np.ndarray):
+        if arr.ndim != 1:
+            raise ValueError("Solo se admiten arreglos de una dimensión.")
+        return arr
+    if isinstance(arr, memoryview):
+        view = arr
+    else:
+        try:
+            view = memoryview(arr)
+        except TypeError: # Sin buffer: una secuencia mutable (UserList...) se ordena tal cual.
+            if isinstance(arr, MutableSequence):
+                return arr
+            raise
+    if view.readonly:
+        raise TypeError("El buffer es de solo lectura: no se puede ordenar en su lugar.")
+    if view.ndim != 1:
+        raise ValueError("Solo se admiten buffers de una dimensión.")
+    return view
+
+
+def allocate_like(arr, n): # Buffer auxiliar de 'n' posiciones del mismo tipo compacto que 'arr'.
+    """
+    Args:
+        arr: La secuencia de referencia (el resultado de as_sequence).
+        n: Número de posiciones.
+
+    Returns:
+        Un array.array con el mismo typecode, un arreglo de NumPy con el mismo dtype o un
+        memoryview con el mismo formato (inicializados en cero); para listas y demás
+        secuencias, una lista [0] * n. Una secuencia con su propio método allocate_like
+        (la CountingList de Instrumentation.py) reserva el buffer ella misma.
+    """
+    allocate = getattr(arr, "allocate_like", None)
+    if allocate is not None: # Así las escrituras en el buffer auxiliar también se cuentan.
+        return allocate(n)
+    if isinstance(arr, array.array):
+        return array.array(arr.typecode, bytes(n * arr.itemsize))
+    if np is not None and isinstance(arr, np.ndarray):
+        return np.zeros(n, dtype=arr.dtype)
+    if isinstance(arr, memoryview):
+        return memoryview(bytearray(n * arr.itemsize)).cast(arr.format)
+    return [0] * n
+
+
+def copy_range(arr, lo, hi): # Copia (no vista) de arr[lo:hi], del mismo tipo que 'arr'.
+    if np is not None and isinstance(arr, np.ndarray):
+        return arr[lo:hi].copy()
+    if isinstance(arr, memoryview):
+        copy = allocate_like(arr, hi - lo)
+        copy[:] = arr[lo:hi]
+        return copy
+    return arr[lo:hi] # Listas, array.array y UserList: sus rebanadas ya son copias.
+
+
+def is_typed_buffer(arr): # ¿NumPy puede ver 'arr' sin copiarlo? (array.array, memoryview, NumPy)
+    return isinstance(arr, (array.array, memoryview)) or (np is not None and isinstance(arr, np.ndarray))
+
+
+def reverse_in_place(arr): # Invierte 'arr' en su lugar (memoryview y NumPy no tienen reverse()).
+    if hasattr(arr, "reverse"): # list y array.array.
+        arr.reverse()
+    else: # Asignación en bloque desde una vista invertida (la copia solapada es segura).
+        arr[:] = arr[::-1]
+
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
+if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
+    from Inserción import insertion_sort
+    from ModuleLoader import load_module
+    from QuickSort import quick_sort
+    from RadixSort import radix_sort
+
+    natural_merging = load_module("Natural merging.py").natural_merging
+    straight_merging = load_module("Straight merging.py").straight_merging
+
+    datos = array.array("i", [38, 27, 43, 3, 9, 82, 10, 3]) # Enteros de 4 bytes, sin objetos int por elemento.
+    print(f"array.array('i'): {datos.tolist()}") # Imprime los datos originales.
+    for ordenar in (insertion_sort, quick_sort, straight_merging, natural_merging, radix_sort):
+        copia = array.array("i", datos) # Cada algoritmo ordena su propia copia.
+        ordenar(copia) # Ordena el buffer en su lugar.
+        print(f"  {ordenar.__name__}: {copia.tolist()}")
+
+    vista = memoryview(bytearray([5, 3, 9, 1, 7])) # Un memoryview sobre bytes.
+    quick_sort(vista, mode="introsort") # Ordena los bytes en su lugar.
+    print(f"memoryview de bytearray: {vista.tolist()}") # Imprime los bytes ordenados.
+    print(f"Buffer auxiliar para array('d'): {allocate_like(array.array('d', [1.5]), 3)}") # Mismo typecode.
@@ -1,6 +1,165 @@
 import collections
+import heapq
+import itertools
 
-def create_and_distribute_initial_runs(input_data, buffer_size, num_output_devices, strategy="balanced"):
+
+def generate_runs_block(records, buffer_size):
+    """
+    Genera tramos cortando la entrada en bloques fijos de 'buffer_size' elementos y
+    ordenando cada bloque en memoria. Todos los tramos (salvo el último) miden exactamente
+    un buffer.
+
+    Parameters:
+    records (iterable): Los datos de entrada (cualquier iterable, se consume en flujo).
+    buffer_size (int): Cuántos elementos caben en memoria a la vez.
+
+    Yields:
+    list: Cada tramo ordenado.
+    """
+    records = iter(records)
+    while True:
+        block = list(itertools.islice(records, buffer_size))
+        if not block:
+            return
+        block.sort() # Usamos el sort() de Python como nuestro "ordenador interno"
+        yield block
+
+
+def replacement_selection(records, buffer_size):
+    """
+    Selección por reemplazo: genera tramos con un min-heap de 'buffer_size' elementos.
+    Cada vez que sale el mínimo del heap entra el siguiente dato de la entrada; si es menor
+    que el último valor escrito ya no cabe en el tramo actual y se marca para el siguiente.
+    Con datos aleatorios los tramos miden en promedio el doble del buffer, y con datos
+    casi ordenados pueden abarcar toda la entrada.
+
+    Parameters:
+    records (iterable): Los datos de entrada (cualquier iterable, se consume en flujo).
+    buffer_size (int): Cuántos elementos caben en el heap a la vez.
+
+    Yields:
+    tuple: (número de tramo, valor), en el orden en el que se escriben. Los números de
+           tramo empiezan en 0 y crecen de uno en uno.
+    """
+    records = iter(records)
+
+    # El heap guarda tuplas (número de tramo, valor): los elementos marcados para el
+    # siguiente tramo quedan "congelados" detrás de todos los del tramo actual.
+    heap = [(0, value) for value in itertools.islice(records, buffer_size)]
+    heapq.heapify(heap)
+    exhausted = object() # Centinela para detectar el fin de la entrada.
+
+    while heap:
+        entry = heap[0]
+        yield entry # Se escribe el mínimo del tramo actual.
+        run_number, value = entry
+
+        next_value = next(records, exhausted)
+        if next_value is exhausted:
+            heapq.heappop(heap) # Sin más entrada, el heap se vacía poco a poco.
+        elif next_value < value:
+            heapq.heapreplace(heap, (run_number + 1, next_value)) # No cabe en el tramo actual.
+        else:
+            heapq.heapreplace(heap, (run_number, next_value)) # Extiende el tramo actual.
+
+
+def generate_runs_replacement_selection(records, buffer_size):
+    """
+    Agrupa la salida de replacement_selection() en tramos (listas ordenadas).
+
+    Parameters:
+    records (iterable): Los datos de entrada.
+    buffer_size (int): Cuántos elementos caben en el heap a la vez.
+
+    Yields:
+    list: Cada tramo ordenado.
+    """
+    for _, run in itertools.groupby(replacement_selection(records, buffer_size), key=lambda entry: entry[0]):
+        yield [value for _, value in run]
+
+
+RUN_STRATEGIES = {
+    "block": generate_runs_block,
+    "replacement_selection": generate_runs_replacement_selection,
+}
+
+
+def run_length_statistics(run_lengths, buffer_size):
+    """
+    Resume las longitudes de los tramos generados para comparar estrategias.
+
+    Parameters:
+    run_lengths (list of int): Longitud de cada tramo.
+    buffer_size (int): Tamaño del buffer con el que se generaron los tramos.
+
+    Returns:
+    dict: Número de tramos, longitudes mínima, máxima y media, y la media expresada en
+          múltiplos del buffer ('mean_over_buffer', ~1 para "block", ~2 para selección
+          por reemplazo con datos aleatorios).
+    """
+    count = len(run_lengths)
+    total = sum(run_lengths)
+    mean = total / count if count else 0.0
+    return {
+        "runs": count,
+        "records": total,
+        "min_length": min(run_lengths) if count else 0,
+        "max_length": max(run_lengths) if count else 0,
+        "mean_length": mean,
+        "mean_over_buffer": mean / buffer_size if buffer_size else 0.0,
+    }
+
+
+class FibonacciDistribution:
+    """
+    Distribución de tramos para Polyphase según la secuencia de Fibonacci generalizada
+    (algoritmo D de Knuth, "distribución horizontal").
+
+    Con T dispositivos, T-1 son de entrada y uno queda vacío para la salida. Los tramos se
+    reparten para alcanzar una distribución "perfecta" (por ejemplo 13:8:0 con T=3, o
+    7:6:4:0 con T=4); si los tramos reales no alcanzan, el resto se completa con tramos
+    ficticios ('dummies'), repartidos entre los dispositivos para que todos se vacíen
+    de forma sincrónica durante las fases de fusión.
+    """
+
+    def __init__(self, num_tapes):
+        if num_tapes < 3:
+            raise ValueError("Polyphase necesita al menos 3 dispositivos (2 de entrada y 1 de salida).")
+        p = num_tapes - 1 # Número de dispositivos de entrada.
+        self.num_tapes = num_tapes
+        self.level = 1
+        # Posición p: centinela siempre en 0 (el dispositivo de salida).
+        self.perfect = [1] * p + [0] # A[j]: tramos de la distribución perfecta del nivel actual.
+        self.dummies = [1] * p + [0] # D[j]: tramos que faltan para llegar a la distribución perfecta.
+        self._tape = 0
+        self._started = False
+
+    def next_tape(self):
+        """
+        Retorna el índice del dispositivo que recibe el siguiente tramo real.
+        Al terminar la entrada, 'dummies' indica cuántos tramos ficticios tiene cada dispositivo.
+        """
+        if self._started:
+            j = self._tape
+            if self.dummies[j] < self.dummies[j + 1]:
+                self._tape = j + 1 # El siguiente dispositivo está más lejos de su objetivo.
+            elif self.dummies[j] == 0:
+                # Nivel completo: se pasa al siguiente nivel de la secuencia de Fibonacci.
+                self.level += 1
+                a = self.perfect[0]
+                for i in range(self.num_tapes - 1):
+                    self.dummies[i] = a + self.perfect[i + 1] - self.perfect[i]
+                    self.perfect[i] = a + self.perfect[i + 1]
+                self._tape = 0
+            else:
+                self._tape = 0
+        self._started = True
+        self.dummies[self._tape] -= 1
+        return self._tape
+
+
+def create_and_distribute_initial_runs(input_data, buffer_size, num_output_devices, strategy="balanced",
+                                       run_strategy="block", return_stats=False):
     """
     Simula la creación y distribución de tramos iniciales para algoritmos de ordenamiento externo.
 
@@ -10,16 +169,28 @@ def create_and_distribute_initial_runs(input_data, buffer_size, num_output_devic
                        (Cuántos elementos pueden caber en memoria a la vez).
     num_output_devices (int): El número de dispositivos de salida (ej. cintas, archivos)
                               donde se distribuirán los tramos.
-    strategy (str): La estrategia de distribución. "balanced" (equilibrada) o "polyphase_simple" (para Polyphase).
+    strategy (str): La estrategia de distribución. "balanced" (equilibrada), "polyphase_simple"
+                    (round-robin sobre k-1 dispositivos) o "polyphase" (Fibonacci generalizada,
+                    con tramos ficticios representados como tramos vacíos al inicio de cada dispositivo).
+    run_strategy (str): Cómo se generan los tramos. "block" (bloques fijos de buffer_size)
+                        o "replacement_selection" (selección por reemplazo con un heap).
+    return_stats (bool): Si es True, también retorna las estadísticas de longitud de tramos.
 
     Returns:
     list of list: Una lista donde cada elemento es una lista de tramos
                   (una lista de listas), representando los tramos en cada dispositivo de salida.
                   Ejemplo: [[tramo1_d1, tramo2_d1], [tramo1_d2], ...]
+                  Con return_stats=True retorna la tupla (dispositivos, estadísticas).
     """
+    if run_strategy not in RUN_STRATEGIES:
+        raise ValueError("Estrategia de generación de tramos no válida. Use 'block' o 'replacement_selection'.")
+
     n = len(input_data)
     if n == 0:
-        return [[] for _ in range(num_output_devices)]
+        output_devices = [[] for _ in range(num_output_devices)]
+        if return_stats:
+            return output_devices, run_length_statistics([], buffer_size)
+        return output_devices
 
     if buffer_size <= 0:
         raise ValueError("El tamaño del buffer debe ser mayor que 0.")
@@ -28,24 +199,20 @@ def create_and_distribute_initial_runs(input_data, buffer_size, num_output_devic
 
     # 1. Crear los "dispositivos de salida" como listas de tramos.
     output_devices = [[] for _ in range(num_output_devices)]
+    fibonacci = FibonacciDistribution(num_output_devices) if strategy == "polyphase" else None
 
-    # 2. Iterar sobre los datos de entrada para crear tramos.
-    #    'input_data_idx' rastrea la posición actual en los datos de entrada.
-    input_data_idx = 0
+    # 2. Iterar sobre los tramos que genera la estrategia elegida.
+    #    "block" corta bloques fijos de buffer_size; "replacement_selection" produce tramos más largos.
     current_output_device_idx = 0 # Para distribución cíclica (balanceada)
 
-    print(f"\n--- Creación y Distribución de Tramos Iniciales (Estrategia: {strategy}) ---")
+    print(f"\n--- Creación y Distribución de Tramos Iniciales (Estrategia: {strategy}, Tramos: {run_strategy}) ---")
     print(f"Tamaño de datos: {n}, Tamaño de buffer: {buffer_size}, Dispositivos de salida: {num_output_devices}")
 
     run_counter = 0 # Contador para el número de tramos creados.
+    run_lengths = [] # Longitud de cada tramo, para las estadísticas.
 
-    while input_data_idx < n:
-        # Extraer un bloque de datos que quepa en el buffer de memoria.
-        end_idx = min(input_data_idx + buffer_size, n)
-        current_block = input_data[input_data_idx:end_idx]
-
-        # Ordenar el bloque en memoria para crear un tramo.
-        sorted_run = sorted(current_block) # Usamos el sorted() de Python como nuestro "ordenador interno"
+    for sorted_run in RUN_STRATEGIES[run_strategy](input_data, buffer_size):
+        run_lengths.append(len(sorted_run))
 
         print(f"  Tramo {run_counter}: {sorted_run}")
 
@@ -91,22 +258,34 @@ def create_and_distribute_initial_runs(input_data, buffer_size, num_output_devic
                 print(f"    -> Distribuido a Dispositivo {target_device_idx} (simulación Polyphase)")
                 current_output_device_idx += 1 # Mueve al siguiente dispositivo para la próxima distribución
             
+        elif strategy == "polyphase":
+            # Distribución Fibonacci real: el dispositivo lo decide el algoritmo D de Knuth.
+            target_device_idx = fibonacci.next_tape()
+            output_devices[target_device_idx].append(sorted_run)
+            print(f"    -> Distribuido a Dispositivo {target_device_idx} (Fibonacci, nivel {fibonacci.level})")
+
         else:
-            raise ValueError("Estrategia de distribución no válida. Use 'balanced' o 'polyphase_simple'.")
+            raise ValueError("Estrategia de distribución no válida. Use 'balanced', 'polyphase_simple' o 'polyphase'.")
 
-        input_data_idx = end_idx
         run_counter += 1
 
+    if fibonacci is not None:
+        # Los tramos ficticios (vacíos) van al inicio de cada dispositivo: son los primeros en "fusionarse".
+        for i, dummies in enumerate(fibonacci.dummies):
+            output_devices[i][:0] = [[] for _ in range(dummies)]
+
     print("\n--- Tramos distribuidos en Dispositivos de Salida ---")
     for i, device_runs in enumerate(output_devices):
         print(f"Dispositivo {i} ({len(device_runs)} tramos): {device_runs}")
 
-    return output_devices
+    stats = run_length_statistics(run_lengths, buffer_size)
+    print(f"Estadísticas de tramos: {stats}")
 
----
-### **Ejemplo de Uso de la Simulación**
+    if return_stats:
+        return output_devices, stats
+    return output_devices
 
-```python
+# --- Ejemplo de Uso de la Simulación ---
 if __name__ == "__main__":
     # Datos de entrada que simulan estar en un disco o un archivo grande.
     big_data = [
@@ -138,4 +317,19 @@ if __name__ == "__main__":
     distributed_runs_large_buffer = create_and_distribute_initial_runs(big_data, 10, 2, strategy="balanced")
     print("\nEstado final de la distribución con buffer grande:")
     for i, device_runs in enumerate(distributed_runs_large_buffer):
-        print(f"  Dispositivo {i}: {device_runs}")
\ No newline at end of file
+        print(f"  Dispositivo {i}: {device_runs}")
+    # --- Escenario 4: Selección por reemplazo frente a bloques fijos ---
+    print("\n----- Escenario 4: Selección por reemplazo (tramos más largos) -----")
+    _, stats_block = create_and_distribute_initial_runs(big_data, 4, 3, run_strategy="block", return_stats=True)
+    _, stats_rs = create_and_distribute_initial_runs(big_data, 4, 3, run_strategy="replacement_selection", return_stats=True)
+    print(f"\nBloques fijos: {stats_block['runs']} tramos, longitud media {stats_block['mean_length']:.2f}")
+    print(f"Selección por reemplazo: {stats_rs['runs']} tramos, longitud media {stats_rs['mean_length']:.2f}")
+
+    # --- Escenario 5: Distribución Fibonacci real para Polyphase ---
+    print("\n----- Escenario 5: Distribución Fibonacci (Polyphase real) -----")
+    # 5 tramos con 3 dispositivos: la distribución perfecta más cercana es 5 = 3 + 2 (sin ficticios);
+    # con 4 tramos se necesita un tramo ficticio (vacío).
+    distributed_runs_fibonacci = create_and_distribute_initial_runs(big_data[:16], 4, 3, strategy="polyphase")
+    print("\nEstado final de la distribución Fibonacci:")
+    for i, device_runs in enumerate(distributed_runs_fibonacci):
+        print(f"  Dispositivo {i}: {device_runs}")
@@ -0,0 +1,488 @@
+import itertools
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+
+from LoserTree import get_merge
+from ModuleLoader import load_module
+from SpillCodecs import get_codec, read_run, write_run
+
+distribution = load_module("Distribution of initial runs.py")
+
+_DONE = object() # Marca de fin de flujo entre las etapas del pipeline.
+_POLL_SECONDS = 0.1 # Cada cuánto revisa una etapa bloqueada si otra etapa falló.
+
+
+def read_records(path, parse=int, io_buffer_size=1 << 16):
+    """
+    Lee de forma perezosa los registros de un archivo de texto (un registro por línea).
+
+    Parameters:
+    path (str): Ruta del archivo a leer.
+    parse (callable): Convierte cada línea (bytes) en un registro. Por defecto int.
+    io_buffer_size (int): Tamaño del buffer de lectura del archivo, en bytes.
+
+    Yields:
+    El siguiente registro del archivo, en el orden en el que aparece.
+    """
+    with open(path, "rb", buffering=io_buffer_size) as f:
+        for line in f:
+            yield parse(line)
+
+
+def write_records(path, records, serialize=str, io_buffer_size=1 << 16):
+    """
+    Escribe los registros en un archivo de texto, uno por línea.
+
+    Parameters:
+    path (str): Ruta del archivo de salida (se sobrescribe).
+    records (iterable): Registros a escribir, en el orden deseado.
+    serialize (callable): Convierte cada registro en texto. Por defecto str.
+    io_buffer_size (int): Tamaño del buffer de escritura del archivo, en bytes.
+
+    Returns:
+    int: El número de bytes escritos.
+    """
+    with open(path, "wb", buffering=io_buffer_size) as f:
+        f.writelines((serialize(record) + "\n").encode() for record in records)
+        return f.tell()
+
+
+def _count_into(values, lengths):
+    """Deja pasar 'values' y, al agotarse, añade a 'lengths' cuántos valores pasaron."""
+    count = 0
+    for count, value in enumerate(values, 1):
+        yield value
+    lengths.append(count)
+
+
+def generate_runs(records, buffer_size, run_strategy="block"):
+    """
+    Genera los tramos ordenados de un flujo de registros con la estrategia elegida.
+
+    Parameters:
+    records (iterable): Registros de entrada (se consumen en flujo).
+    buffer_size (int): Cuántos registros caben en memoria a la vez.
+    run_strategy (str): "block" o "replacement_selection".
+
+    Yields:
+    iterable: Cada tramo, para consumirse una sola vez y antes de pedir el siguiente.
+    """
+    if run_strategy == "block":
+        # Cada bloque ordenado en memoria es un tramo.
+        yield from distribution.generate_runs_block(records, buffer_size)
+    else:
+        # Un tramo de selección por reemplazo puede ser mucho más grande que la memoria:
+        # se entrega en flujo, y termina cuando cambia el número de tramo.
+        entries = distribution.replacement_selection(records, buffer_size)
+        for _, run in itertools.groupby(entries, key=lambda entry: entry[0]):
+            yield (value for _, value in run)
+
+
+def _run_io(codec, parse, serialize):
+    """
+    Funciones (leer tramo, escribir tramo, extensión) para los archivos de tramos: texto
+    plano con codec=None, o bloques codificados con SpillCodecs.py en otro caso. La entrada
+    y la salida final siempre son texto, un registro por línea.
+    """
+    if codec is None:
+        return (lambda path: read_records(path, parse),
+                lambda path, records: write_records(path, records, serialize),
+                ".txt")
+    get_codec(codec) # Valida el nombre antes de empezar a escribir tramos.
+    return (lambda path: read_run(path, codec, parse),
+            lambda path, records: write_run(path, records, codec, serialize),
+            f".{codec}")
+
+
+def _put(channel, item, stop):
+    """Encola 'item' esperando lugar; retorna False (sin encolar) si otra etapa pidió detenerse."""
+    while not stop.is_set():
+        try:
+            channel.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _get(channel, stop):
+    """Desencola el siguiente elemento; retorna _DONE si otra etapa pidió detenerse."""
+    while not stop.is_set():
+        try:
+            return channel.get(timeout=_POLL_SECONDS)
+        except queue.Empty:
+            pass
+    return _DONE
+
+
+def _pipelined_block_runs(input_path, buffer_size, work_dir, parse, serialize, queue_depth, codec=None):
+    """
+    Generación de tramos por bloques en tres etapas solapadas (doble buffer):
+
+      lector (hilo)  --cola-->  ordenar (hilo principal)  --cola-->  escritor (hilo)
+
+    Mientras el hilo principal ordena el bloque A, el lector ya llena el bloque B y el
+    escritor vuelca el tramo anterior. Cada cola guarda hasta 'queue_depth' bloques, de
+    modo que en memoria hay a lo sumo 2 * queue_depth + 3 buffers.
+
+    Límite del GIL: los tres hilos comparten un solo intérprete. Solo se solapan con el
+    ordenamiento las llamadas al sistema de lectura y escritura (que liberan el GIL); 'parse',
+    'serialize' y sort() son código de Python y se turnan entre sí. Con registros baratos de
+    leer en un disco rápido el pipeline apenas gana tiempo (en las pruebas no fue más rápido
+    que la versión secuencial); ayuda cuando la E/S es lenta (discos de red) frente al
+    trabajo de Python por registro.
+
+    Por etapa se mide el tiempo de CPU de su hilo ('busy_seconds', con time.thread_time, que
+    no cuenta la espera por el GIL ni por el disco) y el tiempo bloqueado esperando a otra
+    etapa en las colas ('stall_seconds', tiempo real). 'bottleneck' en las estadísticas es
+    la etapa con más tiempo de CPU.
+
+    Returns:
+    tuple: (rutas de los tramos, longitudes de los tramos, bytes escritos, métricas por etapa).
+    """
+    _, write_run_file, suffix = _run_io(codec, parse, serialize)
+    filled = queue.Queue(maxsize=queue_depth) # Bloques leídos, pendientes de ordenar.
+    sorted_runs = queue.Queue(maxsize=queue_depth) # Tramos ordenados, pendientes de escribir.
+    stop = threading.Event() # Se activa si alguna etapa falla, para que las demás terminen.
+    errors = []
+    stages = {stage: {"busy_seconds": 0.0, "stall_seconds": 0.0} for stage in ("read", "sort", "write")}
+    bytes_written = [0]
+
+    def reader():
+        records = read_records(input_path, parse)
+        try:
+            while True:
+                start = time.thread_time()
+                block = list(itertools.islice(records, buffer_size))
+                stages["read"]["busy_seconds"] += time.thread_time() - start
+                if not block:
+                    break
+                start = time.perf_counter()
+                queued = _put(filled, block, stop) # Espera si el ordenamiento va atrasado.
+                stages["read"]["stall_seconds"] += time.perf_counter() - start
+                if not queued:
+                    break
+        except BaseException as error:
+            errors.append(error)
+            stop.set()
+        finally:
+            records.close()
+            _put(filled, _DONE, stop)
+
+    def writer():
+        try:
+            while True:
+                start = time.perf_counter()
+                item = _get(sorted_runs, stop) # Espera si el ordenamiento va atrasado.
+                stages["write"]["stall_seconds"] += time.perf_counter() - start
+                if item is _DONE:
+                    break
+                run_path, run = item
+                start = time.thread_time()
+                bytes_written[0] += write_run_file(run_path, run)
+                stages["write"]["busy_seconds"] += time.thread_time() - start
+        except BaseException as error:
+            errors.append(error)
+            stop.set()
+
+    threads = [threading.Thread(target=reader, daemon=True), threading.Thread(target=writer, daemon=True)]
+    for thread in threads:
+        thread.start()
+
+    run_paths = []
+    run_lengths = []
+    try:
+        while True:
+            start = time.perf_counter()
+            block = _get(filled, stop) # Espera si la lectura va atrasada.
+            stages["sort"]["stall_seconds"] += time.perf_counter() - start
+            if block is _DONE:
+                break
+            start = time.thread_time()
+            block.sort() # El mismo "ordenador interno" que generate_runs_block.
+            stages["sort"]["busy_seconds"] += time.thread_time() - start
+            run_path = os.path.join(work_dir, f"run_0_{len(run_paths)}{suffix}")
+            start = time.perf_counter()
+            queued = _put(sorted_runs, (run_path, block), stop) # Espera si la escritura va atrasada.
+            stages["sort"]["stall_seconds"] += time.perf_counter() - start
+            if not queued:
+                break
+            run_paths.append(run_path)
+            run_lengths.append(len(block))
+        _put(sorted_runs, _DONE, stop)
+    except BaseException:
+        stop.set() # El lector y el escritor dejan de esperar y terminan.
+        raise
+    finally:
+        for thread in threads:
+            thread.join()
+
+    if errors: # Un fallo en el lector o el escritor se propaga en el hilo principal.
+        raise errors[0]
+    return run_paths, run_lengths, bytes_written[0], stages
+
+
+def create_initial_runs_on_disk(input_path, buffer_size, work_dir, parse=int, serialize=str, run_strategy="block",
+                                pipelined=False, queue_depth=2, codec=None):
+    """
+    Versión en disco de la creación de tramos iniciales (ver 'Distribution of initial runs.py').
+    Lee el archivo de entrada en flujo, genera tramos ordenados con la estrategia elegida y
+    vuelca cada tramo a un archivo temporal propio. Nunca hay más de un buffer en memoria.
+
+    Parameters:
+    input_path (str): Archivo con los datos a ordenar (un registro por línea).
+    buffer_size (int): Cuántos registros caben en memoria a la vez.
+    work_dir (str): Directorio donde se crean los archivos de los tramos.
+    parse (callable): Convierte cada línea (bytes) en un registro.
+    serialize (callable): Convierte cada registro en texto.
+    run_strategy (str): "block" (tramos de exactamente buffer_size registros) o
+                        "replacement_selection" (tramos de ~2 buffers con datos aleatorios).
+    pipelined (bool): Si es True (solo con "block"), lectura, ordenamiento y escritura se
+                      solapan en hilos distintos (ver _pipelined_block_runs; el GIL limita
+                      el solapamiento a la E/S del sistema operativo).
+    queue_depth (int): Bloques que caben en cada cola del pipeline.
+    codec (str): Códec de los archivos de tramos ("raw", "zlib", "lzma" o "delta"; ver
+                 SpillCodecs.py). Por defecto None: texto plano, un registro por línea.
+
+    Returns:
+    tuple: (lista de rutas de los tramos, estadísticas de la pasada como diccionario).
+           Con pipelined=True, las estadísticas incluyen 'stages': tiempo de CPU y de
+           espera de cada etapa (read, sort, write).
+    """
+    if buffer_size <= 0:
+        raise ValueError("El tamaño del buffer debe ser mayor que 0.")
+    if run_strategy not in distribution.RUN_STRATEGIES:
+        raise ValueError("Estrategia de generación de tramos no válida. Use 'block' o 'replacement_selection'.")
+    if pipelined and run_strategy != "block":
+        raise ValueError("El pipeline solo admite run_strategy='block' (la selección por reemplazo ya es un flujo).")
+    if pipelined and queue_depth < 1:
+        raise ValueError("La profundidad de las colas (queue_depth) debe ser al menos 1.")
+
+    _, write_run_file, suffix = _run_io(codec, parse, serialize)
+    start = time.perf_counter()
+    run_paths = []
+    run_lengths = []
+    bytes_written = 0
+    stages = None
+
+    if pipelined:
+        run_paths, run_lengths, bytes_written, stages = _pipelined_block_runs(input_path, buffer_size, work_dir,
+                                                                              parse, serialize, queue_depth, codec)
+    else:
+        for run in generate_runs(read_records(input_path, parse), buffer_size, run_strategy):
+            run_path = os.path.join(work_dir, f"run_0_{len(run_paths)}{suffix}")
+            bytes_written += write_run_file(run_path, _count_into(run, run_lengths))
+            run_paths.append(run_path)
+
+    stats = {
+        "pass": 0,
+        "kind": "run_generation",
+        "run_strategy": run_strategy,
+        "codec": codec,
+        "runs_in": 0,
+        "runs_out": len(run_paths),
+        "bytes_read": os.path.getsize(input_path),
+        "bytes_written": bytes_written,
+        "seconds": time.perf_counter() - start,
+        "run_lengths": distribution.run_length_statistics(run_lengths, buffer_size),
+    }
+    if stages is not None:
+        stats["queue_depth"] = queue_depth
+        stats["stages"] = stages
+        # La etapa con más tiempo de CPU es la que limita el ritmo del pipeline.
+        stats["bottleneck"] = max(stages, key=lambda stage: stages[stage]["busy_seconds"])
+    return run_paths, stats
+
+
+def balanced_multiway_merging_on_disk(run_paths, output_path, fan_in, work_dir, parse=int, serialize=str,
+                                      backend="heapq", codec=None):
+    """
+    Versión en disco de la Fusión Múltiple Balanceada (ver 'Balanced multiway merging.py').
+    En cada pasada se fusionan grupos de hasta 'fan_in' tramos en un nuevo tramo; la última
+    pasada escribe directamente en 'output_path'. Solo se mantiene en memoria un registro
+    (y el buffer de lectura) por cada tramo abierto.
+
+    Parameters:
+    run_paths (list of str): Rutas de los tramos ordenados a fusionar. Se borran al consumirse.
+    output_path (str): Archivo donde se escribe el resultado final.
+    fan_in (int): Número máximo de tramos que se fusionan simultáneamente (k).
+    work_dir (str): Directorio donde se crean los tramos intermedios.
+    parse (callable): Convierte cada línea (bytes) en un registro.
+    serialize (callable): Convierte cada registro en texto.
+    backend (str): Núcleo de la fusión k-vías: "heapq" o "loser_tree" (árbol de perdedores,
+                   ~log2 k comparaciones por registro; ver LoserTree.py).
+    codec (str): Códec con el que se escribieron los tramos (None: texto plano). Los tramos
+                 intermedios se escriben con el mismo códec; el resultado final, en texto.
+
+    Returns:
+    list of dict: Estadísticas de cada pasada de fusión (bytes leídos y escritos, tramos, tiempo).
+    """
+    if fan_in < 2:
+        raise ValueError("El número de vías de fusión (fan_in) debe ser al menos 2.")
+    merge = get_merge(backend)
+    read_run_file, write_run_file, suffix = _run_io(codec, parse, serialize)
+
+    passes = []
+    runs = list(run_paths)
+
+    if not runs:
+        # Entrada vacía: el resultado es un archivo vacío.
+        write_records(output_path, [], serialize)
+        return passes
+
+    if len(runs) == 1 and codec is None:
+        # Un solo tramo ya es el resultado; basta con moverlo, sin leer ni escribir datos.
+        shutil.move(runs[0], output_path)
+        return passes
+
+    pass_number = 1
+    while runs != [output_path]: # Con códec, incluso un único tramo se decodifica a texto en una pasada.
+        start = time.perf_counter()
+        last_pass = len(runs) <= fan_in
+        bytes_read = 0
+        bytes_written = 0
+        next_runs = []
+
+        for group_start in range(0, len(runs), fan_in):
+            group = runs[group_start:group_start + fan_in]
+            if len(group) == 1 and not last_pass:
+                # Un tramo sobrante pasa tal cual a la siguiente pasada, sin copiarlo.
+                next_runs.append(group[0])
+                continue
+            bytes_read += sum(os.path.getsize(path) for path in group)
+
+            if last_pass:
+                target = output_path
+            else:
+                target = os.path.join(work_dir, f"run_{pass_number}_{len(next_runs)}{suffix}")
+
+            # Fusión k-vías en flujo: solo se mantiene un registro por tramo.
+            merged = merge(*(read_run_file(path) for path in group))
+            if last_pass: # La salida final es texto, sea cual sea el códec de los tramos.
+                bytes_written += write_records(target, merged, serialize)
+            else:
+                bytes_written += write_run_file(target, merged)
+            next_runs.append(target)
+
+            # Los tramos de entrada ya no se necesitan.
+            for path in group:
+                os.remove(path)
+
+        passes.append({
+            "pass": pass_number,
+            "kind": "merge",
+            "fan_in": fan_in,
+            "codec": codec,
+            "runs_in": len(runs),
+            "runs_out": len(next_runs),
+            "bytes_read": bytes_read,
+            "bytes_written": bytes_written,
+            "seconds": time.perf_counter() - start,
+        })
+        runs = next_runs
+        pass_number += 1
+
+    return passes
+
+
+def external_merge_sort(input_path, output_path, buffer_size, fan_in=8, temp_dir=None, parse=int, serialize=str,
+                        run_strategy="block", backend="heapq", pipelined=False, queue_depth=2, codec=None):
+    """
+    Ordenamiento externo real: ordena un archivo mucho más grande que la memoria disponible.
+    Genera tramos de 'buffer_size' registros en archivos temporales y los fusiona por pasadas
+    de 'fan_in' vías hasta obtener un único archivo ordenado.
+
+    Parameters:
+    input_path (str): Archivo con los datos a ordenar (un registro por línea).
+    output_path (str): Archivo donde se escribe el resultado ordenado.
+    buffer_size (int): Cuántos registros caben en memoria a la vez.
+    fan_in (int): Número de tramos que se fusionan a la vez en cada pasada.
+    temp_dir (str): Directorio para los archivos temporales (por defecto el del sistema).
+    parse (callable): Convierte cada línea (bytes) en un registro. Por defecto int.
+    serialize (callable): Convierte cada registro en texto. Por defecto str.
+    run_strategy (str): Generación de tramos: "block" o "replacement_selection".
+    backend (str): Núcleo de fusión: "heapq" o "loser_tree".
+    pipelined (bool): Solapa lectura, ordenamiento y escritura al generar los tramos (solo
+                      la E/S del sistema operativo se solapa: ver _pipelined_block_runs).
+    queue_depth (int): Bloques que caben en cada cola del pipeline.
+    codec (str): Códec de los tramos temporales: "raw", "zlib", "lzma" o "delta" (enteros
+                 ordenados en diferencias varint; ver SpillCodecs.py). Menos bytes por pasada
+                 en discos lentos o de red. Por defecto None: texto plano.
+
+    Returns:
+    dict: Estadísticas del ordenamiento. 'passes' contiene, por cada pasada, los bytes
+          leídos y escritos, lo que permite ajustar 'fan_in' al rendimiento del disco.
+    """
+    work_dir = tempfile.mkdtemp(prefix="external_sort_", dir=temp_dir)
+    try:
+        run_paths, run_stats = create_initial_runs_on_disk(input_path, buffer_size, work_dir, parse, serialize,
+                                                          run_strategy, pipelined, queue_depth, codec)
+        merge_stats = balanced_multiway_merging_on_disk(run_paths, output_path, fan_in, work_dir, parse, serialize,
+                                                        backend, codec)
+    finally:
+        # Los tramos temporales se eliminan incluso si algo falla a mitad del proceso.
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    passes = [run_stats] + merge_stats
+    return {
+        "initial_runs": run_stats["runs_out"],
+        "run_lengths": run_stats["run_lengths"],
+        "merge_passes": len(merge_stats),
+        "passes": passes,
+        "bytes_read": sum(p["bytes_read"] for p in passes),
+        "bytes_written": sum(p["bytes_written"] for p in passes),
+    }
+
+
+# --- Ejemplo de uso ---
+if __name__ == "__main__":
+    import random
+
+    demo_dir = tempfile.mkdtemp(prefix="external_sort_demo_")
+    try:
+        entrada = os.path.join(demo_dir, "entrada.txt")
+        salida = os.path.join(demo_dir, "salida.txt")
+
+        # Archivo de entrada con 100000 números aleatorios (simula un archivo grande en disco).
+        write_records(entrada, (random.randint(0, 10**9) for _ in range(100000)))
+
+        # Solo 5000 registros caben en memoria: se generan 20 tramos que se fusionan de 4 en 4.
+        estadisticas = external_merge_sort(entrada, salida, buffer_size=5000, fan_in=4)
+
+        print(f"Tramos iniciales: {estadisticas['initial_runs']}")
+        print(f"Pasadas de fusión: {estadisticas['merge_passes']}")
+        for pasada in estadisticas["passes"]:
+            print(f"  Pasada {pasada['pass']} ({pasada['kind']}): {pasada['runs_in']} -> {pasada['runs_out']} tramos, "
+                  f"{pasada['bytes_read']} bytes leídos, {pasada['bytes_written']} bytes escritos")
+
+        # Con selección por reemplazo los tramos miden ~2 buffers: la mitad de tramos, menos pasadas.
+        estadisticas_rs = external_merge_sort(entrada, salida, buffer_size=5000, fan_in=4,
+                                              run_strategy="replacement_selection")
+        print(f"\nSelección por reemplazo: {estadisticas_rs['initial_runs']} tramos iniciales "
+              f"(longitud media {estadisticas_rs['run_lengths']['mean_length']:.0f}), "
+              f"{estadisticas_rs['merge_passes']} pasadas de fusión")
+
+        # Pipeline: el siguiente bloque se lee y el tramo anterior se escribe mientras se ordena.
+        estadisticas_p = external_merge_sort(entrada, salida, buffer_size=5000, fan_in=4, pipelined=True)
+        generacion = estadisticas_p["passes"][0]
+        print(f"\nGeneración de tramos en pipeline (cuello de botella: {generacion['bottleneck']}):")
+        for etapa, tiempos in generacion["stages"].items():
+            print(f"  {etapa:>5}: {tiempos['busy_seconds']:.3f} s de CPU, {tiempos['stall_seconds']:.3f} s esperando")
+
+        # Tramos temporales comprimidos: menos bytes por pasada en discos lentos o de red.
+        print()
+        for codec in (None, "zlib", "delta"):
+            estadisticas_c = external_merge_sort(entrada, salida, buffer_size=5000, fan_in=4, codec=codec)
+            tramos = estadisticas_c["passes"][0]["bytes_written"]
+            print(f"Tramos iniciales con códec {codec}: {tramos} bytes "
+                  f"({tramos / estadisticas['passes'][0]['bytes_written']:.0%} del texto plano)")
+
+        resultado = list(read_records(salida))
+        print(f"¿Salida ordenada? {all(resultado[i] <= resultado[i + 1] for i in range(len(resultado) - 1))}")
+        print(f"Primeros 10 elementos: {resultado[:10]}")
+    finally:
+        shutil.rmtree(demo_dir, ignore_errors=True)
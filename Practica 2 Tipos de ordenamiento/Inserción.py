@@ -1,13 +1,30 @@
-def insertion_sort(arr): # Define una función llamada insertion_sort que toma una lista 'arr' como argumento.
+from bisect import bisect_right # Búsqueda binaria en C para la inserción binaria.
+
+from BufferSupport import as_sequence # Entradas con protocolo de buffer.
+from KeySupport import sort_with_key # Interfaz común key=/reverse=.
+
+def insertion_sort(arr, key=None, reverse=False, values=None): # Define una función llamada insertion_sort que toma una lista 'arr' como argumento.
     """
     Ordena una lista de elementos utilizando el algoritmo de Insertion Sort. # Docstring: Describe la función.
 
     Args: # Docstring: Describe los argumentos.
-        arr: La lista de elementos a ordenar. # Docstring: Especifica el argumento 'arr'.
+        arr: La lista de elementos a ordenar (o cualquier buffer escribible: array.array, memoryview, NumPy, mmap... (ver BufferSupport.py)). # Docstring: Especifica el argumento 'arr'.
+        key: Función que extrae la clave de comparación de cada elemento (se calcula una sola vez por elemento). # Docstring: Especifica el argumento 'key'.
+        reverse: Si es True, ordena de mayor a menor. # Docstring: Especifica el argumento 'reverse'.
+        values: Si se da, 'arr' son las claves ya calculadas y 'values' se mueve a la par (ver KeySupport.py). # Docstring: Especifica el argumento 'values'.
 
     Returns: # Docstring: Describe lo que la función retorna.
         La lista ordenada. # Docstring: Especifica que retorna la lista ordenada.
+
+    Estable: sí (un elemento nunca pasa por delante de uno igual). # Docstring: Indica si el algoritmo es estable.
     """
+    view = as_sequence(arr) # Vista indexable de la entrada, sin copiarla.
+    if view is not arr: # mmap, bytearray u otro buffer: se ordena a través de un memoryview.
+        insertion_sort(view, key, reverse, values)
+        return arr
+    if key is not None or reverse: # Con clave u orden inverso se usa la interfaz común (ver KeySupport.py).
+        return sort_with_key(arr, key, reverse, insertion_sort, _insertion_sort_keyed)
+
     n = len(arr) # Obtiene la longitud de la lista 'arr' y la guarda en 'n'.
 
     # Recorre todos los elementos de la lista, empezando por el segundo (índice 1)
@@ -15,18 +32,64 @@ def insertion_sort(arr): # Define una función llamada insertion_sort que toma u
     # dentro de su propio sub-arreglo de un solo elemento.
     for i in range(1, n): # Inicia un bucle que va desde el segundo elemento (índice 1) hasta el final de la lista.
         key = arr[i]  # Guarda el elemento actual en 'key' para insertarlo en su posición correcta.
+        if values is not None: # Y su valor, que se mueve a la par.
+            value = values[i]
         j = i - 1     # Inicializa 'j' para apuntar al último elemento de la parte ya ordenada (a la izquierda de 'key').
 
         # Mueve los elementos de arr[0..i-1] que son mayores que 'key'
         # una posición adelante de su posición actual
         while j >= 0 and key < arr[j]: # Bucle para comparar 'key' con los elementos a su izquierda y moverlos.
             arr[j + 1] = arr[j]  # Desplaza el elemento actual 'arr[j]' una posición a la derecha.
+            if values is not None:
+                values[j + 1] = values[j]
             j -= 1               # Decrementa 'j' para comparar con el siguiente elemento a la izquierda.
 
         arr[j + 1] = key  # Inserta 'key' en la posición correcta una vez que el bucle 'while' termina.
+        if values is not None:
+            values[j + 1] = value
 
     return arr # Retorna la lista 'arr' una vez que ha sido completamente ordenada.
 
+def _insertion_sort_keyed(keys, values): # Insertion Sort sobre 'keys', moviendo 'values' a la par.
+    insertion_sort(keys, values=values)
+    return values
+
+def binary_insertion_sort(arr, lo=0, hi=None, start=None, values=None): # Inserción binaria sobre arr[lo:hi].
+    """
+    Ordena arr[lo:hi] in-place por inserción binaria: la posición de cada elemento se busca con # Docstring: Describe la función.
+    bisect (O(log n) comparaciones, en C) y el bloque de mayores se desplaza con una sola
+    asignación por rebanada (un memmove en C) en lugar de mover los elementos uno a uno.
+    Es el caso base para tramos pequeños de QuickSort, Merge Sort y la Fusión Natural.
+
+    Args: # Docstring: Describe los argumentos.
+        arr: La lista a ordenar (se ordena solo el rango [lo, hi)). # Docstring: Especifica el argumento 'arr'.
+        lo: Inicio del rango (incluido). # Docstring: Especifica el argumento 'lo'.
+        hi: Fin del rango (excluido); por defecto, len(arr). # Docstring: Especifica el argumento 'hi'.
+        start: Si se sabe que arr[lo:start] ya está ordenado, se empieza a insertar desde 'start'. # Docstring: Especifica el argumento 'start'.
+        values: Lista opcional que se mueve a la par de 'arr' (arr son las claves ya calculadas). # Docstring: Especifica el argumento 'values'.
+
+    Returns: # Docstring: Describe lo que la función retorna.
+        La lista 'arr'. # Docstring: Especifica que retorna la lista.
+
+    Estable: sí (cada elemento se inserta después de sus iguales). # Docstring: Indica si el algoritmo es estable.
+    """
+    if hi is None: # Por defecto, hasta el final de la lista.
+        hi = len(arr)
+    if start is None or start <= lo: # Un solo elemento siempre está ordenado.
+        start = lo + 1
+    for i in range(start, hi): # Cada elemento nuevo se inserta en la parte ordenada arr[lo:i].
+        pivot = arr[i] # Elemento a insertar.
+        pos = bisect_right(arr, pivot, lo, i) # Posición de inserción (después de los iguales: estable).
+        if pos == i: # Ya está en su lugar (entrada ordenada): no se mueve nada.
+            continue
+        arr[pos + 1:i + 1] = arr[pos:i] # Desplaza el bloque una posición a la derecha.
+        arr[pos] = pivot # Coloca el elemento.
+        if values is not None: # Mismo desplazamiento para los valores.
+            value = values[i]
+            values[pos + 1:i + 1] = values[pos:i]
+            values[pos] = value
+    return arr
+
 # --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
 if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
     lista_desordenada = [12, 11, 13, 5, 6] # Crea una lista de ejemplo desordenada.
@@ -63,4 +126,9 @@ if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute
     lista_un_elemento = [7] # Crea una lista con un solo elemento.
     print(f"Lista de un solo elemento: {lista_un_elemento}") # Imprime la lista de un solo elemento.
     insertion_sort(lista_un_elemento) # Intenta ordenar una lista de un solo elemento.
-    print(f"Lista ordenada (Insertion Sort): {lista_un_elemento}") # Imprime la lista de un solo elemento (permanece igual).
\ No newline at end of file
+    print(f"Lista ordenada (Insertion Sort): {lista_un_elemento}") # Imprime la lista de un solo elemento (permanece igual).
+
+    print("\n--- Ejemplo con inserción binaria en un rango ---") # Imprime un separador.
+    lista_rango = [9, 8, 7, 4, 1, 3, 2, 0] # Solo se ordenan las posiciones 2 a 6.
+    binary_insertion_sort(lista_rango, 2, 7) # Ordena lista_rango[2:7] por inserción binaria.
+    print(f"Rango [2, 7) ordenado (Binary Insertion Sort): {lista_rango}") # Imprime la lista.
\ No newline at end of file
@@ -0,0 +1,293 @@
+# Contadores de operaciones (comparaciones, movimientos, profundidad de recursión y memoria
+# auxiliar) para cualquier ordenamiento de esta carpeta.
+#
+# Costo cero cuando no se usan: los algoritmos no tienen ninguna bandera ni contador en sus
+# bucles. La instrumentación se elige AL LLAMAR: count_operations(sort, arr) ejecuta el mismo
+# algoritmo sobre una copia instrumentada de la entrada, mientras que sort(arr) sigue siendo
+# el camino normal, sin ningún cambio.
+#
+#   - Comparaciones: cada elemento (o cada clave, con key=) se envuelve en un Counted, cuyos
+#     operadores <, <=, >, >=, == y != incrementan el contador.
+#   - Movimientos: la lista se envuelve en una CountingList, que cuenta cada elemento escrito
+#     (por índice o por rebanada) y cada elemento copiado al sacar rebanadas o copias, que a su
+#     vez también son CountingList. Además se cuentan los elementos agregados con append,
+#     extend o insert a cualquier lista dentro del algoritmo (por ejemplo, el 'result' de merge).
+#     Los buffers auxiliares que se reservan con BufferSupport.allocate_like (el 'output' de
+#     counting_sort_for_radix, el buffer de la fusión directa...) también son CountingList;
+#     solo las escrituras por índice en listas creadas a mano ([0] * n) no se ven.
+#   - Profundidad: un perfilador (sys.setprofile) sigue las llamadas a funciones de los módulos
+#     de esta carpeta.
+#   - Memoria auxiliar: pico de tracemalloc durante el ordenamiento (sin contar la entrada).
+#
+# El camino instrumentado es mucho más lento que el normal: sus tiempos no sirven para medir
+# rendimiento (para eso está Benchmark.py), solo sus conteos.
+
+import os
+import sys
+import tracemalloc
+
+import AdaptiveSort # Elige el algoritmo según el tipo de los elementos (ver count_operations).
+
+_FOLDER = os.path.dirname(os.path.abspath(__file__)) # Carpeta de los algoritmos que se perfilan.
+_LIST_INSERTIONS = ("append", "extend", "insert") # Métodos de lista que agregan elementos.
+
+
+class _Counters: # Contadores compartidos por los elementos y las listas de una ejecución.
+    __slots__ = ("comparisons", "moves")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0
+
+
+def _unwrap(value): # Valor real detrás de un Counted (o el valor tal cual).
+    return value.value if type(value) is Counted else value
+
+
+class Counted: # Elemento que cuenta sus comparaciones.
+    """
+    Envuelve un valor y delega en él las comparaciones, contando cada una. También delega
+    la aritmética entera que usa Radix Sort (//, %, >>, &) y el hash, para que los
+    algoritmos que no solo comparan funcionen igual.
+    """
+    __slots__ = ("value", "counters")
+
+    def __init__(self, value, counters):
+        self.value = value
+        self.counters = counters
+
+    def __lt__(self, other):
+        self.counters.comparisons += 1
+        return self.value < _unwrap(other)
+
+    def __le__(self, other):
+        self.counters.comparisons += 1
+        return self.value <= _unwrap(other)
+
+    def __gt__(self, other):
+        self.counters.comparisons += 1
+        return self.value > _unwrap(other)
+
+    def __ge__(self, other):
+        self.counters.comparisons += 1
+        return self.value >= _unwrap(other)
+
+    def __eq__(self, other):
+        self.counters.comparisons += 1
+        return self.value == _unwrap(other)
+
+    def __ne__(self, other):
+        self.counters.comparisons += 1
+        return self.value != _unwrap(other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __floordiv__(self, other):
+        return self.value // _unwrap(other)
+
+    def __mod__(self, other):
+        return self.value % _unwrap(other)
+
+    def __rshift__(self, other):
+        return self.value >> _unwrap(other)
+
+    def __and__(self, other):
+        return self.value & _unwrap(other)
+
+    def __repr__(self):
+        return f"Counted({self.value!r})"
+
+
+class CountingList(list): # Lista que cuenta los elementos que se escriben o se copian.
+    """
+    Una lista normal que suma a 'counters.moves' cada elemento escrito (arr[i] = x cuenta 1,
+    arr[lo:hi] = items cuenta len(items)) o copiado (arr[lo:hi], arr.copy(), arr + otra).
+    Las rebanadas y copias también son CountingList, así que los algoritmos recursivos que
+    trabajan sobre mitades (merge_sort clásico) se siguen contando.
+    """
+    __slots__ = ("counters",)
+
+    def __init__(self, iterable=(), counters=None):
+        super().__init__(iterable)
+        self.counters = counters
+
+    def _derived(self, items): # Lista nueva que comparte los contadores; copiar cuenta como mover.
+        self.counters.moves += len(items)
+        return CountingList(items, self.counters)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counters.moves += len(value)
+        else:
+            self.counters.moves += 1
+        super().__setitem__(index, value)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._derived(super().__getitem__(index))
+        return super().__getitem__(index)
+
+    def __add__(self, other):
+        return self._derived(list.__add__(self, list(other)))
+
+    def copy(self):
+        return self._derived(list(self))
+
+    def reverse(self): # Invertir escribe cada elemento en otra posición.
+        self.counters.moves += len(self)
+        super().reverse()
+
+    def allocate_like(self, n): # Buffer auxiliar (BufferSupport.allocate_like) que comparte los contadores.
+        return CountingList([0] * n, self.counters)
+
+
+class _Profiler: # Sigue la profundidad de llamadas y los append/extend/insert del algoritmo.
+    def __init__(self, counters):
+        self.counters = counters
+        self.depth = 0 # Llamadas activas a funciones de la carpeta.
+        self.max_depth = 0
+        self.active = {} # Código -> llamadas activas de esa función (recursión).
+        self.max_recursion = 0
+        self.calls = 0
+        self.pending = [] # (lista, longitud antes) de cada append/extend/insert en curso.
+        self.tracked = {} # Código -> ¿pertenece a un algoritmo de la carpeta? (caché).
+
+    def _is_tracked(self, code):
+        tracked = self.tracked.get(code)
+        if tracked is None:
+            filename = os.path.abspath(code.co_filename)
+            tracked = os.path.dirname(filename) == _FOLDER and filename != os.path.abspath(__file__)
+            self.tracked[code] = tracked
+        return tracked
+
+    def __call__(self, frame, event, arg):
+        if event == "call":
+            code = frame.f_code
+            if self._is_tracked(code):
+                self.calls += 1
+                self.depth += 1
+                active = self.active.get(code, 0) + 1
+                self.active[code] = active
+                if self.depth > self.max_depth:
+                    self.max_depth = self.depth
+                if active > self.max_recursion:
+                    self.max_recursion = active
+        elif event == "return":
+            code = frame.f_code
+            if self._is_tracked(code):
+                self.depth -= 1
+                self.active[code] -= 1
+        elif event == "c_call":
+            target = getattr(arg, "__self__", None)
+            if (type(target) is list and arg.__name__ in _LIST_INSERTIONS
+                    and self._is_tracked(frame.f_code)):
+                self.pending.append((target, len(target)))
+            else:
+                self.pending.append(None)
+        elif event in ("c_return", "c_exception"):
+            if self.pending:
+                entry = self.pending.pop()
+                if entry is not None: # Elementos agregados = crecimiento de la lista.
+                    target, before = entry
+                    self.counters.moves += len(target) - before
+
+
+def count_operations(sort, arr, *args, count_comparisons=True, **kwargs): # Ordena 'arr' contando operaciones.
+    """
+    Ejecuta sort(arr, *args, **kwargs) sobre una copia instrumentada de 'arr' y retorna el
+    resultado junto con los contadores. El resultado se escribe de vuelta en 'arr' si el
+    algoritmo ordena in-place, igual que sort(arr) sin instrumentar.
+
+    Args:
+        sort: Cualquier ordenamiento de la carpeta (bubble_sort, quick_sort, tree_sort...).
+        arr: La lista a ordenar.
+        *args, **kwargs: Argumentos adicionales para 'sort' (mode=, key=, reverse=...).
+        count_comparisons: Si es False, los elementos no se envuelven en Counted (necesario
+                           para motores que no operan sobre objetos de Python, como
+                           radix_sort(engine="numpy") o msd_radix_sort); comparisons será None.
+
+    Returns:
+        tuple: (lista ordenada, estadísticas), donde las estadísticas son un diccionario con
+               comparisons, moves, calls (llamadas a funciones de la carpeta),
+               max_call_depth (anidamiento máximo de esas llamadas),
+               max_recursion_depth (máximo de llamadas activas de una misma función) y
+               aux_memory_bytes (pico de memoria reservada durante el ordenamiento).
+
+    AdaptiveSort.sort elige el algoritmo según el tipo de los elementos, así que la decisión
+    se toma sobre la entrada real (AdaptiveSort.resolve_algorithm) y se instrumenta el
+    algoritmo elegido; si es radix_sort con el motor "numpy", comparisons es None.
+
+    Raises:
+        TypeError: Si 'sort' no retorna una lista (la entrada del usuario no se modifica).
+
+    Nota: merge_sort(mode="parallel") ordena en otros procesos, que no se pueden contar.
+    """
+    if sort is AdaptiveSort.sort: # Con elementos envueltos en Counted, la decisión sería otra.
+        if kwargs.pop("return_decision", False): # La decisión se obtiene con AdaptiveSort.choose_algorithm.
+            raise ValueError("count_operations no admite return_decision=; use AdaptiveSort.choose_algorithm.")
+        _, sort, kwargs = AdaptiveSort.resolve_algorithm(arr, *args, **kwargs)
+        args = ()
+        if kwargs.get("engine") == "numpy": # El motor de NumPy no compara objetos de Python.
+            count_comparisons = False
+    counters = _Counters()
+    key = kwargs.get("key")
+    wrap = count_comparisons and key is None # Sin clave se envuelven los elementos...
+    if count_comparisons and key is not None: # ...con clave, las claves (se calculan una vez por elemento).
+        kwargs["key"] = lambda value: Counted(key(value), counters)
+    data = CountingList((Counted(value, counters) for value in arr) if wrap else arr, counters)
+
+    profiler = _Profiler(counters)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    previous = sys.getprofile()
+    sys.setprofile(profiler)
+    try:
+        result = sort(data, *args, **kwargs)
+    finally:
+        sys.setprofile(previous)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    if not isinstance(result, list): # Una tupla u otro contenedor no se puede desenvolver elemento a elemento.
+        raise TypeError("count_operations solo admite ordenamientos que retornan una lista.")
+    values = [_unwrap(value) for value in result]
+    if result is data: # Ordenamiento in-place: se actualiza la lista del usuario.
+        arr[:] = values
+        values = arr
+
+    stats = {
+        "comparisons": counters.comparisons if count_comparisons else None,
+        "moves": counters.moves,
+        "calls": profiler.calls,
+        "max_call_depth": profiler.max_depth,
+        "max_recursion_depth": profiler.max_recursion,
+        "aux_memory_bytes": max(0, peak - baseline),
+    }
+    return values, stats
+
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
+if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
+    import random
+
+    from Benchmark import algorithms
+
+    datos = [random.randint(0, 10**6) for _ in range(500)] # La misma entrada para todos.
+    print(f"{'algoritmo':>26} {'comparaciones':>14} {'movimientos':>12} {'llamadas':>9} "
+          f"{'prof.':>6} {'recursión':>10} {'memoria':>10}")
+    for nombre, ordenar in algorithms().items():
+        if nombre == "merge_sort_parallel": # Ordena en otros procesos: no se puede contar.
+            continue
+        lista = datos[:]
+        resultado, stats = count_operations(ordenar, lista, count_comparisons=nombre != "radix_sort_numpy")
+        assert resultado == sorted(datos)
+        comparaciones = "-" if stats["comparisons"] is None else f"{stats['comparisons']:,}"
+        print(f"{nombre:>26} {comparaciones:>14} {stats['moves']:>12,} {stats['calls']:>9,} "
+              f"{stats['max_call_depth']:>6} {stats['max_recursion_depth']:>10} {stats['aux_memory_bytes']:>10,}")
+
+    from Intercambio import bubble_sort
+    _, stats = count_operations(bubble_sort, [("b", 2), ("a", 1), ("c", 3)], key=lambda r: r[1]) # Con clave.
+    print(f"\nbubble_sort con key=: {stats}")
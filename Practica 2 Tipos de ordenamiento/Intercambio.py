@@ -1,13 +1,23 @@
-def bubble_sort(arr): # Define una función llamada bubble_sort que toma una lista 'arr' como argumento.
+from KeySupport import sort_with_key # Interfaz común key=/reverse=.
+
+def bubble_sort(arr, key=None, reverse=False, values=None): # Define una función llamada bubble_sort que toma una lista 'arr' como argumento.
     """
     Ordena una lista de elementos utilizando el algoritmo de Bubble Sort (Ordenamiento de Burbuja). # Docstring: Describe la función.
 
     Args: # Docstring: Describe los argumentos.
         arr: La lista de elementos a ordenar. # Docstring: Especifica el argumento 'arr'.
+        key: Función que extrae la clave de comparación de cada elemento (se calcula una sola vez por elemento). # Docstring: Especifica el argumento 'key'.
+        reverse: Si es True, ordena de mayor a menor. # Docstring: Especifica el argumento 'reverse'.
+        values: Si se da, 'arr' son las claves ya calculadas y 'values' se mueve a la par (ver KeySupport.py). # Docstring: Especifica el argumento 'values'.
 
     Returns: # Docstring: Describe lo que la función retorna.
         La lista ordenada. # Docstring: Especifica que retorna la lista ordenada.
+
+    Estable: sí (solo se intercambian elementos estrictamente mayores). # Docstring: Indica si el algoritmo es estable.
     """
+    if key is not None or reverse: # Con clave u orden inverso se usa la interfaz común (ver KeySupport.py).
+        return sort_with_key(arr, key, reverse, bubble_sort, _bubble_sort_keyed)
+
     n = len(arr) # Obtiene la longitud de la lista 'arr' y la guarda en 'n'.
 
     # Bucle exterior para controlar el número de pasadas necesarias.
@@ -24,6 +34,8 @@ def bubble_sort(arr): # Define una función llamada bubble_sort que toma una lis
             if arr[j] > arr[j + 1]: # Si el elemento actual es mayor que el siguiente...
                 # Intercambia los elementos si están en el orden incorrecto.
                 arr[j], arr[j + 1] = arr[j + 1], arr[j] # Realiza el intercambio de los valores.
+                if values is not None: # Mismo intercambio para los valores.
+                    values[j], values[j + 1] = values[j + 1], values[j]
                 swapped = True # Establece la bandera 'swapped' a True, indicando que hubo un intercambio.
 
         # Si no hubo intercambios en esta pasada, la lista ya está ordenada y podemos salir.
@@ -32,6 +44,10 @@ def bubble_sort(arr): # Define una función llamada bubble_sort que toma una lis
 
     return arr # Retorna la lista 'arr' una vez que ha sido completamente ordenada.
 
+def _bubble_sort_keyed(keys, values): # Bubble Sort sobre 'keys', moviendo 'values' a la par.
+    bubble_sort(keys, values=values)
+    return values
+
 
 
 ### Ejemplo de uso:
@@ -0,0 +1,79 @@
+# Interfaz común key= / reverse= para todos los ordenamientos de esta carpeta.
+#
+# Cada clave se calcula UNA sola vez y se guarda en un arreglo de claves paralelo a los datos
+# ("decorar una vez"); los algoritmos comparan las claves del arreglo y mueven cada clave junto
+# con su elemento (claves y datos "en tándem"), así que la función 'key' nunca se llama dentro
+# de una comparación y no se crea ninguna tupla (clave, valor) por elemento.
+#
+# reverse=True invierte los datos, los ordena de forma ascendente y los vuelve a invertir: con
+# un algoritmo estable el resultado es descendente y los elementos iguales conservan su orden
+# original (igual que sorted(..., reverse=True)).
+#
+# Estabilidad de cada algoritmo (con y sin 'key'):
+#
+#     Estables:   bubble_sort, insertion_sort, straight_merging, natural_merging,
+#                 merge_sort (modos "classic" y "buffered"), tree_sort, radix_sort,
+#                 balanced_multiway_merging.
+#     Inestables: selection_sort, quick_sort (ambos modos).
+
+from BufferSupport import reverse_in_place # Invierte también buffers sin reverse() (memoryview, NumPy).
+
+STABLE_ALGORITHMS = { # Algoritmo -> ¿es estable? (ver el comentario del módulo).
+    "bubble_sort": True,
+    "selection_sort": False,
+    "insertion_sort": True,
+    "quick_sort": False,
+    "merge_sort": True,
+    "straight_merging": True,
+    "natural_merging": True,
+    "tree_sort": True,
+    "radix_sort": True,
+    "balanced_multiway_merging": True,
+}
+
+
+def sort_with_key(arr, key, reverse, plain_sort, keyed_sort, in_place=True):
+    """
+    Aplica key= y reverse= a un algoritmo de ordenamiento.
+
+    Args:
+        arr: La lista a ordenar.
+        key: Función que extrae la clave de cada elemento, o None para comparar los elementos.
+        reverse: Si es True, el resultado queda en orden descendente.
+        plain_sort: plain_sort(data) ordena 'data' comparando los elementos y retorna el resultado.
+        keyed_sort: keyed_sort(keys, data) ordena 'data' según 'keys' (moviendo ambos a la par)
+                    y retorna el resultado.
+        in_place: True si el algoritmo ordena 'arr' en su lugar; False si construye una lista
+                  nueva (en ese caso 'arr' no se modifica).
+
+    Returns:
+        La lista ordenada.
+    """
+    if in_place: # Se trabaja directamente sobre la lista del usuario.
+        data = arr
+        if reverse:
+            reverse_in_place(data)
+    else: # El algoritmo no modifica la entrada: tampoco se invierte en su lugar.
+        data = arr[::-1] if reverse else arr
+
+    if key is None:
+        result = plain_sort(data)
+    else:
+        keys = [key(value) for value in data] # Cada clave se calcula exactamente una vez.
+        result = keyed_sort(keys, data)
+
+    if reverse: # Descendente y estable: los iguales recuperan su orden original.
+        reverse_in_place(result)
+    return result
+
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
+if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
+    from Inserción import insertion_sort # Cualquier algoritmo de la carpeta acepta key= y reverse=.
+
+    personas = [("ana", 31), ("luis", 25), ("eva", 31), ("sol", 19)] # Registros (nombre, edad).
+    print(f"Registros: {personas}") # Imprime los registros originales.
+    insertion_sort(personas, key=lambda p: p[1], reverse=True) # Por edad, descendente.
+    print(f"Por edad, descendente y estable: {personas}") # 'ana' sigue antes que 'eva'.
+    for nombre, estable in STABLE_ALGORITHMS.items(): # Tabla de estabilidad.
+        print(f"  {nombre}: {'estable' if estable else 'inestable'}")
@@ -0,0 +1,141 @@
+import heapq
+
+_EXHAUSTED = object() # Marca de un tramo agotado (pierde contra cualquier valor).
+
+
+def loser_tree_merge(*iterables, key=None, reverse=False): # Fusión k-vías con un árbol de perdedores.
+    """
+    Fusiona perezosamente varios iterables ya ordenados usando un árbol de perdedores
+    (árbol de torneo). Es un reemplazo directo de heapq.merge(*iterables, key=key, reverse=reverse).
+
+    El árbol tiene k hojas (una por tramo) y k - 1 nodos internos; cada nodo interno guarda
+    el índice del tramo que PERDIÓ el partido en ese nodo, y el ganador absoluto sale por la
+    raíz. Al extraer el ganador solo se rejuega el camino de su hoja a la raíz contra los
+    perdedores guardados: ceil(log2 k) comparaciones por elemento, frente a ~2·log2 k de un
+    heap, y sin crear ninguna tupla por elemento. Los árboles se guardan en listas planas de
+    enteros, así que k puede ser de cientos de tramos.
+
+    La fusión es estable: en empate gana el tramo con menor índice (también con reverse=True).
+
+    Args:
+        *iterables: Los tramos ordenados a fusionar (listas, generadores, archivos...).
+        key: Función opcional que extrae la clave de comparación de cada elemento.
+        reverse: Si es True, los tramos vienen en orden descendente y se fusionan de mayor a menor.
+
+    Yields:
+        Los elementos de todos los tramos, en orden.
+    """
+    iterators = [iter(iterable) for iterable in iterables] # Un iterador por tramo.
+    k = len(iterators) # Número de vías.
+    values = [next(it, _EXHAUSTED) for it in iterators] # Elemento actual (cabeza) de cada tramo.
+    keys = values if key is None else [v if v is _EXHAUSTED else key(v) for v in values] # Claves de las cabezas.
+    active = sum(v is not _EXHAUSTED for v in values) # Tramos que aún tienen elementos.
+    if active == 0: # Nada que fusionar.
+        return
+    if k == 1: # Una sola vía: el tramo ya es el resultado.
+        yield values[0]
+        yield from iterators[0]
+        return
+
+    # Construcción del torneo de abajo hacia arriba. Las hojas son los nodos k..2k-1 y los
+    # nodos internos 1..k-1 (forma de heap, válida para cualquier k). 'losers[node]' guarda
+    # el perdedor del partido en 'node'; 'winners' solo se usa durante la construcción.
+    losers = [0] * k # Índice del tramo perdedor en cada nodo interno.
+    winners = [0] * k + list(range(k)) # Ganador de cada nodo (las hojas se ganan a sí mismas).
+    for node in range(k - 1, 0, -1):
+        a = winners[2 * node] # Ganador del hijo izquierdo.
+        b = winners[2 * node + 1] # Ganador del hijo derecho.
+        ka = keys[a]
+        kb = keys[b]
+        if reverse: # En orden descendente se intercambian los operandos de '<'.
+            b_wins = kb is not _EXHAUSTED and (ka is _EXHAUSTED or (ka < kb if b > a else not kb < ka))
+        else: # 'b' gana si tiene datos y ('a' está agotado o b es menor; en empate gana el menor índice).
+            b_wins = kb is not _EXHAUSTED and (ka is _EXHAUSTED or (kb < ka if b > a else not ka < kb))
+        if b_wins:
+            winners[node] = b
+            losers[node] = a
+        else:
+            winners[node] = a
+            losers[node] = b
+    winner = winners[1] # Ganador absoluto del torneo.
+    del winners # Ya no se necesita.
+
+    while True:
+        yield values[winner] # El ganador es el menor (o el mayor, con reverse) de todas las cabezas.
+        value = next(iterators[winner], _EXHAUSTED) # Siguiente elemento del mismo tramo.
+        values[winner] = value
+        if value is _EXHAUSTED: # El tramo se agotó: pierde todos sus partidos a partir de ahora.
+            active -= 1
+            if active == 0:
+                return
+            if key is not None:
+                keys[winner] = _EXHAUSTED
+        elif key is not None:
+            keys[winner] = key(value)
+
+        # Rejuega el camino de la hoja del ganador hasta la raíz contra los perdedores guardados.
+        winner_key = keys[winner]
+        node = (winner + k) >> 1 # Padre de la hoja.
+        while node and reverse: # Descendente: igual que abajo, con los operandos de '<' intercambiados.
+            challenger = losers[node]
+            challenger_key = keys[challenger]
+            if challenger_key is not _EXHAUSTED and (
+                    winner_key is _EXHAUSTED
+                    or (winner_key < challenger_key if challenger > winner else not challenger_key < winner_key)):
+                losers[node] = winner
+                winner = challenger
+                winner_key = challenger_key
+            node >>= 1
+        while node: # Ascendente.
+            challenger = losers[node] # Quien perdió aquí la vez anterior.
+            challenger_key = keys[challenger]
+            if challenger_key is not _EXHAUSTED and (
+                    winner_key is _EXHAUSTED
+                    or (challenger_key < winner_key if challenger > winner else not winner_key < challenger_key)):
+                losers[node] = winner # El actual pierde y se queda en el nodo.
+                winner = challenger # El retador sube.
+                winner_key = challenger_key
+            node >>= 1
+
+        if active == 1: # Solo queda un tramo: el resto se copia sin comparar.
+            yield values[winner]
+            yield from iterators[winner]
+            return
+
+
+MERGE_BACKENDS = { # Núcleos de fusión k-vías disponibles (misma firma que heapq.merge).
+    "heapq": heapq.merge,
+    "loser_tree": loser_tree_merge,
+}
+
+
+def get_merge(backend): # Retorna la función de fusión k-vías del backend indicado.
+    """
+    Args:
+        backend: "heapq" (heapq.merge de la biblioteca estándar) o "loser_tree" (loser_tree_merge).
+
+    Returns:
+        Una función f(*iterables, key=None, reverse=False) que fusiona iterables ordenados.
+    """
+    try:
+        return MERGE_BACKENDS[backend]
+    except KeyError:
+        raise ValueError("Backend de fusión no válido. Use 'heapq' o 'loser_tree'.") from None
+
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
+if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
+    tramos = [[1, 4, 9], [2, 3, 10, 11], [], [0, 5, 6, 7, 8]] # Tramos ya ordenados (uno vacío).
+    print(f"Tramos: {tramos}") # Imprime los tramos de entrada.
+    print(f"Fusión (árbol de perdedores): {list(loser_tree_merge(*tramos))}") # Fusiona los tramos.
+
+    print("\n--- Ejemplo con clave y estabilidad ---") # Imprime un separador.
+    registros = [[("ana", 1), ("luis", 3)], [("eva", 1), ("sol", 2)]] # Tramos ordenados por el número.
+    fusion = loser_tree_merge(*registros, key=lambda r: r[1]) # En empate gana el primer tramo.
+    print(f"Fusión por clave: {list(fusion)}") # Imprime el resultado.
+
+    print("\n--- Ejemplo con muchas vías (k = 300) ---") # Imprime un separador.
+    import random
+    muchos_tramos = [sorted(random.sample(range(100000), 50)) for _ in range(300)] # 300 tramos de 50 elementos.
+    resultado = list(loser_tree_merge(*muchos_tramos)) # Fusiona los 300 tramos de una vez.
+    print(f"¿Ordenado? {resultado == sorted(resultado)}, elementos: {len(resultado)}") # Verifica el resultado.
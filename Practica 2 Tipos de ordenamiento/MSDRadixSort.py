@@ -0,0 +1,164 @@
+from itertools import repeat # Argumentos fijos para startswith en map (bucle en C).
+
+from BufferSupport import allocate_like # Buffer auxiliar del mismo tipo que la entrada.
+
+PREFIX_SAMPLES = 8 # Elementos con los que se estima el prefijo común de una cubeta antes de verificarlo.
+
+def _suffix_insertion_sort(arr, lo, hi, depth): # Ordenamiento por inserción para cubetas pequeñas.
+    """
+    Ordena arr[lo:hi] por inserción, comparando solo a partir de la posición 'depth'
+    (todos los elementos de la cubeta comparten los primeros 'depth' caracteres).
+    """
+    suffixes = [s[depth:] for s in arr[lo:hi]] # Claves sin el prefijo común ya procesado.
+    items = arr[lo:hi] # Copia local de la cubeta.
+    for i in range(1, len(items)): # Inserción clásica sobre las claves.
+        key = suffixes[i] # Clave a insertar.
+        item = items[i] # Elemento que acompaña a la clave.
+        j = i - 1 # Último elemento de la parte ya ordenada.
+        while j >= 0 and key < suffixes[j]: # Desplaza los mayores una posición a la derecha.
+            suffixes[j + 1] = suffixes[j]
+            items[j + 1] = items[j]
+            j -= 1
+        suffixes[j + 1] = key # Inserta la clave en su lugar.
+        items[j + 1] = item # Y su elemento.
+    arr[lo:hi] = items # Escribe la cubeta ordenada de vuelta.
+
+
+def _prefix_end(a, b, lo, hi, depth): # Fin del prefijo común de 'a' y 'b', sabiendo que coinciden en [depth, lo).
+    step = 1
+    while lo < hi: # Galope: lo + 1, lo + 2, lo + 4... (si ya difieren, basta una prueba).
+        end = min(lo + step, hi)
+        if not b.startswith(a[depth:end], depth):
+            hi = end - 1
+            break
+        lo = end
+        step *= 2
+    while lo < hi: # Búsqueda binaria en (lo, hi]: cada prueba compara desde 'depth', en C.
+        mid = (lo + hi + 1) // 2
+        if b.startswith(a[depth:mid], depth):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_prefix_end(bucket, depth): # Fin del prefijo que comparten todos los elementos, desde 'depth'.
+    """
+    Retorna la primera posición, desde 'depth', en la que no todos los elementos de 'bucket'
+    coinciden, comparando siempre desde 'depth' (startswith, en C) y nunca los caracteres
+    anteriores.
+
+    La cubeta no puede compartir más que unos pocos elementos de muestra, así que el fin se
+    estima con PREFIX_SAMPLES de ellos (si ya difieren en 'depth', no se recorre la cubeta)
+    y se verifica con una sola pasada; solo si algún otro elemento difiere antes se afina
+    con búsqueda binaria.
+    """
+    first = bucket[0]
+    lo, hi = depth, len(first) # Comparten first[:lo]; no pueden compartir más allá de 'hi'.
+    for other in bucket[1::max(1, len(bucket) // PREFIX_SAMPLES)]: # Cota superior con la muestra.
+        hi = _prefix_end(first, other, lo, min(hi, len(other)), depth)
+        if hi == lo: # La muestra ya difiere en 'depth'.
+            return lo
+    startswith = type(first).startswith # str.startswith o bytes.startswith.
+    if all(map(startswith, bucket, repeat(first[depth:hi]), repeat(depth))): # Una pasada verifica la cota.
+        return hi
+    hi -= 1 # Alguno difiere antes de 'hi': búsqueda binaria en [lo, hi - 1].
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if all(map(startswith, bucket, repeat(first[depth:mid]), repeat(depth))):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def msd_radix_sort(arr, cutoff=16): # Define la función principal del Radix Sort MSD para cadenas.
+    """
+    Ordena una lista de cadenas (str) o de bytes con Radix Sort MSD (del carácter más
+    significativo al menos significativo).
+
+    En cada cubeta se reparten los elementos según su carácter en la posición actual
+    (counting sort estable) y cada sub-cubeta se procesa en la posición siguiente, sin
+    volver a comparar los caracteres anteriores. Además:
+      - Salto de prefijo común: antes de repartir una cubeta se busca, comparando solo
+        desde la posición actual, el primer carácter que distingue a sus elementos y se
+        salta directamente a él (ver _common_prefix_end).
+      - Cubetas pequeñas (<= cutoff elementos) se ordenan por inserción sobre los sufijos.
+      - Usa una pila explícita en lugar de recursión, así que claves muy largas no agotan
+        el límite de recursión.
+
+    Args:
+        arr: La lista de cadenas o de bytes a ordenar (no se pueden mezclar).
+        cutoff: Tamaño de cubeta a partir del cual se usa ordenamiento por inserción.
+
+    Returns:
+        La lista ordenada (in-place).
+    """
+    n = len(arr) # Obtiene la longitud de la lista.
+    if n <= 1: # Si la lista tiene 0 o 1 elemento, ya está ordenada.
+        return arr
+
+    aux = allocate_like(arr, n) # Buffer auxiliar para la dispersión del counting sort.
+    stack = [(0, n, 0)] # Cubetas pendientes: (inicio, fin, profundidad).
+
+    while stack: # Procesa cubetas hasta que no quede ninguna.
+        lo, hi, depth = stack.pop() # Siguiente cubeta a ordenar.
+
+        if hi - lo <= cutoff: # Cubeta pequeña: inserción sobre los sufijos.
+            _suffix_insertion_sort(arr, lo, hi, depth)
+            continue
+
+        # Counting sort por el carácter en 'depth'. s[depth:depth + 1] es un carácter (o un
+        # byte) y vale "" (o b"") cuando la cadena ya terminó, que va antes que cualquier otro.
+        bucket = arr[lo:hi] # Elementos de la cubeta.
+        depth = _common_prefix_end(bucket, depth) # Salto de prefijo común.
+        digits = [s[depth:depth + 1] for s in bucket] # Carácter actual de cada elemento.
+        counts = {} # Cuántos elementos hay por carácter.
+        for digit in digits:
+            counts[digit] = counts.get(digit, 0) + 1
+        if len(counts) == 1: # Tras el salto, solo si todas terminaron: son iguales y ya están en orden.
+            continue
+
+        offsets = {} # Posición inicial de cada carácter en la salida.
+        position = lo
+        for digit in sorted(counts): # Los caracteres en orden.
+            offsets[digit] = position
+            count = counts[digit]
+            if count > 1 and digit: # Sub-cubeta con más de un elemento que aún tiene caracteres.
+                stack.append((position, position + count, depth + 1))
+            position += count
+
+        for s, digit in zip(bucket, digits): # Dispersión estable hacia el buffer auxiliar.
+            aux[offsets[digit]] = s
+            offsets[digit] += 1
+        arr[lo:hi] = aux[lo:hi] # Copia la cubeta repartida de vuelta a la lista.
+
+    return arr # Retorna la lista ordenada.
+
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
+if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
+    urls = [ # URLs con prefijos comunes largos: el peor caso para los ordenamientos por comparación.
+        "https://example.com/api/v1/users/42",
+        "https://example.com/api/v1/orders/7",
+        "https://example.com/api/v2/users/1",
+        "https://example.com/static/logo.png",
+        "https://example.com/api/v1/users/3",
+        "https://example.com/api/v1/orders/12",
+    ]
+    print(f"Lista desordenada: {urls}") # Imprime la lista original.
+    msd_radix_sort(urls) # Ordena la lista.
+    print("Lista ordenada (MSD Radix Sort):") # Imprime la lista ordenada.
+    for url in urls:
+        print(f"  {url}")
+
+    print("\n--- Ejemplo con bytes ---") # Imprime un separador.
+    ids = [b"id-0003", b"id-0001", b"id-01", b"id-0002", b"id", b"id-0001"] # Claves en bytes, con duplicados.
+    print(f"Lista desordenada: {ids}") # Imprime la lista original.
+    msd_radix_sort(ids) # Ordena la lista.
+    print(f"Lista ordenada (MSD Radix Sort): {ids}") # Imprime la lista ordenada.
+
+    print("\n--- Ejemplo con lista vacía ---") # Imprime un separador.
+    lista_vacia = [] # Lista vacía.
+    msd_radix_sort(lista_vacia) # Intenta ordenar una lista vacía.
+    print(f"Lista ordenada (MSD Radix Sort): {lista_vacia}") # Imprime la lista vacía.
@@ -0,0 +1,96 @@
+from BufferSupport import copy_range # Copias de buffers tipados (una rebanada de memoryview es una vista).
+from Inserción import binary_insertion_sort # Caso base: bloques pequeños por inserción binaria.
+
+
+def merge_runs(src, dst, lo, mid, hi, src_values=None, dst_values=None): # Mezcla dos tramos ordenados de 'src' hacia 'dst'.
+    """
+    Combina src[lo:mid] y src[mid:hi] (ambos ordenados) en dst[lo:hi]. La mezcla es estable:
+    en empate va primero el elemento del tramo izquierdo. Cuando uno de los tramos se agota,
+    el resto del otro se copia en bloque con asignación por slices.
+    Si se dan 'src_values' y 'dst_values', 'src' son claves y los valores se mueven a la par.
+    """
+    i = lo # Índice para el tramo izquierdo.
+    j = mid # Índice para el tramo derecho.
+    k = lo # Índice de escritura en 'dst'.
+    while i < mid and j < hi: # Mientras ambos tramos tengan elementos.
+        left = src[i] # Candidato izquierdo.
+        right = src[j] # Candidato derecho.
+        if right < left: # El derecho es estrictamente menor: va primero.
+            dst[k] = right
+            if src_values is not None: # Los valores acompañan a sus claves.
+                dst_values[k] = src_values[j]
+            j += 1
+        else: # En empate, el izquierdo primero (estabilidad).
+            dst[k] = left
+            if src_values is not None:
+                dst_values[k] = src_values[i]
+            i += 1
+        k += 1
+    if i < mid: # Resto del tramo izquierdo, en bloque.
+        dst[k:hi] = src[i:mid]
+        if src_values is not None:
+            dst_values[k:hi] = src_values[i:mid]
+    elif j < hi: # Resto del tramo derecho, en bloque.
+        dst[k:hi] = src[j:hi]
+        if src_values is not None:
+            dst_values[k:hi] = src_values[j:hi]
+
+
+def bottom_up_merge_sort(arr, temp_arr=None, base_block=32, values=None): # Merge Sort ascendente con buffers alternados.
+    """
+    Ordena 'arr' in-place con Merge Sort ascendente (bottom-up):
+
+    1. Ordena por inserción bloques de 'base_block' elementos (en lugar de empezar con
+       sublistas de tamaño 1, lo que ahorra las primeras log2(base_block) pasadas).
+    2. En cada pasada mezcla parejas de tramos de 'arr' hacia 'temp_arr' y en la siguiente
+       de 'temp_arr' hacia 'arr' ("ping-pong"): nunca se copia el resultado de vuelta
+       después de cada mezcla, lo que reduce a la mitad los movimientos de elementos.
+    3. Si al terminar el resultado quedó en 'temp_arr', se copia una sola vez a 'arr'.
+
+    Args:
+        arr: La secuencia a ordenar (lista, array.array, memoryview, arreglo de NumPy...).
+        temp_arr: Buffer auxiliar del mismo tamaño (se crea si no se da).
+        base_block: Tamaño de los bloques iniciales ordenados por inserción (1 = fusión directa clásica).
+        values: Si se da, 'arr' son las claves y 'values' se mueve a la par (ver KeySupport.py).
+
+    Returns:
+        La misma secuencia, ordenada.
+    """
+    n = len(arr) # Obtiene la longitud de la secuencia.
+    if n <= 1: # 0 o 1 elemento: ya está ordenada.
+        return arr
+    if base_block < 1: # El bloque base debe tener al menos un elemento.
+        raise ValueError("base_block debe ser al menos 1.")
+    if temp_arr is None: # Buffer auxiliar del mismo tamaño.
+        temp_arr = copy_range(arr, 0, n)
+    temp_values = copy_range(values, 0, n) if values is not None else None # Buffer auxiliar de los valores.
+
+    # 1. Bloques base ordenados por inserción binaria.
+    if base_block > 1:
+        for lo in range(0, n, base_block):
+            binary_insertion_sort(arr, lo, min(lo + base_block, n), values=values)
+
+    # 2. Pasadas de mezcla alternando origen y destino.
+    src, dst = arr, temp_arr # Origen y destino de la pasada actual.
+    src_values, dst_values = values, temp_values # Los valores alternan igual que las claves.
+    width = base_block # Tamaño de los tramos ordenados en 'src'.
+    while width < n: # Se ejecuta log2(n / base_block) veces.
+        for lo in range(0, n, 2 * width): # Cada pareja de tramos.
+            mid = min(lo + width, n) # Fin del tramo izquierdo.
+            hi = min(lo + 2 * width, n) # Fin del tramo derecho.
+            if mid >= hi or not src[mid] < src[mid - 1]: # Sin tramo derecho, o ya en orden.
+                dst[lo:hi] = src[lo:hi] # Basta con copiar en bloque.
+                if values is not None:
+                    dst_values[lo:hi] = src_values[lo:hi]
+            else:
+                merge_runs(src, dst, lo, mid, hi, src_values, dst_values) # Mezcla los dos tramos.
+        src, dst = dst, src # El destino pasa a ser el origen de la siguiente pasada.
+        src_values, dst_values = dst_values, src_values
+        width *= 2 # Los tramos duplican su tamaño.
+
+    # 3. Si el resultado quedó en el buffer auxiliar, se copia una sola vez.
+    if src is not arr:
+        arr[:] = src
+        if values is not None:
+            values[:] = src_values
+    return arr
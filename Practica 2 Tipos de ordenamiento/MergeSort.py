@@ -1,13 +1,59 @@
-def merge_sort(arr): # Define la función principal para el ordenamiento por mezcla.
+import os # Para conocer el número de núcleos disponibles.
+from concurrent.futures import ProcessPoolExecutor # Pool de procesos para el modo paralelo.
+from multiprocessing import shared_memory # Memoria compartida entre procesos.
+
+from Inserción import binary_insertion_sort # Caso base del modo "buffered".
+from KeySupport import sort_with_key # Interfaz común key=/reverse=.
+from MergeKernel import merge_runs # Mezcla de dos tramos de un buffer hacia otro.
+from RadixSort import _numpy_exact # ¿La conversión a NumPy conserva todos los valores?
+
+try: # NumPy es opcional: solo lo necesita el modo paralelo.
+    import numpy as np
+except ImportError: # Sin NumPy, el modo paralelo recurre al Merge Sort secuencial.
+    np = None
+
+BUFFERED_INSERTION_CUTOFF = 16 # En el modo "buffered", los tramos de este tamaño o menores se ordenan por inserción.
+PARALLEL_MIN_CHUNK = 1 << 16 # Tamaño mínimo de trozo por proceso: por debajo no compensa paralelizar.
+
+def merge_sort(arr, mode="classic", workers=None, key=None, reverse=False): # Define la función principal para el ordenamiento por mezcla.
     """
     Ordena una lista de elementos utilizando el algoritmo de Merge Sort (Ordenamiento por Mezcla). # Docstring: Describe la función.
 
     Args: # Docstring: Describe los argumentos.
         arr: La lista de elementos a ordenar. # Docstring: Especifica el argumento 'arr'.
+        mode: "classic" (recursivo, un núcleo), "buffered" (in-place con un solo buffer, ver # Docstring: Especifica el argumento 'mode'.
+              merge_sort_buffered) o "parallel" (ver parallel_merge_sort).
+        workers: Número de procesos para el modo "parallel" (por defecto, todos los núcleos). # Docstring: Especifica el argumento 'workers'.
+        key: Función que extrae la clave de comparación de cada elemento (se calcula una sola vez por elemento). # Docstring: Especifica el argumento 'key'.
+             No se admite en el modo "parallel", que ordena números directamente.
+        reverse: Si es True, ordena de mayor a menor. # Docstring: Especifica el argumento 'reverse'.
 
     Returns: # Docstring: Describe lo que la función retorna.
         La lista ordenada. # Docstring: Especifica que retorna la lista ordenada.
+
+    Estable: sí en todos los modos, también con reverse=True (en empate va primero el de la izquierda; # Docstring: Indica si el algoritmo es estable.
+    el modo "parallel" fusiona con la misma regla y su caso de un solo trozo usa np.sort estable).
     """
+    if key is not None or reverse: # Con clave u orden inverso se usa la interfaz común (ver KeySupport.py).
+        if mode == "parallel":
+            if key is not None:
+                raise ValueError("El modo 'parallel' no admite key=. Use 'classic' o 'buffered'.")
+            # Invertir, ordenar e invertir (como con los demás modos): así el recurso al Merge Sort
+            # clásico, que acepta cualquier objeto comparable, conserva el orden de los iguales.
+            return sort_with_key(arr, None, reverse, lambda data: parallel_merge_sort(data, workers), None,
+                                 in_place=False)
+        if mode == "buffered":
+            return sort_with_key(arr, key, reverse, merge_sort_buffered, _merge_sort_buffered_keyed)
+        if mode != "classic":
+            raise ValueError("Modo no válido. Use 'classic', 'buffered' o 'parallel'.")
+        return sort_with_key(arr, key, reverse, merge_sort, _merge_sort_keyed, in_place=False)
+    if mode == "parallel": # Modo multinúcleo.
+        return parallel_merge_sort(arr, workers) # Delega en el Merge Sort paralelo.
+    if mode == "buffered": # Modo sin asignaciones por nivel.
+        return merge_sort_buffered(arr) # Ordena in-place con un único buffer auxiliar.
+    if mode != "classic": # Cualquier otro modo es un error.
+        raise ValueError("Modo no válido. Use 'classic', 'buffered' o 'parallel'.")
+
     if len(arr) <= 1: # Caso base de la recursión: si la lista tiene 0 o 1 elemento, ya está ordenada.
         return arr # Retorna la lista tal cual.
 
@@ -23,46 +69,252 @@ def merge_sort(arr): # Define la función principal para el ordenamiento por mez
     # Combina las dos mitades ordenadas.
     return merge(left_half, right_half) # Llama a la función 'merge' para combinar las mitades y retorna el resultado.
 
-def merge(left, right): # Define la función auxiliar para mezclar dos listas ordenadas.
+def merge(left, right, left_values=None, right_values=None): # Define la función auxiliar para mezclar dos listas ordenadas.
     """
     Combina dos listas ordenadas en una sola lista ordenada. # Docstring: Describe la función.
 
     Args: # Docstring: Describe los argumentos.
         left: La primera lista ordenada. # Docstring: Especifica el argumento 'left'.
         right: La segunda lista ordenada. # Docstring: Especifica el argumento 'right'.
+        left_values, right_values: Si se dan, 'left' y 'right' son claves y estos valores se # Docstring: Especifica los argumentos de valores.
+            combinan a la par (ver KeySupport.py).
 
     Returns: # Docstring: Describe lo que la función retorna.
         Una nueva lista que es la combinación ordenada de 'left' y 'right'. # Docstring: Especifica lo que retorna.
+        Con valores, la tupla (claves combinadas, valores combinados).
     """
     result = [] # Inicializa una lista vacía para almacenar la lista combinada.
+    result_values = [] if left_values is not None else None # Valores combinados, si hay claves.
     i = 0 # Inicializa el índice para recorrer la lista 'left'.
     j = 0 # Inicializa el índice para recorrer la lista 'right'.
 
     # Compara elementos de ambas listas y los añade a 'result' en orden.
     while i < len(left) and j < len(right): # Mientras haya elementos en ambas listas para comparar.
-        if left[i] < right[j]: # Si el elemento de la izquierda es menor.
+        if not right[j] < left[i]: # Si el elemento de la izquierda es menor o igual (en empate va primero: estable).
             result.append(left[i]) # Añade el elemento de la izquierda a 'result'.
+            if result_values is not None: # Los valores acompañan a sus claves.
+                result_values.append(left_values[i])
             i += 1 # Avanza al siguiente elemento en la lista 'left'.
-        else: # Si el elemento de la derecha es menor o igual.
+        else: # Si el elemento de la derecha es estrictamente menor.
             result.append(right[j]) # Añade el elemento de la derecha a 'result'.
+            if result_values is not None:
+                result_values.append(right_values[j])
             j += 1 # Avanza al siguiente elemento en la lista 'right'.
 
     # Añade los elementos restantes de la lista 'left' (si los hay).
     while i < len(left): # Si quedan elementos en 'left'.
         result.append(left[i]) # Añádelos directamente a 'result' (ya están ordenados).
+        if result_values is not None:
+            result_values.append(left_values[i])
         i += 1 # Avanza al siguiente elemento en la lista 'left'.
 
     # Añade los elementos restantes de la lista 'right' (si los hay).
     while j < len(right): # Si quedan elementos en 'right'.
         result.append(right[j]) # Añádelos directamente a 'result' (ya están ordenados).
+        if result_values is not None:
+            result_values.append(right_values[j])
         j += 1 # Avanza al siguiente elemento en la lista 'right'.
 
+    if result_values is not None: # Con claves: claves y valores combinados.
+        return result, result_values
     return result # Retorna la lista combinada y ordenada.
 
----
-### Ejemplo de Uso
+def merge_sort_buffered(arr, values=None): # Merge Sort basado en índices, con un único buffer auxiliar.
+    """
+    Ordena 'arr' in-place con Merge Sort sin crear listas nuevas en cada nivel.
+
+    - Se reserva un solo buffer auxiliar (copia de 'arr') por llamada: n posiciones extra en total.
+    - No se copian mitades con slicing: todo se hace con índices sobre 'arr' y el buffer.
+    - Origen y destino se alternan entre niveles, así que el resultado de una mezcla nunca
+      se copia de vuelta.
+    - Si las dos mitades ya están en orden (último de la izquierda <= primero de la derecha)
+      se omite la mezcla; con datos ya ordenados el costo es casi lineal.
+
+    Args:
+        arr: La lista de elementos a ordenar.
+        values: Si se da, 'arr' son las claves y 'values' se mueve a la par (ver KeySupport.py).
+
+    Returns:
+        La misma lista, ordenada.
+    """
+    n = len(arr) # Obtiene la longitud de la lista (una sola vez).
+    if n <= 1: # 0 o 1 elemento: ya está ordenada.
+        return arr
+    aux = arr[:] # El único buffer auxiliar: empieza con el mismo contenido que 'arr'.
+    aux_values = values[:] if values is not None else None # Con claves, un buffer más para los valores.
+    _merge_sort_into(aux, arr, 0, n, aux_values, values) # El resultado final queda en 'arr'.
+    return arr
+
+def _merge_sort_into(src, dst, lo, hi, src_values=None, dst_values=None): # Ordena el rango [lo, hi) dejando el resultado en 'dst'.
+    """
+    Requiere que src[lo:hi] y dst[lo:hi] tengan el mismo contenido al entrar. Las mitades se
+    ordenan hacia 'src' (con los papeles invertidos) y luego se mezclan hacia 'dst'.
+    Con 'src_values' y 'dst_values', los valores siguen el mismo camino que las claves.
+    """
+    if hi - lo <= BUFFERED_INSERTION_CUTOFF: # Caso base: inserción binaria directamente en 'dst'.
+        binary_insertion_sort(dst, lo, hi, values=dst_values)
+        return
+
+    mid = (lo + hi) // 2 # Punto medio del rango.
+    _merge_sort_into(dst, src, lo, mid, dst_values, src_values) # Ordena la mitad izquierda hacia 'src'.
+    _merge_sort_into(dst, src, mid, hi, dst_values, src_values) # Ordena la mitad derecha hacia 'src'.
+
+    if not src[mid] < src[mid - 1]: # Las mitades ya están en orden: no hace falta mezclar.
+        dst[lo:hi] = src[lo:hi] # Copia en bloque (sin comparar elemento a elemento).
+        if dst_values is not None:
+            dst_values[lo:hi] = src_values[lo:hi]
+        return
+
+    merge_runs(src, dst, lo, mid, hi, src_values, dst_values) # Mezcla estable de las mitades hacia 'dst'.
+
+# --- Variantes con arreglo de claves ---
+# Los mismos algoritmos con 'values': comparan las claves y mueven los valores a la par.
+
+def _merge_sort_keyed(keys, values): # Merge Sort clásico con claves: retorna una nueva lista de valores.
+    return _merge_sort_keyed_lists(keys, values)[1]
+
+def _merge_sort_keyed_lists(keys, values): # Ordena por 'keys'; retorna (claves, valores) en listas nuevas.
+    if len(keys) <= 1:
+        return keys, values
+    mid = len(keys) // 2
+    left_keys, left_values = _merge_sort_keyed_lists(keys[:mid], values[:mid])
+    right_keys, right_values = _merge_sort_keyed_lists(keys[mid:], values[mid:])
+    return merge(left_keys, right_keys, left_values, right_values) # La misma mezcla, con valores.
+
+def _merge_sort_buffered_keyed(keys, values): # merge_sort_buffered según 'keys', moviendo 'values' a la par.
+    merge_sort_buffered(keys, values)
+    return values
+
+def _attach(name, dtype, n): # Abre un bloque de memoria compartida existente como arreglo de NumPy.
+    block = shared_memory.SharedMemory(name=name) # Se conecta al bloque creado por el proceso principal.
+    return block, np.ndarray((n,), dtype=dtype, buffer=block.buf) # Vista sin copia sobre la memoria compartida.
 
-```python
+def _sort_chunk(task): # Tarea de un proceso: ordena un trozo del arreglo compartido in-place.
+    name, dtype, n, lo, hi = task # Desempaqueta la tarea (solo se envían nombres e índices, nunca datos).
+    block, data = _attach(name, dtype, n) # Accede al arreglo compartido.
+    try:
+        data[lo:hi].sort(kind="stable") # Ordena el trozo en su lugar (Timsort/Radix de NumPy, estable).
+    finally:
+        del data # Suelta la vista antes de cerrar el bloque.
+        block.close()
+
+def _merge_segment(task): # Tarea de un proceso: fusiona un segmento de dos trozos ordenados.
+    src_name, dst_name, dtype, n, l0, l1, r0, r1, out = task # Rangos de origen y posición de salida.
+    src_block, src = _attach(src_name, dtype, n) # Arreglo de origen.
+    dst_block, dst = _attach(dst_name, dtype, n) # Arreglo de destino.
+    try:
+        left = src[l0:l1] # Parte izquierda a fusionar.
+        right = src[r0:r1] # Parte derecha a fusionar.
+        # La posición final de cada elemento es su índice más cuántos del otro lado van antes.
+        # En empates van primero los de la izquierda (fusión estable).
+        dst[out + np.arange(left.size) + np.searchsorted(right, left, side="left")] = left
+        dst[out + np.arange(right.size) + np.searchsorted(left, right, side="right")] = right
+    finally:
+        del src, dst, left, right # Suelta las vistas antes de cerrar los bloques.
+        src_block.close()
+        dst_block.close()
+
+def _merge_path_split(data, l0, l1, r0, r1, k): # Divide la fusión de data[l0:l1] y data[r0:r1] en la posición k de la salida.
+    """
+    Retorna cuántos elementos de la parte izquierda van entre los primeros k de la fusión
+    ("merge path"). Permite repartir una sola fusión entre varios procesos.
+    """
+    lo = max(0, k - (r1 - r0)) # Mínimo de elementos izquierdos posibles.
+    hi = min(k, l1 - l0) # Máximo de elementos izquierdos posibles.
+    while lo < hi: # Búsqueda binaria sobre la diagonal k.
+        i = (lo + hi) // 2
+        if data[l0 + i] <= data[r0 + k - i - 1]: # El izquierdo i va antes: se necesitan más izquierdos.
+            lo = i + 1
+        else:
+            hi = i
+    return lo
+
+def parallel_merge_sort(arr, workers=None): # Merge Sort multinúcleo sobre memoria compartida.
+    """
+    Ordena un arreglo numérico usando varios núcleos.
+
+    1. Copia los datos una sola vez a un bloque de memoria compartida (multiprocessing.shared_memory);
+       los procesos del ProcessPoolExecutor reciben solo nombres e índices, nunca los datos.
+    2. Cada proceso ordena un trozo contiguo in-place.
+    3. Los trozos se fusionan por parejas en rondas, alternando entre dos bloques compartidos.
+       Cada fusión se divide con "merge path" en segmentos independientes, así que incluso la
+       última fusión (un solo par) usa todos los núcleos.
+
+    Para datos no numéricos (o mezclas de enteros y flotantes, que NumPy convertiría a
+    float64 alterando sus valores), sin NumPy o con entradas pequeñas, recurre al Merge Sort clásico.
+
+    Args:
+        arr: La lista (o arreglo de NumPy) de números a ordenar.
+        workers: Número de procesos (por defecto, todos los núcleos).
+
+    Returns:
+        Una nueva lista ordenada (o un nuevo arreglo de NumPy si la entrada era un arreglo).
+    """
+    if np is None: # Sin NumPy no hay memoria compartida tipada.
+        return merge_sort(list(arr))
+    if not isinstance(arr, np.ndarray) and not _numpy_exact(arr): # Se revisan los elementos ANTES de convertir.
+        return merge_sort(list(arr))
+    values = np.asarray(arr) # Vista (o copia) de los datos como arreglo.
+    if values.ndim != 1 or values.dtype.kind not in "biuf": # Solo números en una dimensión.
+        return merge_sort(list(arr))
+
+    n = values.size # Número de elementos.
+    workers = workers or os.cpu_count() or 1 # Procesos a usar.
+    workers = max(1, min(workers, n // PARALLEL_MIN_CHUNK)) # No tiene sentido usar trozos diminutos.
+    if workers == 1: # Un solo trozo: se ordena en este proceso.
+        result = np.sort(values, kind="stable")
+        return result if isinstance(arr, np.ndarray) else result.tolist()
+
+    dtype = values.dtype.str # Tipo de dato, en forma serializable.
+    blocks = [shared_memory.SharedMemory(create=True, size=values.nbytes) for _ in range(2)] # Origen y destino.
+    try:
+        src = np.ndarray((n,), dtype=values.dtype, buffer=blocks[0].buf) # Arreglo compartido de origen.
+        src[:] = values # Única copia de los datos de entrada.
+        bounds = [n * i // workers for i in range(workers + 1)] # Límites de los trozos.
+        runs = list(zip(bounds[:-1], bounds[1:])) # Trozos: (inicio, fin).
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Fase 1: cada proceso ordena su trozo.
+            list(pool.map(_sort_chunk, [(blocks[0].name, dtype, n, lo, hi) for lo, hi in runs]))
+
+            # Fase 2: rondas de fusión por parejas, alternando el bloque de origen y destino.
+            current = 0 # Índice del bloque que contiene los tramos actuales.
+            while len(runs) > 1:
+                src_name, dst_name = blocks[current].name, blocks[1 - current].name
+                data = np.ndarray((n,), dtype=values.dtype, buffer=blocks[current].buf)
+                pairs = len(runs) // 2 # Parejas a fusionar en esta ronda.
+                parts = max(1, workers // pairs) # Segmentos por pareja, para ocupar todos los núcleos.
+                tasks = []
+                next_runs = []
+                for p in range(pairs):
+                    (l0, l1), (r0, r1) = runs[2 * p], runs[2 * p + 1]
+                    total = r1 - l0 # Tamaño del resultado de esta fusión.
+                    splits = [total * s // parts for s in range(parts + 1)] # Cortes de la salida.
+                    lefts = [_merge_path_split(data, l0, l1, r0, r1, k) for k in splits] # Cortes de la entrada.
+                    for s in range(parts):
+                        i0, i1 = lefts[s], lefts[s + 1] # Elementos izquierdos del segmento.
+                        j0, j1 = splits[s] - i0, splits[s + 1] - i1 # Elementos derechos del segmento.
+                        tasks.append((src_name, dst_name, dtype, n, l0 + i0, l0 + i1, r0 + j0, r0 + j1, l0 + splits[s]))
+                    next_runs.append((l0, r1))
+                if len(runs) % 2: # Un trozo sin pareja se copia tal cual al destino.
+                    lo, hi = runs[-1]
+                    tasks.append((src_name, dst_name, dtype, n, lo, hi, hi, hi, lo))
+                    next_runs.append((lo, hi))
+                del data # Suelta la vista antes de la siguiente ronda.
+                list(pool.map(_merge_segment, tasks))
+                runs = next_runs
+                current = 1 - current # El destino pasa a ser el origen.
+
+        result = np.ndarray((n,), dtype=values.dtype, buffer=blocks[current].buf).copy() # Resultado fuera de la memoria compartida.
+        del src
+    finally:
+        for block in blocks: # Libera siempre la memoria compartida.
+            block.close()
+            block.unlink()
+
+    return result if isinstance(arr, np.ndarray) else result.tolist() # Mismo tipo de contenedor que la entrada.
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
 if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
     lista_desordenada = [38, 27, 43, 3, 9, 82, 10] # Crea una lista de ejemplo desordenada.
     print(f"Lista desordenada: {lista_desordenada}") # Imprime la lista original.
@@ -100,3 +352,20 @@ if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute
     lista_ordenada_un_elemento = merge_sort(lista_un_elemento) # Ordena una lista de un solo elemento.
     print(f"Lista ordenada (Merge Sort): {lista_ordenada_un_elemento}") # Imprime la lista de un solo elemento.
 
+
+
+    print("\n--- Ejemplo con el modo buffered (in-place, un solo buffer auxiliar) ---") # Imprime un separador.
+    lista_buffered = [64, 25, 12, 22, 11, 90, 78, 34, 45, 56, 1, 89, 3, 77, 8, 41, 19, 60] # Lista de ejemplo.
+    merge_sort(lista_buffered, mode="buffered") # Ordena la lista in-place.
+    print(f"Lista ordenada (Merge Sort buffered): {lista_buffered}") # Imprime la lista ordenada.
+
+    print("\n--- Ejemplo con key= y reverse= (registros por una clave) ---") # Imprime un separador.
+    alumnos = [("ana", 8.5), ("luis", 9.1), ("eva", 8.5), ("sol", 7.0)] # Registros (nombre, nota).
+    por_nota = merge_sort(alumnos, key=lambda a: a[1], reverse=True) # De mayor a menor nota, estable.
+    print(f"Por nota, descendente: {por_nota}") # 'ana' sigue antes que 'eva'.
+
+    print("\n--- Ejemplo con el modo paralelo (un millón de números) ---") # Imprime un separador.
+    import random # Solo para generar datos de ejemplo.
+    lista_enorme = [random.random() for _ in range(1_000_000)] # Un millón de flotantes aleatorios.
+    lista_ordenada_enorme = merge_sort(lista_enorme, mode="parallel") # Ordena usando todos los núcleos.
+    print(f"¿Ordenada? {all(lista_ordenada_enorme[i] <= lista_ordenada_enorme[i + 1] for i in range(len(lista_ordenada_enorme) - 1))}") # Verifica el resultado.
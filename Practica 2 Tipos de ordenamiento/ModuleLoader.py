@@ -0,0 +1,33 @@
+import importlib.util
+import os
+import sys
+
+_DIRECTORY = os.path.dirname(os.path.abspath(__file__)) # Carpeta donde viven todos los módulos de ordenamiento.
+
+
+def load_module(filename):
+    """
+    Carga un módulo de esta carpeta a partir de su nombre de archivo.
+    Varios archivos (por ejemplo 'Distribution of initial runs.py') tienen espacios en el
+    nombre y no se pueden importar con 'import'; esta función los carga una sola vez y los
+    deja registrados en sys.modules.
+
+    Args:
+        filename: Nombre del archivo, por ejemplo "Natural merging.py".
+
+    Returns:
+        El módulo cargado.
+    """
+    name = os.path.splitext(filename)[0].replace(" ", "_") # Nombre válido para sys.modules.
+    if name in sys.modules: # Si ya se cargó antes, se reutiliza.
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(name, os.path.join(_DIRECTORY, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module # Se registra antes de ejecutarlo para soportar importaciones circulares.
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name] # No se deja un módulo a medio cargar.
+        raise
+    return module
@@ -1,102 +1,205 @@
-def natural_merging(arr): # Define la función principal para el Ordenamiento por Fusión Natural.
-    """
-    Ordena una lista de elementos utilizando el algoritmo de Fusión Natural (Natural Merging).
-
-    Args:
-        arr: La lista de elementos a ordenar.
-
-    Returns:
-        La lista ordenada.
-    """
-    n = len(arr) # Obtiene la longitud de la lista.
-    if n <= 1: # Si la lista tiene 0 o 1 elemento, ya está ordenada.
-        return arr # Retorna la lista tal cual.
+from bisect import bisect_left, bisect_right # Búsqueda binaria en C para el galope.
 
-    # Lista temporal para almacenar los resultados de la mezcla.
-    temp_arr = [0] * n # Crea una lista temporal del mismo tamaño que la original.
+from BufferSupport import as_sequence, copy_range # Entradas con protocolo de buffer.
+from Inserción import binary_insertion_sort # Extiende los tramos cortos.
+from KeySupport import sort_with_key # Interfaz común key=/reverse=.
 
-    # Variable para controlar si la lista está completamente ordenada.
-    # Será True si en una pasada no se realiza ninguna fusión (ya solo hay un tramo).
-    is_sorted = False # Inicializa la bandera de ordenamiento.
+MIN_MERGE = 32 # Listas más cortas se ordenan solo con inserción binaria.
+MIN_GALLOP = 7 # Victorias seguidas de un tramo antes de pasar al modo galope.
 
-    # Bucle principal: Continúa hasta que la lista esté completamente ordenada (is_sorted = True).
-    while not is_sorted: # Este bucle se ejecuta al menos una vez y hasta que la lista esté ordenada.
-        is_sorted = True # Asume que la lista está ordenada al inicio de cada pasada.
-
-        # Encuentra el inicio del primer tramo.
-        left_start = 0 # Inicializa el índice de inicio del tramo izquierdo.
+def natural_merging(arr, key=None, reverse=False): # Define la función principal para el Ordenamiento por Fusión Natural.
+    """
+    Ordena una lista de elementos utilizando Fusión Natural adaptativa (al estilo TimSort).
 
-        # Itera para encontrar y mezclar pares de tramos.
-        while left_start < n - 1: # Mientras haya al menos dos elementos para formar un tramo.
-            # 1. Encontrar el final del primer tramo (left_run_end).
-            # Un tramo termina cuando el siguiente elemento es menor (rompe el orden ascendente).
-            left_run_end = left_start # El final del tramo izquierdo comienza en su inicio.
-            while left_run_end < n - 1 and arr[left_run_end] <= arr[left_run_end + 1]: # Mientras el orden se mantenga.
-                left_run_end += 1 # Avanza el final del tr tramo izquierdo.
+    1. Recorre la lista una sola vez detectando tramos naturales; los tramos estrictamente
+       descendentes se invierten en su lugar (la inversión no rompe la estabilidad).
+    2. Los tramos más cortos que 'minrun' se extienden con inserción binaria.
+    3. Los tramos se apilan y se mezclan manteniendo los invariantes de TimSort
+       (cada tramo es mayor que la suma de los dos siguientes), lo que garantiza mezclas
+       equilibradas y O(n log n) en el peor caso.
+    4. En la mezcla, si un tramo gana MIN_GALLOP veces seguidas se pasa a modo galope:
+       se busca con búsqueda binaria cuántos elementos seguidos gana y se copian en bloque.
 
-            # Si left_run_end es el último elemento, solo queda un tramo en este par,
-            # o es el último tramo de la lista, ya no hay más para mezclar en esta pasada.
-            if left_run_end == n - 1: # Si el primer tramo llega hasta el final de la lista.
-                break # Sale del bucle interno, no hay un segundo tramo para mezclar.
+    Con datos casi ordenados hay pocos tramos largos y el costo se acerca a O(n).
 
-            # 2. Encontrar el final del segundo tramo (right_run_end).
-            # El segundo tramo comienza justo después del primero.
-            right_start = left_run_end + 1 # El inicio del tramo derecho es el siguiente elemento.
-            right_run_end = right_start # El final del tramo derecho comienza en su inicio.
-            while right_run_end < n - 1 and arr[right_run_end] <= arr[right_run_end + 1]: # Mientras el orden se mantenga.
-                right_run_end += 1 # Avanza el final del tramo derecho.
+    Args:
+        arr: La lista de elementos a ordenar (o cualquier buffer escribible: array.array, memoryview, NumPy, mmap... (ver BufferSupport.py)).
+        key: Función que extrae la clave de comparación de cada elemento (se calcula una sola vez por elemento).
+        reverse: Si es True, ordena de mayor a menor.
 
-            # Realiza la fusión de los dos tramos encontrados.
-            _merge(arr, temp_arr, left_start, left_run_end, right_run_end) # Llama a la función auxiliar _merge para fusionar.
+    Returns:
+        La lista ordenada.
 
-            # Si se realizó una fusión, la lista aún no está completamente ordenada.
-            is_sorted = False # Indica que se realizó una fusión, por lo que se necesita otra pasada.
+    Estable: sí (solo se invierten tramos estrictamente descendentes y las mezclas favorecen al tramo izquierdo).
+    """
+    view = as_sequence(arr) # Vista indexable de la entrada, sin copiarla.
+    if view is not arr: # mmap, bytearray u otro buffer: se ordena a través de un memoryview.
+        natural_merging(view, key, reverse)
+        return arr
+    if key is not None or reverse: # Con clave u orden inverso se usa la interfaz común (ver KeySupport.py).
+        return sort_with_key(arr, key, reverse, natural_merging, _natural_merging_keyed)
+    _natural_sort(arr) # Ordena la lista in-place.
+    return arr # Retorna la lista ya ordenada.
 
-            # Mueve el inicio para buscar el siguiente par de tramos.
-            left_start = right_run_end + 1 # El nuevo inicio para buscar tramos es después del tramo derecho fusionado.
+def _natural_merging_keyed(keys, values): # Fusión Natural según 'keys', moviendo 'values' a la par.
+    _natural_sort(keys, values)
+    return values
 
-    return arr # Retorna la lista ya ordenada.
+def _natural_sort(arr, values=None): # Motor de la Fusión Natural; si se da 'values', lo mueve a la par de 'arr'.
+    n = len(arr) # Obtiene la longitud de la lista.
+    if n <= 1: # Si la lista tiene 0 o 1 elemento, ya está ordenada.
+        return
+
+    minrun = _min_run_length(n) # Longitud mínima de cada tramo.
+    runs = [] # Pila de tramos pendientes: [inicio, longitud].
+    lo = 0 # Inicio del siguiente tramo.
+    while lo < n: # Una sola pasada de detección de tramos.
+        run_length = _count_run_and_make_ascending(arr, lo, n, values) # Tramo natural (ya ascendente).
+        if run_length < minrun: # Tramo corto: se extiende con inserción binaria.
+            forced = min(minrun, n - lo)
+            binary_insertion_sort(arr, lo, lo + forced, lo + run_length, values)
+            run_length = forced
+        runs.append([lo, run_length]) # Apila el tramo.
+        _merge_collapse(arr, runs, values) # Restablece los invariantes de la pila.
+        lo += run_length # Continúa después del tramo.
+
+    while len(runs) > 1: # Al final se mezclan todos los tramos restantes.
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]: # Mezcla primero la pareja más pequeña.
+            i -= 1
+        _merge_at(arr, runs, i, values)
+
+def _min_run_length(n): # Calcula 'minrun' como en TimSort.
+    """
+    Retorna un valor entre MIN_MERGE/2 y MIN_MERGE tal que n / minrun sea una potencia de 2
+    o un poco menos, para que las mezclas finales queden equilibradas.
+    """
+    extra = 0 # Se vuelve 1 si se descarta algún bit en 1.
+    while n >= MIN_MERGE:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
 
-def _merge(arr, temp_arr, left, mid, right): # Función auxiliar para mezclar dos sub-arreglos (idéntica a Straight Merging).
+def _count_run_and_make_ascending(arr, lo, hi, values=None): # Detecta el tramo natural que empieza en 'lo'.
     """
-    Combina dos sub-arreglos ordenados de 'arr' en 'temp_arr' y luego los copia de vuelta a 'arr'.
-    El primer sub-arreglo es arr[left..mid].
-    El segundo sub-arreglo es arr[mid+1..right].
+    Retorna la longitud del tramo que empieza en arr[lo]. Si el tramo es estrictamente
+    descendente se invierte en su lugar (estrictamente, para no alterar el orden de los
+    elementos iguales).
     """
-    i = left # Índice para el sub-arreglo izquierdo.
-    j = mid + 1 # Índice para el sub-arreglo derecho.
-    k = left # Índice para la lista temporal 'temp_arr'.
-
-    # Compara elementos de ambas sublistas y los añade a 'temp_arr' en orden.
-    while i <= mid and j <= right: # Mientras haya elementos en ambas sublistas para comparar.
-        if arr[i] <= arr[j]: # Si el elemento del sub-arreglo izquierdo es menor o igual.
-            temp_arr[k] = arr[i] # Añade el elemento a 'temp_arr'.
-            i += 1 # Avanza al siguiente elemento en el sub-arreglo izquierdo.
-        else: # Si el elemento del sub-arreglo derecho es menor.
-            temp_arr[k] = arr[j] # Añade el elemento a 'temp_arr'.
-            j += 1 # Avanza al siguiente elemento en el sub-arreglo derecho.
-        k += 1 # Avanza al siguiente espacio en 'temp_arr'.
-
-    # Copia los elementos restantes del sub-arreglo izquierdo (si los hay).
-    while i <= mid: # Si quedan elementos en el sub-arreglo izquierdo.
-        temp_arr[k] = arr[i] # Añádelos directamente a 'temp_arr'.
-        i += 1 # Avanza el índice del sub-arreglo izquierdo.
-        k += 1 # Avanza el índice de 'temp_arr'.
-
-    # Copia los elementos restantes del sub-arreglo derecho (si los hay).
-    while j <= right: # Si quedan elementos en el sub-arreglo derecho.
-        temp_arr[k] = arr[j] # Añádelos directamente a 'temp_arr'.
-        j += 1 # Avanza el índice del sub-arreglo derecho.
-        k += 1 # Avanza el índice de 'temp_arr'.
-
-    # Copia los elementos de 'temp_arr' de vuelta a 'arr' en las posiciones correctas.
-    for idx in range(left, right + 1): # Itera sobre el rango que acaba de ser mezclado.
-        arr[idx] = temp_arr[idx] # Copia los elementos ordenados de vuelta a la lista original.
-
----
-### Ejemplo de Uso
-
-```python
+    run_hi = lo + 1 # Fin (excluido) del tramo.
+    if run_hi == hi: # Un solo elemento.
+        return 1
+    if arr[run_hi] < arr[lo]: # Tramo descendente.
+        run_hi += 1
+        while run_hi < hi and arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+        arr[lo:run_hi] = arr[lo:run_hi][::-1] # Invierte el tramo en bloque.
+        if values is not None: # Los valores acompañan a sus claves.
+            values[lo:run_hi] = values[lo:run_hi][::-1]
+    else: # Tramo ascendente (no descendente).
+        run_hi += 1
+        while run_hi < hi and not arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+    return run_hi - lo
+
+def _merge_collapse(arr, runs, values=None): # Mezcla tramos de la pila hasta que se cumplan los invariantes.
+    """
+    Invariantes (con A, B, C, D los cuatro tramos del tope, D el último):
+    len(B) > len(C) + len(D), len(A) > len(B) + len(C) y len(C) > len(D).
+    """
+    while len(runs) > 1:
+        i = len(runs) - 2 # Índice del penúltimo tramo.
+        if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) or \
+                (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+            if runs[i - 1][1] < runs[i + 1][1]: # Mezcla con el vecino más pequeño.
+                i -= 1
+        elif runs[i][1] > runs[i + 1][1]: # Todos los invariantes se cumplen.
+            break
+        _merge_at(arr, runs, i, values)
+
+def _merge_at(arr, runs, i, values=None): # Mezcla los tramos i e i+1 de la pila.
+    base_a, len_a = runs[i] # Tramo izquierdo.
+    base_b, len_b = runs[i + 1] # Tramo derecho (contiguo).
+    runs[i][1] = len_a + len_b # El resultado ocupa el lugar del tramo izquierdo.
+    del runs[i + 1]
+
+    # Los primeros elementos de A que no superan a B[0] ya están en su lugar.
+    lo = bisect_right(arr, arr[base_b], base_a, base_b)
+    if lo == base_b: # A completo va antes que B: no hay nada que mezclar.
+        return
+    # Los últimos elementos de B que no son menores que A[-1] ya están en su lugar.
+    hi = bisect_left(arr, arr[base_b - 1], base_b, base_b + len_b)
+    _merge_lo(arr, lo, base_b, hi, values)
+
+def _merge_lo(arr, lo, mid, hi, values=None): # Mezcla estable de arr[lo:mid] y arr[mid:hi] con galope.
+    left = copy_range(arr, lo, mid) # Copia del tramo izquierdo (el derecho se lee en su lugar).
+    left_values = copy_range(values, lo, mid) if values is not None else None # Sus valores, si hay claves.
+    n_left = len(left) # Longitud del tramo izquierdo.
+    i = 0 # Siguiente elemento de 'left'.
+    j = mid # Siguiente elemento del tramo derecho.
+    k = lo # Siguiente posición de escritura.
+    min_gallop = MIN_GALLOP # Umbral adaptativo para entrar en modo galope.
+
+    while True:
+        # Modo normal: elemento a elemento, contando victorias seguidas.
+        wins_left = wins_right = 0
+        while True:
+            if arr[j] < left[i]: # Gana el derecho (estrictamente menor).
+                arr[k] = arr[j]
+                if values is not None: # Los valores acompañan a sus claves.
+                    values[k] = values[j]
+                j += 1
+                wins_right += 1
+                wins_left = 0
+            else: # Gana el izquierdo (en empate, el izquierdo: estabilidad).
+                arr[k] = left[i]
+                if values is not None:
+                    values[k] = left_values[i]
+                i += 1
+                wins_left += 1
+                wins_right = 0
+            k += 1
+            if i == n_left or j == hi: # Un tramo se agotó.
+                break
+            if wins_left >= min_gallop or wins_right >= min_gallop: # Un tramo domina: galope.
+                break
+        if i == n_left or j == hi:
+            break
+
+        # Modo galope: se busca cuántos elementos seguidos gana cada tramo y se copian en bloque.
+        while True:
+            p = bisect_right(left, arr[j], i) # Elementos de 'left' que van antes que arr[j].
+            wins_left = p - i
+            if wins_left:
+                arr[k:k + wins_left] = left[i:p]
+                if values is not None:
+                    values[k:k + wins_left] = left_values[i:p]
+                k += wins_left
+                i = p
+                if i == n_left:
+                    break
+            q = bisect_left(arr, left[i], j, hi) # Elementos del derecho estrictamente menores que left[i].
+            wins_right = q - j
+            arr[k:k + wins_right] = arr[j:q] # Siempre hay al menos uno.
+            if values is not None:
+                values[k:k + wins_right] = values[j:q]
+            k += wins_right
+            j = q
+            if j == hi:
+                break
+            if wins_left < MIN_GALLOP and wins_right < MIN_GALLOP: # El galope ya no compensa.
+                min_gallop += 1 # Se penaliza volver a galopar.
+                break
+            min_gallop = max(1, min_gallop - 1) # El galope funciona: se facilita volver a él.
+        if i == n_left or j == hi:
+            break
+
+    if i < n_left: # Lo que queda de 'left' va al final (lo que queda del derecho ya está en su lugar).
+        arr[k:k + n_left - i] = left[i:]
+        if values is not None:
+            values[k:k + n_left - i] = left_values[i:]
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
 if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
     lista_desordenada = [1, 5, 2, 6, 9, 3, 4, 7] # Lista con tramos naturales: [1,5], [2,6,9], [3,4,7]
     print(f"Lista desordenada: {lista_desordenada}") # Imprime la lista original.
@@ -122,6 +225,11 @@ if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute
     natural_merging(lista_ya_ordenada) # Ordena (debería ser muy rápido).
     print(f"Lista ordenada (Natural Merging): {lista_ya_ordenada}") # Imprime la lista ya ordenada.
 
+    print("\n--- Ejemplo con key= y reverse= ---") # Imprime un separador.
+    pedidos = [("p1", 30), ("p2", 10), ("p3", 30), ("p4", 20), ("p5", 10)] # (pedido, importe).
+    natural_merging(pedidos, key=lambda p: p[1], reverse=True) # Por importe, de mayor a menor (estable).
+    print(f"Por importe, descendente: {pedidos}") # Imprime la lista ordenada.
+
     print("\n--- Ejemplo con lista vacía ---") # Imprime un separador.
     lista_vacia = [] # Lista vacía.
     print(f"Lista vacía: {lista_vacia}") # Imprime la lista vacía.
@@ -1,41 +1,333 @@
+from KeySupport import sort_with_key # Interfaz común key=/reverse=.
+
 class Node: # Define una clase para representar un nodo en el árbol binario de búsqueda.
-    def __init__(self, key): # Constructor de la clase Node.
+    def __init__(self, key, value=None): # Constructor de la clase Node.
         self.key = key # Almacena el valor (clave) del nodo.
+        self.value = value # Elemento asociado a la clave (solo se usa al ordenar con key=).
         self.left = None # Inicializa el puntero al hijo izquierdo como None.
         self.right = None # Inicializa el puntero al hijo derecho como None
 
-def insert(root, key): # Define una función para insertar una nueva clave en el BST.
+def insert(root, key, value=None): # Define una función para insertar una nueva clave en el BST.
     if root is None: # Si el árbol (o subárbol) está vacío, el nuevo nodo es la raíz.
-        return Node(key) # Crea y retorna un nuevo nodo con la clave.
+        return Node(key, value) # Crea y retorna un nuevo nodo con la clave.
     else: # Si el árbol no está vacío, decide dónde insertar.
         if key < root.key: # Si la nueva clave es menor que la clave del nodo actual.
-            root.left = insert(root.left, key) # Llama recursivamente a insert en el subárbol izquierdo.
+            root.left = insert(root.left, key, value) # Llama recursivamente a insert en el subárbol izquierdo.
         else: # Si la nueva clave es mayor o igual que la clave del nodo actual.
-            root.right = insert(root.right, key) # Llama recursivamente a insert en el subárbol derecho.
+            root.right = insert(root.right, key, value) # Llama recursivamente a insert en el subárbol derecho.
     return root # Retorna la raíz (modificada) del subárbol.
 
-def inorder_traversal(root, sorted_list): # Define una función para realizar un recorrido inorden del BST.
+def inorder_traversal(root, sorted_list, values=False): # Define una función para realizar un recorrido inorden del BST.
     if root: # Si el nodo actual no es None (es decir, existe).
-        inorder_traversal(root.left, sorted_list) # Recorre recursivamente el subárbol izquierdo.
-        sorted_list.append(root.key) # Agrega la clave del nodo actual a la lista ordenada.
-        inorder_traversal(root.right, sorted_list) # Recorre recursivamente el subárbol derecho.
+        inorder_traversal(root.left, sorted_list, values) # Recorre recursivamente el subárbol izquierdo.
+        sorted_list.append(root.value if values else root.key) # Agrega la clave (o el elemento asociado) a la lista ordenada.
+        inorder_traversal(root.right, sorted_list, values) # Recorre recursivamente el subárbol derecho.
+
+def tree_sort(arr, mode="classic", key=None, reverse=False, values=None): # Define la función principal para el ordenamiento de árbol.
+    """
+    Ordena una lista con un árbol binario de búsqueda y retorna una lista nueva.
+
+    Args:
+        arr: La lista de elementos a ordenar (no se modifica).
+        mode: "classic" (BST sin balancear, recursivo) o "balanced" (árbol AVL, ver balanced_tree_sort).
+        key: Función que extrae la clave de comparación de cada elemento (se calcula una sola vez
+             por elemento y cada nodo guarda la clave junto a su elemento).
+        reverse: Si es True, ordena de mayor a menor.
+        values: Si se da, 'arr' son las claves ya calculadas, cada nodo guarda también su
+                valor y se retornan los valores en el orden de sus claves (ver KeySupport.py).
 
-def tree_sort(arr): # Define la función principal para el ordenamiento de árbol.
+    Returns:
+        Una nueva lista ordenada.
+
+    Estable: sí (las claves iguales se insertan a la derecha y salen en orden de llegada).
+    """
+    if key is not None or reverse: # Con clave u orden inverso se usa la interfaz común (ver KeySupport.py).
+        if mode not in ("classic", "balanced"):
+            raise ValueError("Modo no válido. Use 'classic' o 'balanced'.")
+        keyed_sort = _balanced_tree_sort_keyed if mode == "balanced" else _tree_sort_keyed
+        return sort_with_key(arr, key, reverse, lambda data: tree_sort(data, mode), keyed_sort, in_place=False)
+    if mode == "balanced": # Árbol AVL: O(n log n) incluso con datos ya ordenados.
+        return balanced_tree_sort(arr, values) # Delega en la versión balanceada.
+    if mode != "classic": # Cualquier otro modo es un error.
+        raise ValueError("Modo no válido. Use 'classic' o 'balanced'.")
     if not arr: # Si la lista de entrada está vacía, no hay nada que ordenar.
         return [] # Retorna una lista vacía.
 
     root = None # Inicializa la raíz del árbol binario de búsqueda como None.
-    for element in arr: # Itera sobre cada elemento de la lista de entrada.
-        root = insert(root, element) # Inserta cada elemento en el árbol. La 'root' se actualiza en cada inserción.
+    for i, element in enumerate(arr): # Itera sobre cada elemento de la lista de entrada.
+        value = values[i] if values is not None else None # Elemento asociado a la clave (si hay valores).
+        root = insert(root, element, value) # Inserta cada elemento en el árbol. La 'root' se actualiza en cada inserción.
 
     sorted_list = [] # Inicializa una lista vacía para almacenar los elementos ordenados.
-    inorder_traversal(root, sorted_list) # Realiza el recorrido inorden para llenar la lista ordenada.
+    inorder_traversal(root, sorted_list, values is not None) # Realiza el recorrido inorden para llenar la lista ordenada.
     return sorted_list # Retorna la lista con los elementos ya ordenados.
 
----
-### Ejemplo de Uso
+def _tree_sort_keyed(keys, values): # tree_sort clásico según 'keys': cada nodo guarda clave y elemento.
+    return tree_sort(keys, values=values)
+
+class AVLNode: # Nodo de un árbol AVL (árbol binario de búsqueda autobalanceado).
+    __slots__ = ("key", "value", "left", "right", "height", "size") # Sin __dict__: cada nodo ocupa una fracción de la memoria de Node.
+
+    def __init__(self, key, value=None): # Constructor del nodo AVL.
+        self.key = key # Almacena el valor (clave) del nodo.
+        self.value = value # Elemento asociado a la clave (solo se usa al ordenar con key=).
+        self.left = None # Hijo izquierdo.
+        self.right = None # Hijo derecho.
+        self.height = 1 # Altura del subárbol que empieza en este nodo (una hoja mide 1).
+        self.size = 1 # Número de nodos del subárbol (para consultas de orden: k-ésimo y rango).
+
+def _height(node): # Altura de un subárbol (0 si está vacío).
+    return node.height if node is not None else 0
+
+def _size(node): # Número de nodos de un subárbol (0 si está vacío).
+    return node.size if node is not None else 0
+
+def _update(node): # Recalcula la altura y el tamaño de un nodo a partir de sus hijos.
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+def _rotate_right(node): # Rotación simple a la derecha; retorna la nueva raíz del subárbol.
+    pivot = node.left # El hijo izquierdo sube.
+    node.left = pivot.right # Su subárbol derecho pasa a ser el izquierdo del nodo.
+    pivot.right = node # El nodo baja a la derecha.
+    _update(node) # Primero el que quedó abajo.
+    _update(pivot)
+    return pivot
+
+def _rotate_left(node): # Rotación simple a la izquierda; retorna la nueva raíz del subárbol.
+    pivot = node.right # El hijo derecho sube.
+    node.right = pivot.left # Su subárbol izquierdo pasa a ser el derecho del nodo.
+    pivot.left = node # El nodo baja a la izquierda.
+    _update(node) # Primero el que quedó abajo.
+    _update(pivot)
+    return pivot
+
+def _rebalance(node): # Restablece el equilibrio AVL de un nodo; retorna la raíz del subárbol.
+    balance = _height(node.left) - _height(node.right) # Factor de equilibrio.
+    if balance > 1: # Cargado a la izquierda.
+        if _height(node.left.left) < _height(node.left.right): # Caso izquierda-derecha: rotación doble.
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1: # Cargado a la derecha.
+        if _height(node.right.right) < _height(node.right.left): # Caso derecha-izquierda: rotación doble.
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    _update(node) # Ya está equilibrado: solo se actualizan altura y tamaño.
+    return node
+
+def avl_insert(root, key, value=None): # Inserta una clave en un árbol AVL sin recursión.
+    """
+    Inserta 'key' en el árbol AVL con raíz 'root' y retorna la nueva raíz.
+    Baja iterativamente guardando el camino y luego sube por él rebalanceando; como una
+    inserción necesita a lo sumo una rotación (simple o doble), en cuanto la altura de un
+    subárbol no cambia los ancestros solo necesitan sumar 1 a su tamaño. Las claves iguales
+    van a la derecha, así que el recorrido inorden conserva el orden de llegada de los iguales.
+    'value' es el elemento asociado a la clave (opcional).
+    """
+    new_node = AVLNode(key, value) # Nodo a insertar.
+    if root is None: # Árbol vacío: el nuevo nodo es la raíz.
+        return new_node
+
+    path = [] # Nodos visitados desde la raíz.
+    node = root
+    while node is not None: # Baja hasta una hoja.
+        path.append(node)
+        node = node.left if key < node.key else node.right
+    parent = path[-1] # Padre del nuevo nodo.
+    if key < parent.key:
+        parent.left = new_node
+    else:
+        parent.right = new_node
+
+    balanced = False # Se vuelve True cuando las alturas dejan de cambiar.
+    for depth in range(len(path) - 1, -1, -1): # Sube por el camino rebalanceando.
+        node = path[depth]
+        if balanced: # Por encima del punto de equilibrio solo cambia el tamaño.
+            node.size += 1
+            continue
+        old_height = node.height # Altura antes de la inserción.
+        subtree = _rebalance(node) # Nueva raíz de este subárbol.
+        if depth == 0: # Era la raíz del árbol.
+            root = subtree
+        elif path[depth - 1].left is node: # Reengancha el subárbol en su padre.
+            path[depth - 1].left = subtree
+        else:
+            path[depth - 1].right = subtree
+        if subtree.height == old_height: # La altura no cambió: los ancestros ya no se rebalancean.
+            balanced = True
+    return root
+
+def avl_delete(root, key): # Elimina una aparición de una clave de un árbol AVL sin recursión.
+    """
+    Elimina una aparición de 'key' del árbol AVL con raíz 'root' y retorna la nueva raíz.
+    Si el nodo tiene dos hijos, se reemplaza su clave por la de su sucesor (el mínimo del
+    subárbol derecho) y se elimina ese sucesor. Luego se sube por el camino rebalanceando.
+    Lanza KeyError si la clave no está en el árbol.
+    """
+    path = [] # Nodos visitados desde la raíz.
+    node = root
+    while node is not None: # Busca el nodo con la clave.
+        if key < node.key:
+            path.append(node)
+            node = node.left
+        elif node.key < key:
+            path.append(node)
+            node = node.right
+        else: # Encontrado.
+            break
+    if node is None: # La clave no está en el árbol.
+        raise KeyError(key)
+
+    if node.left is not None and node.right is not None: # Dos hijos: se usa el sucesor.
+        path.append(node)
+        successor = node.right
+        while successor.left is not None: # El mínimo del subárbol derecho.
+            path.append(successor)
+            successor = successor.left
+        node.key = successor.key # El sucesor ocupa el lugar de la clave eliminada.
+        node.value = successor.value
+        node = successor # Ahora se elimina el sucesor (tiene a lo sumo un hijo derecho).
+
+    child = node.left if node.left is not None else node.right # El único hijo (o None).
+    if not path: # Se eliminó la raíz.
+        return child
+    parent = path[-1]
+    if parent.left is node: # Desengancha el nodo eliminado.
+        parent.left = child
+    else:
+        parent.right = child
 
-```python
+    for depth in range(len(path) - 1, -1, -1): # Sube por el camino rebalanceando (todos los tamaños cambian).
+        node = path[depth]
+        subtree = _rebalance(node)
+        if depth == 0:
+            root = subtree
+        elif path[depth - 1].left is node:
+            path[depth - 1].left = subtree
+        else:
+            path[depth - 1].right = subtree
+    return root
+
+def inorder_iterative(root, values=False): # Recorrido inorden con una pila explícita (sin recursión).
+    """Genera las claves del árbol (o sus elementos asociados, con values=True) en orden ascendente, una a una."""
+    stack = [] # Ancestros pendientes de visitar.
+    node = root
+    while stack or node is not None:
+        while node is not None: # Baja todo lo posible por la izquierda.
+            stack.append(node)
+            node = node.left
+        node = stack.pop() # El menor pendiente.
+        yield node.value if values else node.key
+        node = node.right # Continúa con su subárbol derecho.
+
+class SortedTree: # Contenedor ordenado persistente con estadísticas de orden.
+    """
+    Vista ordenada de un conjunto de datos que cambia (admite claves repetidas), sobre un
+    árbol AVL cuyos nodos guardan el tamaño de su subárbol.
+
+    - insert(key) / delete(key): O(log n).
+    - kth(k): el k-ésimo menor (desde 0), O(log n).
+    - rank(key): cuántas claves son estrictamente menores que 'key', O(log n).
+    - irange(lo, hi): iteración perezosa de las claves en [lo, hi).
+    Así, percentiles y top-N ya no requieren reordenar todo en cada cambio.
+    """
+
+    def __init__(self, iterable=None): # Crea el contenedor, opcionalmente con datos iniciales.
+        self.root = None # Raíz del árbol AVL.
+        if iterable is not None:
+            for key in iterable:
+                self.insert(key)
+
+    def __len__(self): # Número de claves almacenadas (O(1) gracias al tamaño de la raíz).
+        return _size(self.root)
+
+    def __iter__(self): # Claves en orden ascendente.
+        return inorder_iterative(self.root)
+
+    def __contains__(self, key): # ¿Está la clave en el contenedor?
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return True
+        return False
+
+    def insert(self, key): # Inserta una clave.
+        self.root = avl_insert(self.root, key)
+
+    def delete(self, key): # Elimina una aparición de la clave (KeyError si no está).
+        self.root = avl_delete(self.root, key)
+
+    def kth(self, k): # El k-ésimo menor (k = 0 es el mínimo; admite índices negativos).
+        n = len(self)
+        if k < 0: # Como en las listas: -1 es el máximo.
+            k += n
+        if not 0 <= k < n:
+            raise IndexError("índice fuera de rango")
+        node = self.root
+        while True:
+            left_size = _size(node.left) # Claves menores que la del nodo actual.
+            if k < left_size: # Está en el subárbol izquierdo.
+                node = node.left
+            elif k == left_size: # Es el nodo actual.
+                return node.key
+            else: # Está en el subárbol derecho: se descuentan las de la izquierda y el nodo.
+                k -= left_size + 1
+                node = node.right
+
+    def rank(self, key): # Cuántas claves son estrictamente menores que 'key'.
+        rank = 0
+        node = self.root
+        while node is not None:
+            if node.key < key: # El nodo y todo su subárbol izquierdo son menores.
+                rank += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def irange(self, lo=None, hi=None): # Itera perezosamente las claves en [lo, hi).
+        """
+        Genera las claves k con lo <= k < hi en orden ascendente (None = sin límite).
+        Solo baja por el camino hacia 'lo' y avanza de una en una: O(log n + m) para m claves.
+        """
+        stack = [] # Ancestros pendientes, como en inorder_iterative.
+        node = self.root
+        while node is not None: # Baja hacia 'lo' apilando solo los nodos >= lo.
+            if lo is not None and node.key < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if hi is not None and not node.key < hi: # Se llegó al límite superior.
+                return
+            yield node.key
+            node = node.right
+            while node is not None: # Siguiente sucesor: lo más a la izquierda del subárbol derecho.
+                stack.append(node)
+                node = node.left
+
+def balanced_tree_sort(arr, values=None): # Ordenamiento de árbol con un árbol AVL.
+    """
+    Ordena con un árbol AVL: inserción iterativa, recorrido inorden iterativo y nodos con
+    __slots__. La altura del árbol es O(log n) para cualquier entrada (incluso ya ordenada),
+    así que el costo total es O(n log n) y no hay riesgo de RecursionError.
+    Con 'values', 'arr' son las claves y se retornan los valores en el orden de sus claves.
+    """
+    root = None # Árbol vacío.
+    for i, element in enumerate(arr): # Inserta cada elemento.
+        root = avl_insert(root, element, values[i] if values is not None else None)
+    return list(inorder_iterative(root, values is not None)) # Las claves (o sus valores) en orden ascendente.
+
+def _balanced_tree_sort_keyed(keys, values): # balanced_tree_sort según 'keys': cada nodo guarda clave y elemento.
+    return balanced_tree_sort(keys, values)
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
 if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
     lista_desordenada = [7, 3, 9, 1, 5, 8, 2] # Crea una lista de ejemplo desordenada.
     print(f"Lista desordenada: {lista_desordenada}") # Imprime la lista original.
@@ -71,4 +363,23 @@ if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute
     lista_un_elemento = [7] # Crea una lista con un solo elemento.
     print(f"Lista de un solo elemento: {lista_un_elemento}") # Imprime la lista de un solo elemento.
     lista_ordenada_un_elemento = tree_sort(lista_un_elemento) # Ordena una lista de un solo elemento.
-    print(f"Lista ordenada (Tree Sort): {lista_ordenada_un_elemento}") # Imprime la lista de un solo elemento.
\ No newline at end of file
+    print(f"Lista ordenada (Tree Sort): {lista_ordenada_un_elemento}") # Imprime la lista de un solo elemento.
+
+    print("\n--- Ejemplo con árbol balanceado (AVL) y lista ordenada grande ---") # Imprime un separador.
+    lista_ordenada_grande = list(range(10000)) # Con el BST clásico esto sería una lista enlazada (RecursionError).
+    resultado_avl = tree_sort(lista_ordenada_grande, mode="balanced") # Ordena con el árbol AVL.
+    print(f"Primeros elementos (Tree Sort AVL): {resultado_avl[:10]}") # Imprime los primeros elementos.
+
+    print("\n--- Ejemplo con key= y reverse= ---") # Imprime un separador.
+    ciudades = [("Lima", 10.7), ("Quito", 2.8), ("Bogotá", 7.9), ("Cusco", 0.4)] # (ciudad, millones de habitantes).
+    por_poblacion = tree_sort(ciudades, mode="balanced", key=lambda c: c[1], reverse=True) # De mayor a menor población.
+    print(f"Por población, descendente: {por_poblacion}") # Imprime el resultado.
+
+    print("\n--- Ejemplo de contenedor ordenado (SortedTree) ---") # Imprime un separador.
+    latencias = SortedTree([120, 45, 300, 87, 45, 210, 99, 150]) # Vista ordenada de datos que cambian.
+    latencias.insert(60) # Llega un dato nuevo: O(log n), sin reordenar.
+    latencias.delete(300) # Se elimina un dato: O(log n).
+    print(f"Contenido: {list(latencias)}") # Recorrido en orden.
+    print(f"Mediana: {latencias.kth(len(latencias) // 2)}") # Percentil 50 sin ordenar de nuevo.
+    print(f"Datos menores que 100: {latencias.rank(100)}") # Rango de una clave.
+    print(f"Datos en [60, 150): {list(latencias.irange(60, 150))}") # Consulta de rango perezosa.
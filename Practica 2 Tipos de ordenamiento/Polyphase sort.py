@@ -1,6 +1,18 @@
+import collections
 import heapq
+import itertools
+import os
+import shutil
+import tempfile
+import time
 
-def polyphase_merge_simulation(data_lists):
+from ExternalSort import generate_runs, read_records
+from LoserTree import get_merge, loser_tree_merge
+from ModuleLoader import load_module
+
+distribution = load_module("Distribution of initial runs.py")
+
+def polyphase_merge_simulation(data_lists, backend="heapq"):
     """
     Simula la etapa de fusión de múltiples vías de un algoritmo como Polyphase Sort.
     Toma una lista de listas ya ordenadas (representando "tramos" o "cintas" con datos).
@@ -8,10 +20,17 @@ def polyphase_merge_simulation(data_lists):
     Parameters:
     data_lists (list of list): Una lista donde cada elemento es una lista de números ya ordenada
                                 (simulando los tramos iniciales de las cintas de entrada).
+    backend (str): "heapq" (cola de prioridad con tuplas) o "loser_tree" (árbol de perdedores,
+                   ~log2 k comparaciones por elemento y sin tuplas; ver LoserTree.py).
 
     Returns:
     list: Una nueva lista que contiene todos los elementos ordenados de las listas de entrada.
     """
+    if backend == "loser_tree":
+        return list(loser_tree_merge(*data_lists))
+    if backend != "heapq":
+        raise ValueError("Backend de fusión no válido. Use 'heapq' o 'loser_tree'.")
+
     # Usamos una cola de prioridad (min-heap) para eficientemente encontrar el
     # siguiente elemento más pequeño de todas las listas de entrada.
     min_heap = []
@@ -45,10 +64,210 @@ def polyphase_merge_simulation(data_lists):
 
     return sorted_result
 
----
-### **Cómo usar la simulación (Ejemplo Funcional)**
+def _read_ahead(iterable, batch_size):
+    """Recorre 'iterable' leyendo de a 'batch_size' elementos por vez (lectura anticipada)."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield from batch
+
+def streaming_merge(*iterables, key=None, reverse=False, batch_size=1):
+    """
+    Versión perezosa de polyphase_merge_simulation: fusiona flujos ordenados de cualquier
+    tipo (listas, generadores, lectores de archivos, iteradores alimentados por sockets) y
+    entrega cada elemento en cuanto se conoce, sin materializar el resultado.
+
+    La fusión usa el árbol de perdedores de LoserTree.py y es estable: entre elementos con la
+    misma clave, sale primero el del flujo que aparece antes en los argumentos.
+
+    Parameters:
+    *iterables: Flujos ya ordenados (ascendente, o descendente si reverse=True).
+    key (callable): Extrae la clave de comparación de cada elemento. Por defecto el elemento.
+    reverse (bool): Si es True, los flujos vienen en orden descendente y el resultado también.
+    batch_size (int): Cuántos elementos se leen por adelantado de cada flujo de una vez. Con
+                      valores mayores que 1 se amortiza el costo de leer de la fuente; la memoria
+                      sigue siendo constante: a lo sumo 'batch_size' elementos por flujo.
+
+    Yields:
+    Los elementos de todos los flujos, en orden.
+    """
+    if batch_size < 1:
+        raise ValueError("El tamaño del lote (batch_size) debe ser al menos 1.")
+    if batch_size > 1:
+        iterables = [_read_ahead(iterable, batch_size) for iterable in iterables]
+    return loser_tree_merge(*iterables, key=key, reverse=reverse)
+
+class _Tape:
+    """
+    Una "cinta" respaldada por un archivo temporal. Guarda varios tramos uno detrás de
+    otro (un registro por línea); la longitud y el tamaño en bytes de cada tramo real se
+    recuerdan en memoria, y los tramos ficticios solo se cuentan.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.runs = collections.deque() # (número de registros, bytes) de cada tramo real, en orden.
+        self.dummies = 0 # Tramos ficticios pendientes (se consumen antes que los reales).
+        self.file = open(path, "wb")
+
+    def run_count(self):
+        return self.dummies + len(self.runs)
+
+    def write_run(self, records, serialize):
+        """Añade un tramo al final de la cinta y retorna los bytes escritos."""
+        write = self.file.write
+        start = self.file.tell()
+        length = 0
+        for length, record in enumerate(records, 1):
+            write((serialize(record) + "\n").encode())
+        nbytes = self.file.tell() - start
+        self.runs.append((length, nbytes))
+        return nbytes
+
+    def read_run(self, parse):
+        """Retorna un iterador sobre el siguiente tramo real y los bytes que ocupa."""
+        length, nbytes = self.runs.popleft()
+        return map(parse, itertools.islice(self.file, length)), nbytes
+
+    def rewind_for_reading(self):
+        self.file.close()
+        self.file = open(self.path, "rb")
+
+    def rewind_for_writing(self):
+        self.file.close()
+        self.file = open(self.path, "wb") # La cinta vacía se reutiliza desde el principio.
+
+    def close(self):
+        self.file.close()
+
+
+def polyphase_sort_files(input_path, output_path, buffer_size, num_tapes=3, temp_dir=None, parse=int,
+                         serialize=str, run_strategy="block", backend="heapq"):
+    """
+    Polyphase Sort real con cintas en archivos temporales.
+
+    1. Genera los tramos iniciales y los reparte entre T-1 cintas con la distribución de
+       Fibonacci generalizada (FibonacciDistribution), completando con tramos ficticios.
+    2. En cada fase fusiona un tramo de cada cinta de entrada hacia la cinta de salida hasta
+       que una cinta de entrada se vacía; esa cinta pasa a ser la nueva salida y la anterior
+       salida se rebobina como entrada.
+    3. Termina cuando queda un único tramo: el archivo ordenado.
+
+    Parameters:
+    input_path (str): Archivo con los datos a ordenar (un registro por línea).
+    output_path (str): Archivo donde se escribe el resultado ordenado.
+    buffer_size (int): Cuántos registros caben en memoria a la vez.
+    num_tapes (int): Número de cintas (archivos temporales), al menos 3.
+    temp_dir (str): Directorio para las cintas (por defecto el del sistema).
+    parse (callable): Convierte cada línea (bytes) en un registro. Por defecto int.
+    serialize (callable): Convierte cada registro en texto. Por defecto str.
+    run_strategy (str): Generación de tramos: "block" o "replacement_selection".
+    backend (str): Núcleo de fusión: "heapq" o "loser_tree" (ver LoserTree.py).
+
+    Returns:
+    dict: Estadísticas: distribución inicial (nivel, tramos reales y ficticios por cinta) y,
+          por cada fase, fusiones realizadas y bytes leídos y escritos.
+    """
+    if buffer_size <= 0:
+        raise ValueError("El tamaño del buffer debe ser mayor que 0.")
+    merge = get_merge(backend)
+
+    fibonacci = distribution.FibonacciDistribution(num_tapes)
+    work_dir = tempfile.mkdtemp(prefix="polyphase_", dir=temp_dir)
+    tapes = [_Tape(os.path.join(work_dir, f"tape_{i}.txt")) for i in range(num_tapes)]
+
+    try:
+        # 1. Distribución inicial de Fibonacci.
+        start = time.perf_counter()
+        bytes_written = 0
+        for run in generate_runs(read_records(input_path, parse), buffer_size, run_strategy):
+            bytes_written += tapes[fibonacci.next_tape()].write_run(run, serialize)
+        real_runs = [len(tape.runs) for tape in tapes]
+        for tape, dummies in zip(tapes, fibonacci.dummies):
+            tape.dummies = dummies
+
+        stats = {
+            "tapes": num_tapes,
+            "initial_runs": sum(real_runs),
+            "level": fibonacci.level,
+            "real_runs": real_runs,
+            "dummy_runs": list(fibonacci.dummies),
+            "phases": [{
+                "phase": 0,
+                "kind": "distribution",
+                "bytes_read": os.path.getsize(input_path),
+                "bytes_written": bytes_written,
+                "seconds": time.perf_counter() - start,
+            }],
+        }
+
+        if stats["initial_runs"] == 0:
+            open(output_path, "wb").close() # Entrada vacía: resultado vacío.
+            return stats
 
-```python
+        for tape in tapes[:-1]:
+            tape.rewind_for_reading()
+
+        # 2. Fases de fusión: la última cinta de la lista siempre es la de salida.
+        phase = 1
+        while sum(len(tape.runs) for tape in tapes) > 1:
+            start = time.perf_counter()
+            inputs, output = tapes[:-1], tapes[-1]
+            merges = min(tape.run_count() for tape in inputs) # La cinta con menos tramos marca la fase.
+            bytes_read = bytes_written = dummy_merges = 0
+
+            for _ in range(merges):
+                sources = []
+                for tape in inputs:
+                    if tape.dummies: # Un tramo ficticio no aporta datos a la fusión.
+                        tape.dummies -= 1
+                    else:
+                        run, nbytes = tape.read_run(parse)
+                        sources.append(run)
+                        bytes_read += nbytes
+                if sources:
+                    bytes_written += output.write_run(merge(*sources), serialize)
+                else:
+                    output.dummies += 1 # Fusionar solo ficticios produce otro ficticio.
+                    dummy_merges += 1
+
+            stats["phases"].append({
+                "phase": phase,
+                "kind": "merge",
+                "merges": merges,
+                "dummy_merges": dummy_merges,
+                "runs_after": sum(tape.run_count() for tape in tapes),
+                "bytes_read": bytes_read,
+                "bytes_written": bytes_written,
+                "seconds": time.perf_counter() - start,
+            })
+
+            # Rotación: la cinta de entrada vacía pasa a ser la salida de la siguiente fase.
+            emptied = next(tape for tape in inputs if tape.run_count() == 0)
+            output.rewind_for_reading()
+            emptied.rewind_for_writing()
+            tapes = [tape for tape in inputs if tape is not emptied] + [output, emptied]
+            phase += 1
+
+        # 3. El único tramo real restante es el resultado.
+        final = next(tape for tape in tapes if tape.runs)
+        length, nbytes = final.runs[0]
+        if nbytes == os.path.getsize(final.path):
+            final.close()
+            shutil.move(final.path, output_path) # La cinta solo contiene ese tramo: basta con moverla.
+        else:
+            run, _ = final.read_run(parse)
+            with open(output_path, "wb") as f:
+                f.writelines((serialize(record) + "\n").encode() for record in run)
+        return stats
+    finally:
+        for tape in tapes:
+            tape.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+# --- Cómo usar la simulación (Ejemplo Funcional) ---
 if __name__ == "__main__":
     # --- Ejemplo 1: Simulando tramos pre-ordenados de 3 "cintas" ---
     # En un Polyphase Sort real, estas listas serían los "tramos" leídos de las cintas.
@@ -111,8 +330,43 @@ if __name__ == "__main__":
     print(f"Listas a fusionar: {lista_con_vacia}")
     resultado_ej3 = polyphase_merge_simulation(lista_con_vacia)
     print(f"Resultado: {resultado_ej3}")
+    resultado_lt = polyphase_merge_simulation(lista_con_vacia, backend="loser_tree")
+    print(f"Resultado con árbol de perdedores: {resultado_lt}")
 
     lista_un_elemento = [[5]]
     print(f"\nLista con un solo elemento: {lista_un_elemento}")
     resultado_un_elemento = polyphase_merge_simulation(lista_un_elemento)
-    print(f"Resultado: {resultado_un_elemento}")
\ No newline at end of file
+    print(f"Resultado: {resultado_un_elemento}")
+
+    # --- Ejemplo 3b: Fusión perezosa de flujos ---
+    print("\n--- Ejemplo 3b: Fusión perezosa de flujos (streaming_merge) ---")
+    flujo_a = (x * 3 for x in range(5)) # Un generador: 0, 3, 6, 9, 12
+    flujo_b = iter([1, 3, 4, 10]) # Un iterador cualquiera.
+    fusion = streaming_merge(flujo_a, flujo_b, batch_size=2)
+    print(f"Primer elemento (antes de leer todo): {next(fusion)}")
+    print(f"Resto: {list(fusion)}")
+    palabras = streaming_merge(["pera", "kiwi", "higo"], ["uva", "lima"], key=len, reverse=True)
+    print(f"Por longitud, descendente y estable: {list(palabras)}")
+
+    # --- Ejemplo 4: Polyphase Sort real con cintas en archivos temporales ---
+    print("\n--- Ejemplo 4: Polyphase Sort con 3 cintas en disco ---")
+    import random
+
+    demo_dir = tempfile.mkdtemp(prefix="polyphase_demo_")
+    try:
+        entrada = os.path.join(demo_dir, "entrada.txt")
+        salida = os.path.join(demo_dir, "salida.txt")
+        with open(entrada, "w") as f:
+            f.writelines(f"{random.randint(0, 10**6)}\n" for _ in range(20000))
+
+        estadisticas = polyphase_sort_files(entrada, salida, buffer_size=1000, num_tapes=3)
+        print(f"Tramos iniciales: {estadisticas['initial_runs']} (nivel Fibonacci {estadisticas['level']})")
+        print(f"Tramos reales por cinta: {estadisticas['real_runs']}, ficticios: {estadisticas['dummy_runs']}")
+        for fase in estadisticas["phases"][1:]:
+            print(f"  Fase {fase['phase']}: {fase['merges']} fusiones, quedan {fase['runs_after']} tramos, "
+                  f"{fase['bytes_written']} bytes escritos")
+
+        resultado = list(read_records(salida))
+        print(f"¿Salida ordenada? {all(resultado[i] <= resultado[i + 1] for i in range(len(resultado) - 1))}")
+    finally:
+        shutil.rmtree(demo_dir, ignore_errors=True)
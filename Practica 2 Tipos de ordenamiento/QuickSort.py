@@ -1,13 +1,42 @@
-def quick_sort(arr): # Define la función principal para el Ordenamiento Rápido.
+import math # Para calcular el límite de profundidad de Introsort.
+
+from BufferSupport import as_sequence # Entradas con protocolo de buffer.
+from Inserción import binary_insertion_sort # Caso base para tramos pequeños.
+from KeySupport import sort_with_key # Interfaz común key=/reverse=.
+
+INSERTION_SORT_CUTOFF = 16 # Tramos de este tamaño o menores se ordenan por inserción.
+NINTHER_THRESHOLD = 128 # A partir de este tamaño el pivote es la "ninther" (mediana de medianas de 3).
+
+def quick_sort(arr, mode="classic", key=None, reverse=False): # Define la función principal para el Ordenamiento Rápido.
     """
     Ordena una lista de elementos utilizando el algoritmo de QuickSort.
 
     Args:
-        arr: La lista de elementos a ordenar.
+        arr: La lista de elementos a ordenar (o cualquier buffer escribible: array.array, memoryview, NumPy, mmap... (ver BufferSupport.py)).
+        mode: "classic" (último elemento como pivote, recursivo) o "introsort"
+              (ver introsort(): O(n log n) garantizado, sin riesgo de RecursionError).
+        key: Función que extrae la clave de comparación de cada elemento (se calcula una sola vez por elemento).
+        reverse: Si es True, ordena de mayor a menor.
 
     Returns:
         La lista ordenada.
+
+    Estable: no, en ninguno de los dos modos (las particiones intercambian elementos lejanos).
     """
+    view = as_sequence(arr) # Vista indexable de la entrada, sin copiarla.
+    if view is not arr: # mmap, bytearray u otro buffer: se ordena a través de un memoryview.
+        quick_sort(view, mode, key, reverse)
+        return arr
+    if key is not None or reverse: # Con clave u orden inverso se usa la interfaz común (ver KeySupport.py).
+        if mode not in ("classic", "introsort"):
+            raise ValueError("Modo no válido. Use 'classic' o 'introsort'.")
+        keyed_sort = _introsort_keyed if mode == "introsort" else _quick_sort_keyed
+        return sort_with_key(arr, key, reverse, lambda data: quick_sort(data, mode), keyed_sort)
+    if mode == "introsort": # Variante robusta para datos de producción.
+        return introsort(arr) # Ordena in-place y retorna la lista.
+    if mode != "classic": # Cualquier otro modo es un error.
+        raise ValueError("Modo no válido. Use 'classic' o 'introsort'.")
+
     # Función auxiliar recursiva para QuickSort
     def _quick_sort_recursive(arr, low, high): # Define una función interna recursiva que toma la lista, un índice bajo y un índice alto.
         if low < high: # Caso base: si el sub-arreglo tiene 0 o 1 elemento, ya está ordenado (low >= high).
@@ -22,11 +51,12 @@ def quick_sort(arr): # Define la función principal para el Ordenamiento Rápido
     _quick_sort_recursive(arr, 0, len(arr) - 1) # Inicia el proceso de ordenamiento recursivo.
     return arr # Retorna la lista modificada (ordenada in-place).
 
-def partition(arr, low, high): # Define la función de particionamiento.
+def partition(arr, low, high, values=None): # Define la función de particionamiento.
     """
     Toma el último elemento como pivote, coloca el pivote en su posición correcta
     en el arreglo ordenado, y coloca todos los elementos más pequeños antes
     del pivote y todos los elementos más grandes después del pivote.
+    Si se da 'values', cada intercambio en 'arr' (las claves) se repite en 'values'.
     """
     pivot = arr[high] # Elige el último elemento como pivote (una estrategia común).
     i = (low - 1) # Inicializa 'i' como el índice del elemento más pequeño.
@@ -36,15 +66,160 @@ def partition(arr, low, high): # Define la función de particionamiento.
         if arr[j] <= pivot: # Compara el elemento actual con el pivote.
             i += 1 # Incrementa el índice del elemento más pequeño.
             arr[i], arr[j] = arr[j], arr[i] # Intercambia arr[i] y arr[j].
+            if values is not None: # Los valores acompañan a sus claves.
+                values[i], values[j] = values[j], values[i]
 
     # Coloca el pivote en su posición correcta.
     arr[i + 1], arr[high] = arr[high], arr[i + 1] # Intercambia el pivote con el elemento en (i+1).
+    if values is not None:
+        values[i + 1], values[high] = values[high], values[i + 1]
     return (i + 1) # Retorna el índice donde el pivote ha sido colocado.
 
----
-### Ejemplo de Uso
+def introsort(arr, lo=0, hi=None, values=None): # Define QuickSort introspectivo (Introsort).
+    """
+    Ordena arr[lo:hi] in-place con Introsort, una versión de QuickSort que se mantiene en
+    O(n log n) incluso con datos adversos:
+      - Pivote por mediana de tres (o "ninther" de Tukey en tramos grandes), así que los
+        datos ya ordenados o invertidos dejan de ser el peor caso.
+      - Partición en tres vías (bandera holandesa): los elementos iguales al pivote quedan
+        en su lugar final y no se vuelven a procesar, así que los duplicados no degradan.
+      - Pila explícita: se procesa primero el lado más pequeño y el grande se deja en la
+        pila, por lo que la pila nunca pasa de O(log n) y no hay recursión.
+      - Tramos pequeños (<= INSERTION_SORT_CUTOFF) se terminan por inserción binaria.
+      - Si la profundidad supera 2*log2(n) se cambia a HeapSort para ese tramo.
+
+    Args:
+        arr: La lista de elementos a ordenar.
+        lo: Inicio del rango a ordenar (incluido).
+        hi: Fin del rango a ordenar (excluido). Por defecto, el final de la lista.
+        values: Si se da, 'arr' son las claves y 'values' se mueve a la par (ver KeySupport.py).
+
+    Returns:
+        La lista ordenada.
+    """
+    if hi is None: # Por defecto se ordena hasta el final.
+        hi = len(arr)
+    if hi - lo <= 1: # 0 o 1 elemento: ya está ordenado.
+        return arr
+
+    stack = [(lo, hi, 2 * int(math.log2(hi - lo)))] # Tramos pendientes: (inicio, fin, profundidad restante).
+    while stack: # Mientras queden tramos por ordenar.
+        lo, hi, depth = stack.pop() # Toma el siguiente tramo.
+        while hi - lo > INSERTION_SORT_CUTOFF: # Bucle en lugar de la llamada recursiva de cola.
+            if depth == 0: # Demasiadas particiones malas: HeapSort garantiza O(n log n).
+                _heap_sort_range(arr, lo, hi, values)
+                break
+            depth -= 1 # Se consume un nivel de profundidad.
 
-```python
+            pivot = arr[_choose_pivot(arr, lo, hi)] # Valor del pivote.
+            lt, gt = _partition_three_way(arr, lo, hi, pivot, values) # arr[lt:gt] son iguales al pivote.
+
+            # Se deja el lado grande en la pila y se sigue con el pequeño.
+            if lt - lo < hi - gt: # El lado izquierdo es el más pequeño.
+                stack.append((gt, hi, depth))
+                hi = lt
+            else: # El lado derecho es el más pequeño.
+                stack.append((lo, lt, depth))
+                lo = gt
+        else: # El tramo es pequeño: se termina por inserción binaria.
+            binary_insertion_sort(arr, lo, hi, values=values)
+
+    return arr # Retorna la lista ordenada.
+
+def _median_of_three(arr, a, b, c): # Retorna el índice del valor mediano entre arr[a], arr[b] y arr[c].
+    if arr[a] < arr[b]: # Caso a < b.
+        if arr[b] < arr[c]: # a < b < c.
+            return b
+        return c if arr[a] < arr[c] else a # b es el máximo: la mediana es el mayor de a y c.
+    if arr[a] < arr[c]: # b <= a < c.
+        return a
+    return c if arr[b] < arr[c] else b # a es el máximo: la mediana es el mayor de b y c.
+
+def _choose_pivot(arr, lo, hi): # Elige el índice del pivote para arr[lo:hi].
+    n = hi - lo # Tamaño del tramo.
+    mid = lo + n // 2 # Índice central.
+    if n > NINTHER_THRESHOLD: # "Ninther": mediana de tres medianas de tres, repartidas por el tramo.
+        step = n // 8
+        first = _median_of_three(arr, lo, lo + step, lo + 2 * step)
+        middle = _median_of_three(arr, mid - step, mid, mid + step)
+        last = _median_of_three(arr, hi - 1 - 2 * step, hi - 1 - step, hi - 1)
+        return _median_of_three(arr, first, middle, last)
+    return _median_of_three(arr, lo, mid, hi - 1) # Mediana de tres: primero, centro y último.
+
+def _partition_three_way(arr, lo, hi, pivot, values=None): # Partición de la bandera holandesa (Dijkstra).
+    """
+    Reordena arr[lo:hi] en tres zonas: menores que 'pivot', iguales y mayores.
+    Retorna (lt, gt) tal que arr[lo:lt] < pivot, arr[lt:gt] == pivot y arr[gt:hi] > pivot.
+    Si se da 'values', se reordena a la par de 'arr'.
+    """
+    lt = lo # Fin de la zona de menores.
+    i = lo # Elemento actual.
+    gt = hi - 1 # Inicio (menos uno) de la zona de mayores.
+    while i <= gt: # Hasta que el elemento actual alcance la zona de mayores.
+        value = arr[i] # Elemento a clasificar.
+        if value < pivot: # Menor: va a la zona izquierda.
+            arr[i] = arr[lt]
+            arr[lt] = value
+            if values is not None:
+                values[i], values[lt] = values[lt], values[i]
+            lt += 1
+            i += 1
+        elif pivot < value: # Mayor: va a la zona derecha (el intercambiado se revisa después).
+            arr[i] = arr[gt]
+            arr[gt] = value
+            if values is not None:
+                values[i], values[gt] = values[gt], values[i]
+            gt -= 1
+        else: # Igual al pivote: se queda en la zona central.
+            i += 1
+    return lt, gt + 1 # Límites de la zona de iguales.
+
+def _heap_sort_range(arr, lo, hi, values=None): # HeapSort sobre arr[lo:hi], de respaldo para Introsort.
+    n = hi - lo # Tamaño del tramo.
+    for start in range(n // 2 - 1, -1, -1): # Construye un max-heap de abajo hacia arriba.
+        _sift_down(arr, lo, start, n, values)
+    for end in range(n - 1, 0, -1): # Extrae el máximo y lo coloca al final.
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        if values is not None: # Los valores acompañan a sus claves.
+            values[lo], values[lo + end] = values[lo + end], values[lo]
+        _sift_down(arr, lo, 0, end, values)
+
+def _sift_down(arr, lo, root, size, values=None): # Hunde arr[lo + root] en el max-heap arr[lo:lo + size].
+    value = arr[lo + root] # Elemento que se hunde.
+    moved = values[lo + root] if values is not None else None # Su valor asociado, si hay claves.
+    child = 2 * root + 1 # Hijo izquierdo.
+    while child < size: # Mientras tenga hijos.
+        if child + 1 < size and arr[lo + child] < arr[lo + child + 1]: # Elige el hijo mayor.
+            child += 1
+        if not value < arr[lo + child]: # Ya está en su lugar.
+            break
+        arr[lo + root] = arr[lo + child] # Sube el hijo.
+        if values is not None:
+            values[lo + root] = values[lo + child]
+        root = child
+        child = 2 * root + 1
+    arr[lo + root] = value # Coloca el elemento.
+    if values is not None:
+        values[lo + root] = moved
+
+# --- Variantes con arreglo de claves ---
+# Los mismos algoritmos con 'values=': comparan las claves ('arr') y mueven 'values' a la par.
+
+def _quick_sort_keyed(keys, values): # QuickSort clásico con claves: partition() mueve 'values' a la par.
+    stack = [(0, len(keys) - 1)] # Pila explícita en lugar de la recursión.
+    while stack:
+        low, high = stack.pop()
+        if low < high: # 0 o 1 elemento: ya está ordenado.
+            pi = partition(keys, low, high, values)
+            stack.append((low, pi - 1))
+            stack.append((pi + 1, high))
+    return values
+
+def _introsort_keyed(keys, values): # Introsort según 'keys', moviendo 'values' a la par.
+    introsort(keys, values=values)
+    return values
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
 if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
     lista_desordenada = [10, 7, 8, 9, 1, 5] # Crea una lista de ejemplo desordenada.
     print(f"Lista desordenada: {lista_desordenada}") # Imprime la lista original.
@@ -80,4 +255,17 @@ if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute
     lista_un_elemento = [7] # Crea una lista con un solo elemento.
     print(f"Lista de un solo elemento: {lista_un_elemento}") # Imprime la lista de un solo elemento.
     quick_sort(lista_un_elemento) # Intenta ordenar una lista de un solo elemento.
-    print(f"Lista ordenada (QuickSort): {lista_un_elemento}") # Imprime la lista de un solo elemento.
\ No newline at end of file
+    print(f"Lista ordenada (QuickSort): {lista_un_elemento}") # Imprime la lista de un solo elemento.
+
+    print("\n--- Ejemplo con Introsort (lista ordenada grande y con muchos duplicados) ---") # Imprime un separador.
+    lista_ordenada_grande = list(range(5000)) # Con el pivote clásico esto causaría RecursionError.
+    quick_sort(lista_ordenada_grande, mode="introsort") # Introsort no usa recursión.
+    print(f"Primeros elementos (Introsort): {lista_ordenada_grande[:10]}") # Imprime los primeros elementos.
+    lista_duplicados = [3, 1, 2] * 2000 # Muchos duplicados: la partición en tres vías los resuelve de golpe.
+    quick_sort(lista_duplicados, mode="introsort") # Ordena con Introsort.
+    print(f"Primeros y últimos (Introsort): {lista_duplicados[:5]} ... {lista_duplicados[-5:]}") # Imprime el resultado.
+
+    print("\n--- Ejemplo con key= y reverse= ---") # Imprime un separador.
+    palabras = ["pera", "Uva", "kiwi", "Banana", "higo"] # Palabras con mayúsculas y minúsculas.
+    quick_sort(palabras, mode="introsort", key=str.lower, reverse=True) # Sin distinguir mayúsculas, descendente.
+    print(f"Por str.lower, descendente: {palabras}") # Imprime el resultado.
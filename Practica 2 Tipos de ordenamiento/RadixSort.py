@@ -1,10 +1,22 @@
-def counting_sort_for_radix(arr, exp): # Función auxiliar para Counting Sort, adaptada para Radix Sort.
+try: # NumPy es opcional: solo lo necesita el motor vectorizado (radix_sort_numpy).
+    import numpy as np
+except ImportError: # Sin NumPy, el motor de Python puro sigue funcionando.
+    np = None
+
+from BufferSupport import allocate_like, as_sequence, is_typed_buffer # Entradas con protocolo de buffer.
+from KeySupport import sort_with_key # Interfaz común key=/reverse=.
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1 # Rango que NumPy puede representar sin objetos.
+
+def counting_sort_for_radix(arr, exp, values=None): # Función auxiliar para Counting Sort, adaptada para Radix Sort.
     """
     Realiza un Counting Sort en 'arr' basado en el dígito representado por 'exp'.
     'exp' es un exponente de 10 (ej: 1 para unidades, 10 para decenas, 100 para centenas).
+    Si se da 'values', 'arr' son las claves y cada valor se coloca junto a su clave.
     """
     n = len(arr) # Obtiene la longitud de la lista.
-    output = [0] * n # Crea una lista 'output' del mismo tamaño para almacenar los elementos ordenados por el dígito actual.
+    output = allocate_like(arr, n) # Crea un buffer 'output' del mismo tamaño (y tipo) para almacenar los elementos ordenados por el dígito actual.
+    output_values = allocate_like(values, n) if values is not None else None # Mismo tipo que los valores (lista o buffer).
     count = [0] * 10 # Crea una lista 'count' de tamaño 10 (para dígitos del 0 al 9), inicializada a ceros.
 
     # Paso 1: Cuenta las ocurrencias de cada dígito en la posición actual.
@@ -23,19 +35,62 @@ def counting_sort_for_radix(arr, exp): # Función auxiliar para Counting Sort, a
     while i >= 0: # Mientras no se haya procesado toda la lista.
         index = (arr[i] // exp) % 10 # Calcula el dígito actual del número.
         output[count[index] - 1] = arr[i] # Coloca el número en su posición correcta en 'output'.
+        if output_values is not None: # El valor va a la misma posición que su clave.
+            output_values[count[index] - 1] = values[i]
         count[index] -= 1 # Decrementa el contador para ese dígito (para el siguiente número con el mismo dígito).
         i -= 1 # Mueve al siguiente número en 'arr'.
 
     # Paso 4: Copia los elementos ordenados del 'output' de vuelta a 'arr'.
-    for i in range(n): # Itera sobre la lista.
-        arr[i] = output[i] # Actualiza la lista original con los elementos ordenados por el dígito actual.
+    arr[:] = output # Actualiza la lista original con los elementos ordenados por el dígito actual (copia en bloque).
+    if values is not None:
+        values[:] = output_values
 
-def radix_sort(arr): # Define la función principal para el Ordenamiento Radix.
+def radix_sort(arr, engine="python", key=None, reverse=False, values=None): # Define la función principal para el Ordenamiento Radix.
     """
     Ordena una lista de números enteros no negativos utilizando el algoritmo de Radix Sort.
+
+    Con engine="numpy" usa el motor vectorizado (radix_sort_numpy), que además acepta
+    enteros negativos y flotantes; el resultado se escribe de vuelta en 'arr'. Una lista
+    debe ser solo de enteros de 64 bits o solo de flotantes (TypeError si mezcla tipos).
+
+    Con key= se ordenan elementos cualesquiera por una clave numérica (entera no negativa con
+    el motor "python"; entera o flotante con "numpy"). Las claves se calculan una sola vez y
+    los dígitos se extraen de ellas, moviendo cada elemento junto con su clave.
+    reverse=True ordena de mayor a menor. Con values= (solo motor "python"), 'arr' son las
+    claves ya calculadas y 'values' se mueve a la par (ver KeySupport.py).
+
+    'arr' puede ser una lista o cualquier buffer escribible (array.array, memoryview, NumPy,
+    mmap...; ver BufferSupport.py): se ordena en su lugar, y el motor "numpy" trabaja sobre
+    una vista de NumPy de la misma memoria, sin copiarla.
+
+    Estable: sí (cada pasada es un counting sort estable).
     """
-    if not arr: # Si la lista está vacía, no hay nada que ordenar.
-        return [] # Retorna una lista vacía.
+    view = as_sequence(arr) # Vista indexable de la entrada, sin copiarla.
+    if view is not arr: # mmap, bytearray u otro buffer: se ordena a través de un memoryview.
+        radix_sort(view, engine, key, reverse, values)
+        return arr
+    if key is not None or reverse: # Con clave u orden inverso se usa la interfaz común (ver KeySupport.py).
+        if engine not in ("python", "numpy"):
+            raise ValueError("Motor no válido. Use 'python' o 'numpy'.")
+        keyed_sort = _radix_sort_numpy_keyed if engine == "numpy" else _radix_sort_keyed
+        return sort_with_key(arr, key, reverse, lambda data: radix_sort(data, engine), keyed_sort)
+    if engine == "numpy" and values is not None: # El motor NumPy ordena por permutación (_radix_sort_numpy_keyed).
+        raise ValueError("values= solo está disponible con el motor 'python'.")
+    if engine == "numpy": # Motor vectorizado con dígitos de 8 bits.
+        # Un buffer tipado se ordena a través de una vista de NumPy sobre su misma memoria.
+        typed = is_typed_buffer(arr)
+        if not typed: # Una lista (o UserList) se convierte a un arreglo: solo si no cambia ningún valor.
+            _check_numpy_list(arr)
+        target = np.asarray(arr) if typed and np is not None else arr
+        result = radix_sort_numpy(target) # Ordena (in-place si 'target' es un arreglo de NumPy).
+        if result is not target: # Si 'arr' era una lista, se actualiza con el resultado.
+            arr[:] = result.tolist() # Copia los valores ordenados de vuelta a la lista.
+        return arr # Retorna la lista ordenada.
+    if engine != "python": # Cualquier otro motor es un error.
+        raise ValueError("Motor no válido. Use 'python' o 'numpy'.")
+
+    if len(arr) == 0: # Si la lista está vacía, no hay nada que ordenar.
+        return arr # Retorna la lista vacía.
 
     # Encuentra el número máximo para saber cuántos dígitos procesar.
     max_val = max(arr) # Encuentra el valor más grande en la lista.
@@ -44,15 +99,155 @@ def radix_sort(arr): # Define la función principal para el Ordenamiento Radix.
     # 'exp' representa 10^0, 10^1, 10^2, ... para acceder a los dígitos de unidades, decenas, centenas, etc.
     exp = 1 # Inicializa el exponente (para las unidades).
     while max_val // exp > 0: # Mientras haya dígitos para procesar (es decir, el número máximo dividido por exp es mayor que 0).
-        counting_sort_for_radix(arr, exp) # Llama a Counting Sort para ordenar por el dígito actual.
+        counting_sort_for_radix(arr, exp, values) # Llama a Counting Sort para ordenar por el dígito actual.
         exp *= 10 # Pasa al siguiente dígito (decenas, centenas, etc.).
 
     return arr # Retorna la lista con los números ya ordenados.
 
----
-### Ejemplo de Uso
+def _radix_sort_keyed(keys, values): # Radix Sort LSD en base 10 sobre 'keys', moviendo 'values' a la par.
+    radix_sort(keys, values=values)
+    return values
+
+def _numpy_exact(values): # ¿Convertir 'values' a un arreglo de NumPy conserva todos los valores?
+    """
+    np.asarray convierte una lista mixta de enteros y flotantes a float64 sin avisar:
+    [3, 1.5, 2] volvería como [1.5, 2.0, 3.0] y 2**53 + 1 perdería precisión. Solo es
+    exacta si todos son enteros de 64 bits (ni bool ni enteros más grandes) o todos flotantes.
+    """
+    return (all(isinstance(value, float) for value in values)
+            or all(type(value) is int and INT64_MIN <= value <= INT64_MAX for value in values))
+
+def _check_numpy_list(values): # Una lista solo pasa por NumPy si convertirla no altera ningún valor.
+    if not _numpy_exact(values):
+        raise TypeError("El motor 'numpy' necesita una lista solo de enteros de 64 bits o solo de flotantes.")
+
+def _radix_sort_numpy_keyed(keys, values): # Motor NumPy con claves: ordena 'values' por la permutación de 'keys'.
+    if isinstance(keys, list):
+        _check_numpy_list(keys)
+    order = radix_argsort_numpy(keys)
+    if not is_typed_buffer(values): # Lista (o UserList): se reordena con una comprensión.
+        values[:] = [values[i] for i in order.tolist()]
+    else: # Buffer tipado: se permuta a través de una vista de NumPy sobre la misma memoria.
+        view = np.asarray(values)
+        view[:] = view[order]
+    return values
+
+def _unsigned_keys(values): # Convierte los valores en claves sin signo que conservan el orden.
+    """
+    Transforma 'values' (enteros con o sin signo, flotantes IEEE o booleanos) en claves
+    enteras sin signo del mismo ancho cuyo orden natural es el orden de los valores.
+    Retorna (claves, función inversa que recupera los valores originales).
+    """
+    dtype = values.dtype # Tipo original de los datos.
+    bits = dtype.itemsize * 8 # Ancho de la clave en bits.
+    udtype = np.dtype(f"u{dtype.itemsize}") # Entero sin signo del mismo ancho.
+    sign = udtype.type(1 << (bits - 1)) # Bit de signo.
+    top = udtype.type(bits - 1) # Desplazamiento hasta el bit de signo.
+
+    if dtype.kind in "ub": # Sin signo (o booleano): ya están en orden.
+        return values.view(udtype), lambda keys: keys.view(dtype)
+
+    if dtype.kind == "i": # Con signo: invertir el bit de signo pone los negativos primero.
+        return values.view(udtype) ^ sign, lambda keys: (keys ^ sign).view(dtype)
+
+    if dtype.kind == "f": # Flotantes IEEE: los negativos invierten todos sus bits, los positivos solo el signo.
+        raw = values.view(udtype) # Bits crudos del flotante.
+        all_ones = udtype.type(np.iinfo(udtype).max) # Máscara con todos los bits en 1.
+        keys = raw ^ ((raw >> top) * all_ones | sign) # Aplica la transformación en bloque.
+
+        def restore(keys): # Transformación inversa.
+            return (keys ^ (((keys >> top) ^ udtype.type(1)) * all_ones | sign)).view(dtype)
+        return keys, restore
+
+    raise TypeError(f"Tipo no soportado por radix_sort_numpy: {dtype}") # Objetos, cadenas, complejos, etc.
+
 
-```python
+def radix_sort_numpy(arr, digit_bits=8): # Motor vectorizado de Radix Sort (LSD) con NumPy.
+    """
+    Ordena enteros (con o sin signo) y flotantes IEEE con Radix Sort LSD vectorizado.
+
+    Cada pasada procesa un dígito de 'digit_bits' bits (8 o 16) para todo el arreglo a la vez:
+    el conteo y la dispersión estable del counting sort se hacen con operaciones de NumPy
+    (bincount y argsort estable, que para dígitos de 8/16 bits es a su vez un counting sort).
+    Una clave de 32 bits necesita 4 pasadas con dígitos de 8 bits (2 con 16 bits) en lugar de
+    hasta 10 pasadas en base 10, y las pasadas cuyo dígito es igual en todos los elementos se
+    omiten. Los NaN quedan al final (o al inicio si tienen el bit de signo activo).
+
+    Args:
+        arr: Un arreglo de NumPy (se ordena in-place) o cualquier secuencia de números.
+        digit_bits: Ancho de cada dígito en bits: 8 o 16.
+
+    Returns:
+        El arreglo ordenado: 'arr' mismo si era un arreglo de NumPy, o uno nuevo en otro caso.
+    """
+    if np is None: # El motor vectorizado depende de NumPy.
+        raise ImportError("radix_sort_numpy necesita NumPy (pip install numpy).")
+    if digit_bits not in (8, 16): # Solo se admiten dígitos que caben en uint8/uint16.
+        raise ValueError("digit_bits debe ser 8 o 16.")
+
+    values = arr if isinstance(arr, np.ndarray) else np.asarray(arr) # Evita copiar si ya es un arreglo.
+    flat = values.reshape(-1) # Vista unidimensional de los datos.
+    if flat.size <= 1: # 0 o 1 elemento: ya está ordenado.
+        return values
+
+    keys, restore = _unsigned_keys(flat) # Claves sin signo que conservan el orden.
+    digit_bits = min(digit_bits, keys.dtype.itemsize * 8) # Una clave de 8 bits es un solo dígito.
+    radix = 1 << digit_bits # Número de cubetas por dígito (256 o 65536).
+    digit_dtype = np.uint8 if digit_bits == 8 else np.uint16 # Tipo compacto para los dígitos.
+    mask = keys.dtype.type(radix - 1) # Máscara para extraer un dígito.
+
+    for shift in range(0, keys.dtype.itemsize * 8, digit_bits): # Del dígito menos significativo al más significativo.
+        digits = ((keys >> keys.dtype.type(shift)) & mask).astype(digit_dtype) # Dígito actual de todos los elementos.
+        counts = np.bincount(digits, minlength=radix) # Paso de conteo del counting sort.
+        if counts.max() == flat.size: # Todos comparten este dígito: la pasada no cambiaría nada.
+            continue
+        keys = keys[np.argsort(digits, kind="stable")] # Dispersión estable por el dígito actual.
+
+    sorted_values = restore(keys) # Recupera los valores originales ya ordenados.
+    if values is arr: # Si la entrada era un arreglo de NumPy, se ordena in-place.
+        flat[...] = sorted_values
+        return arr
+    return sorted_values # Para otras secuencias, retorna un arreglo nuevo.
+
+def radix_argsort_numpy(keys, digit_bits=8): # Permutación estable que ordena 'keys', con Radix Sort LSD.
+    """
+    Como radix_sort_numpy, pero retorna los índices que ordenan 'keys' (como np.argsort estable)
+    en lugar de ordenar los datos; sirve para ordenar otros datos según estas claves.
+
+    Args:
+        keys: Secuencia o arreglo de NumPy de claves enteras o flotantes.
+        digit_bits: Ancho de cada dígito en bits: 8 o 16.
+
+    Returns:
+        Un arreglo de índices (np.intp) tal que keys[order] está ordenado.
+    """
+    if np is None: # El motor vectorizado depende de NumPy.
+        raise ImportError("radix_argsort_numpy necesita NumPy (pip install numpy).")
+    if digit_bits not in (8, 16): # Solo se admiten dígitos que caben en uint8/uint16.
+        raise ValueError("digit_bits debe ser 8 o 16.")
+
+    flat = np.asarray(keys).reshape(-1) # Vista unidimensional de las claves.
+    order = np.arange(flat.size) # Permutación actual (identidad).
+    if flat.size <= 1:
+        return order
+
+    ukeys, _ = _unsigned_keys(flat) # Claves sin signo que conservan el orden.
+    digit_bits = min(digit_bits, ukeys.dtype.itemsize * 8)
+    radix = 1 << digit_bits
+    digit_dtype = np.uint8 if digit_bits == 8 else np.uint16
+    mask = ukeys.dtype.type(radix - 1)
+
+    for shift in range(0, ukeys.dtype.itemsize * 8, digit_bits): # Mismas pasadas que radix_sort_numpy.
+        digits = ((ukeys >> ukeys.dtype.type(shift)) & mask).astype(digit_dtype)
+        counts = np.bincount(digits, minlength=radix)
+        if counts.max() == flat.size: # Dígito común a todos: se omite la pasada.
+            continue
+        permutation = np.argsort(digits, kind="stable")
+        ukeys = ukeys[permutation] # Las claves y la permutación se mueven a la par.
+        order = order[permutation]
+    return order
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
 if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
     lista_desordenada = [170, 45, 75, 90, 802, 24, 2, 66] # Crea una lista de ejemplo desordenada.
     print(f"Lista desordenada: {lista_desordenada}") # Imprime la lista original.
@@ -83,3 +278,19 @@ if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute
     print(f"Lista desordenada: {lista_mixta}") # Imprime la lista mixta.
     radix_sort(lista_mixta) # Ordena la lista mixta.
     print(f"Lista ordenada (Radix Sort): {lista_mixta}") # Imprime la lista mixta ordenada.
+
+
+    print("\n--- Ejemplo con el motor vectorizado (negativos y flotantes) ---") # Imprime un separador.
+    if np is not None: # Solo si NumPy está instalado.
+        lista_con_negativos = [170, -45, 75, -90, 802, 24, -2, 66] # Enteros con signo.
+        radix_sort(lista_con_negativos, engine="numpy") # El motor de NumPy admite negativos.
+        print(f"Lista ordenada (Radix Sort NumPy): {lista_con_negativos}") # Imprime la lista ordenada.
+
+        flotantes = np.array([3.5, -1.25, 0.0, -0.0, 2.75, -100.5, 1e-9], dtype=np.float64) # Flotantes IEEE.
+        radix_sort_numpy(flotantes, digit_bits=16) # Ordena in-place con dígitos de 16 bits.
+        print(f"Flotantes ordenados (Radix Sort NumPy): {flotantes}") # Imprime los flotantes ordenados.
+
+    print("\n--- Ejemplo con key= y reverse= ---") # Imprime un separador.
+    productos = [("lápiz", 120), ("cuaderno", 950), ("goma", 80), ("regla", 120)] # (producto, precio en centavos).
+    radix_sort(productos, key=lambda p: p[1], reverse=True) # Por precio, de mayor a menor (estable).
+    print(f"Por precio, descendente: {productos}") # 'lápiz' sigue antes que 'regla'.
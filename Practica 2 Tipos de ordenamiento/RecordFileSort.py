@@ -0,0 +1,221 @@
+# Ordenamiento in-place de archivos de registros binarios de ancho fijo, sin cargarlos en memoria.
+#
+# El archivo se proyecta en memoria con mmap y sus registros (por ejemplo, structs de 16 bytes
+# con una clave de 8 bytes y un dato de 8) se ordenan por un campo clave con Radix Sort LSD
+# de base 256: una pasada estable por cada byte de la clave, del menos al más significativo,
+# con la misma estructura que counting_sort_for_radix (contar, acumular, colocar).
+#
+# El buffer 'output' de cada pasada es un archivo auxiliar del mismo tamaño, también
+# proyectado con mmap: las pasadas alternan entre el archivo y el auxiliar, así que ordenar
+# un archivo de varios GB no necesita memoria residente proporcional a su tamaño ni crea un
+# objeto de Python por registro (el sistema operativo pagina los datos según hagan falta).
+#
+#   - Los conteos de todos los bytes de la clave se calculan en una sola lectura inicial: la
+#     posición de un registro cambia entre pasadas, pero sus bytes no.
+#   - Las pasadas en las que todos los registros comparten el byte se omiten (por ejemplo,
+#     los bytes altos de claves pequeñas).
+#   - Motor "numpy": cada pasada recorre el archivo por bloques de 'chunk_records' registros
+#     y los coloca con indexación vectorizada. Motor "python": un registro a la vez, más
+#     lento pero sin dependencias.
+
+import mmap
+import os
+import tempfile
+import traceback
+
+try: # NumPy es opcional: acelera las pasadas, pero el motor de Python funciona sin él.
+    import numpy as np
+except ImportError:
+    np = None
+
+CHUNK_RECORDS = 1 << 16 # Registros por bloque en el motor de NumPy (acota la memoria por pasada).
+RADIX = 256 # Cada pasada ordena por un byte de la clave.
+
+
+def _digit_positions(key_offset, key_size, byteorder): # Posición en el registro de cada byte, del menos significativo al más.
+    if byteorder == "little":
+        return [key_offset + d for d in range(key_size)]
+    return [key_offset + key_size - 1 - d for d in range(key_size)]
+
+
+def _count_digits_python(src, n, record_size, positions, signed): # Conteos de todos los bytes en una sola lectura.
+    counts = [[0] * RADIX for _ in positions]
+    top = len(positions) - 1
+    for i in range(n):
+        base = i * record_size
+        for d, position in enumerate(positions):
+            digit = src[base + position]
+            if signed and d == top: # Invertir el bit de signo ordena los negativos antes que los positivos.
+                digit ^= 0x80
+            counts[d][digit] += 1
+    return counts
+
+
+def _pass_python(src, dst, n, record_size, position, flip, count): # Una pasada de Counting Sort por un byte.
+    count = list(count) # Copia: los conteos de la lectura inicial no se modifican.
+
+    # Paso 2: Suma acumulativa para obtener la posición final de cada byte (igual que counting_sort_for_radix).
+    for i in range(1, RADIX):
+        count[i] += count[i - 1]
+
+    # Paso 3: Coloca cada registro completo desde el final, para que la pasada sea estable.
+    # Las rebanadas de un memoryview no copian los datos: cada registro se copia directamente
+    # de un mmap al otro, sin crear un bytes por registro.
+    with memoryview(src) as source, memoryview(dst) as output:
+        i = n - 1
+        while i >= 0:
+            base = i * record_size
+            digit = source[base + position] ^ flip
+            count[digit] -= 1
+            target = count[digit] * record_size
+            output[target:target + record_size] = source[base:base + record_size] # Copia del registro.
+            i -= 1
+
+
+def _count_digits_numpy(src, n, record_size, positions, signed, chunk_records):
+    records = np.frombuffer(src, dtype=np.uint8).reshape(n, record_size) # Vista sobre el mmap, sin copiar.
+    counts = np.zeros((len(positions), RADIX), dtype=np.int64)
+    for lo in range(0, n, chunk_records):
+        block = records[lo:lo + chunk_records]
+        for d, position in enumerate(positions):
+            counts[d] += np.bincount(block[:, position], minlength=RADIX)
+    if signed:
+        counts[-1] = np.roll(counts[-1], -128) # Mismo efecto que invertir el bit de signo de cada byte.
+    return counts
+
+
+def _pass_numpy(src, dst, n, record_size, position, flip, count, chunk_records):
+    source = np.frombuffer(src, dtype=np.uint8).reshape(n, record_size)
+    target = np.frombuffer(dst, dtype=np.uint8).reshape(n, record_size)
+    starts = np.zeros(RADIX, dtype=np.int64) # Siguiente posición libre para cada byte.
+    np.cumsum(count[:-1], out=starts[1:])
+    for lo in range(0, n, chunk_records):
+        block = source[lo:lo + chunk_records]
+        digits = block[:, position] ^ np.uint8(flip)
+        order = np.argsort(digits, kind="stable") # Estable: los registros del bloque conservan su orden.
+        ordered = digits[order]
+        block_counts = np.bincount(digits, minlength=RADIX)
+        block_starts = np.cumsum(block_counts) - block_counts # Inicio de cada byte dentro del bloque ordenado.
+        destinations = starts[ordered] + (np.arange(ordered.size) - block_starts[ordered])
+        target[destinations] = block[order]
+        starts += block_counts
+
+
+def sort_record_file(path, record_size, key_offset=0, key_size=8, byteorder="little", signed=False,
+                     engine=None, temp_dir=None, chunk_records=CHUNK_RECORDS): # Ordena un archivo de registros en su lugar.
+    """
+    Ordena in-place los registros de ancho fijo de 'path' por el campo entero que ocupa
+    los bytes [key_offset, key_offset + key_size) de cada registro. Los registros se mueven
+    completos (clave y resto de los datos) y el ordenamiento es estable.
+
+    Args:
+        path: Archivo binario cuyo tamaño es múltiplo de 'record_size'.
+        record_size: Bytes de cada registro.
+        key_offset: Posición de la clave dentro del registro.
+        key_size: Bytes de la clave (una pasada por byte).
+        byteorder: "little" o "big", como en int.from_bytes.
+        signed: Si es True, la clave es un entero con signo en complemento a dos.
+        engine: "numpy" o "python"; por defecto "numpy" si está instalado.
+        temp_dir: Directorio del archivo auxiliar (por defecto, el mismo que 'path', para que
+                  esté en el mismo disco).
+        chunk_records: Registros por bloque en el motor de NumPy.
+
+    Returns:
+        dict: records (número de registros), passes (pasadas realizadas), skipped_passes
+              (bytes de la clave iguales en todos los registros) y copied_back (True si el
+              resultado quedó en el archivo auxiliar y se copió de vuelta).
+    """
+    if engine is None:
+        engine = "numpy" if np is not None else "python"
+    if engine not in ("numpy", "python"):
+        raise ValueError("Motor no válido. Use 'numpy' o 'python'.")
+    if engine == "numpy" and np is None:
+        raise ImportError("El motor 'numpy' necesita NumPy (pip install numpy).")
+    if byteorder not in ("little", "big"):
+        raise ValueError("'byteorder' debe ser 'little' o 'big'.")
+    if record_size <= 0 or key_size <= 0 or key_offset < 0 or key_offset + key_size > record_size:
+        raise ValueError("La clave debe caber dentro del registro.")
+    if chunk_records <= 0:
+        raise ValueError("'chunk_records' debe ser positivo.")
+
+    size = os.path.getsize(path)
+    if size % record_size:
+        raise ValueError(f"El tamaño del archivo ({size} bytes) no es múltiplo de {record_size}.")
+    n = size // record_size
+    stats = {"records": n, "passes": 0, "skipped_passes": 0, "copied_back": False}
+    if n <= 1: # Nada que ordenar (y mmap no admite archivos vacíos).
+        stats["skipped_passes"] = key_size
+        return stats
+
+    positions = _digit_positions(key_offset, key_size, byteorder)
+    scratch_fd, scratch_path = tempfile.mkstemp(prefix="record_sort_", suffix=".tmp",
+                                                dir=temp_dir or os.path.dirname(os.path.abspath(path)))
+    try:
+        with open(path, "r+b") as data_file, os.fdopen(scratch_fd, "r+b") as scratch_file:
+            scratch_file.truncate(size) # El buffer de salida: un archivo del mismo tamaño, no memoria.
+            data = mmap.mmap(data_file.fileno(), size)
+            scratch = mmap.mmap(scratch_file.fileno(), size)
+            try:
+                if engine == "numpy":
+                    counts = _count_digits_numpy(data, n, record_size, positions, signed, chunk_records)
+                else:
+                    counts = _count_digits_python(data, n, record_size, positions, signed)
+
+                src, dst = data, scratch
+                for d, position in enumerate(positions):
+                    if max(counts[d]) == n: # Todos los registros tienen el mismo byte: la pasada no cambia nada.
+                        stats["skipped_passes"] += 1
+                        continue
+                    flip = 0x80 if signed and d == key_size - 1 else 0
+                    if engine == "numpy":
+                        _pass_numpy(src, dst, n, record_size, position, flip, counts[d], chunk_records)
+                    else:
+                        _pass_python(src, dst, n, record_size, position, flip, counts[d])
+                    src, dst = dst, src # La salida de esta pasada es la entrada de la siguiente.
+                    stats["passes"] += 1
+
+                if src is scratch: # Número impar de pasadas: el resultado está en el archivo auxiliar.
+                    step = chunk_records * record_size
+                    for lo in range(0, size, step): # Copia por bloques, sin cargar el archivo completo.
+                        data[lo:lo + step] = scratch[lo:lo + step]
+                    stats["copied_back"] = True
+                data.flush()
+            except BaseException as error:
+                # Los frames del traceback aún guardan las vistas de NumPy sobre los mmap, y con
+                # vistas vivas close() lanza BufferError y oculta el error original: se liberan.
+                traceback.clear_frames(error.__traceback__)
+                raise
+            finally:
+                data.close()
+                scratch.close()
+    finally:
+        # El archivo auxiliar se elimina incluso si algo falla a mitad del proceso.
+        os.remove(scratch_path)
+    return stats
+
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
+if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
+    import random
+    import shutil
+    import struct
+
+    registro = struct.Struct("<QQ") # 16 bytes: clave de 8 bytes little-endian y dato de 8 bytes.
+    demo_dir = tempfile.mkdtemp(prefix="record_sort_demo_")
+    try:
+        archivo = os.path.join(demo_dir, "registros.bin")
+        claves = [random.randint(0, 10**6) for _ in range(100000)]
+        with open(archivo, "wb") as f: # El dato de cada registro es su posición original.
+            for i, clave in enumerate(claves):
+                f.write(registro.pack(clave, i))
+
+        estadisticas = sort_record_file(archivo, record_size=16, key_offset=0, key_size=8)
+        print(f"Estadísticas: {estadisticas}") # Los 5 bytes altos de claves <= 10⁶ son cero: se omiten.
+
+        with open(archivo, "rb") as f:
+            resultado = [registro.unpack(bloque) for bloque in iter(lambda: f.read(16), b"")]
+        print(f"¿Registros ordenados por clave? {[r[0] for r in resultado] == sorted(claves)}")
+        print(f"¿Estable? {all(a[1] < b[1] for a, b in zip(resultado, resultado[1:]) if a[0] == b[0])}")
+        print(f"Primeros 5 registros: {resultado[:5]}")
+    finally:
+        shutil.rmtree(demo_dir, ignore_errors=True)
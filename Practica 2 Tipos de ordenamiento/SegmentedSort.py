@@ -0,0 +1,192 @@
+try: # NumPy es obligatorio para este módulo, pero se importa igual que en el resto de la carpeta.
+    import numpy as np
+except ImportError: # Sin NumPy, las funciones lanzan ImportError al llamarse.
+    np = None
+
+from RadixSort import _unsigned_keys # Claves sin signo que conservan el orden (enteros, flotantes, booleanos).
+
+NETWORK_MAX_WIDTH = 16 # Hasta este ancho de segmento, la red de transposición par-impar gana a lexsort.
+
+
+def _segment_layout(values, offsets): # Valida el formato plano y calcula el segmento de cada posición.
+    """
+    Returns:
+        tuple: (values, offsets, segment_ids) como arreglos de NumPy, donde segment_ids[i]
+               es el número de segmento de values[i].
+    """
+    if np is None: # Todo el módulo depende de NumPy.
+        raise ImportError("SegmentedSort necesita NumPy (pip install numpy).")
+    values = np.asarray(values)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if values.ndim != 1 or offsets.ndim != 1:
+        raise ValueError("'values' y 'offsets' deben ser arreglos de una dimensión.")
+    if offsets.size == 0 or offsets[0] != 0 or offsets[-1] != values.size:
+        raise ValueError("'offsets' debe empezar en 0 y terminar en len(values).")
+    lengths = np.diff(offsets) # Longitud de cada segmento.
+    if (lengths < 0).any():
+        raise ValueError("'offsets' debe ser no decreciente.")
+    segment_ids = np.repeat(np.arange(lengths.size, dtype=np.int64), lengths)
+    return values, offsets, segment_ids
+
+
+def segmented_argsort(values, offsets): # Permutación que ordena cada segmento por separado.
+    """
+    Retorna el índice (global) que ordena values[offsets[s]:offsets[s + 1]] para cada
+    segmento s a la vez: values[order] es el resultado de segmented_sort. Sirve para mover
+    en tándem otros arreglos con el mismo formato (por ejemplo, los eventos de cada ventana).
+
+    Es una sola llamada a np.lexsort sobre la clave compuesta (segmento, valor): el
+    segmento es la clave principal, así que los elementos nunca salen de su segmento.
+
+    Args:
+        values: Arreglo plano con todos los segmentos concatenados.
+        offsets: Arreglo de m + 1 posiciones: el segmento s es values[offsets[s]:offsets[s + 1]].
+
+    Returns:
+        numpy.ndarray: La permutación (estable: los iguales conservan su orden).
+    """
+    values, offsets, segment_ids = _segment_layout(values, offsets)
+    return np.lexsort((values, segment_ids)) # La última clave es la principal.
+
+
+def _composite_sort(values, segment_ids, segment_count): # Un solo np.sort sobre la clave segmento·span + valor.
+    """
+    Convierte los valores en claves sin signo que conservan el orden, les resta el mínimo y
+    les antepone el segmento: clave = segmento * span + (valor - mínimo), en un uint64.
+    Ordenar esas claves (un np.sort de enteros, sin índices ni lexsort) ordena cada segmento,
+    y el valor se recupera con el resto de dividir por 'span'.
+
+    Returns:
+        numpy.ndarray: El resultado, o None si segmento y valor no caben juntos en 64 bits.
+    """
+    if values.size == 0:
+        return values.copy()
+    keys, restore = _unsigned_keys(values)
+    low = int(keys.min())
+    span = int(keys.max()) - low + 1 # Valores distintos posibles dentro de un segmento.
+    if segment_count * span >= 1 << 64: # La clave compuesta no cabe en un uint64.
+        return None
+    composite = segment_ids.astype(np.uint64) * np.uint64(span) + (keys - keys.dtype.type(low)).astype(np.uint64)
+    composite.sort()
+    composite %= np.uint64(span)
+    composite += np.uint64(low)
+    return restore(composite.astype(keys.dtype))
+
+
+def _mirror_segments(sorted_values, offsets, segment_ids): # Invierte cada segmento en su lugar.
+    # La posición i del segmento [a, b) pasa a a + b - 1 - i.
+    ends = offsets[:-1] + offsets[1:] - 1
+    return sorted_values[ends[segment_ids] - np.arange(sorted_values.size)]
+
+
+def _network_sort(values, offsets, segment_ids): # Red de transposición par-impar sobre todas las filas a la vez.
+    """
+    Cada segmento se copia a una fila de una matriz de m x ancho máximo (rellenando con el
+    mayor valor del tipo, que queda al final) y se aplican 'ancho' fases de comparar e
+    intercambiar columnas vecinas (pares en las fases pares, impares en las impares) a todas
+    las filas con np.minimum / np.maximum. Con w fases una fila de ancho w queda ordenada.
+    """
+    lengths = np.diff(offsets)
+    width = int(lengths.max()) if lengths.size else 0
+    if width <= 1: # Segmentos de 0 o 1 elemento: ya están ordenados.
+        return values.copy()
+
+    if values.dtype.kind == "f":
+        filler = np.inf
+    elif values.dtype.kind == "b":
+        filler = True
+    else:
+        filler = np.iinfo(values.dtype).max
+    positions = np.arange(values.size) - offsets[:-1][segment_ids] # Columna de cada elemento en su fila.
+    matrix = np.full((lengths.size, width), filler, dtype=values.dtype)
+    matrix[segment_ids, positions] = values
+
+    for phase in range(width):
+        first = phase & 1 # Fase par: columnas (0,1), (2,3)...; fase impar: (1,2), (3,4)...
+        left = matrix[:, first:width - 1:2] # Vistas: escribir en ellas modifica la matriz.
+        right = matrix[:, first + 1:width:2]
+        low = np.minimum(left, right)
+        np.maximum(left, right, out=right)
+        left[...] = low
+
+    return matrix[np.arange(width) < lengths[:, None]] # Solo las celdas reales, en orden de filas.
+
+
+def segmented_sort(values, offsets, method="auto", reverse=False): # Ordena millones de segmentos pequeños de una vez.
+    """
+    Ordena por separado cada segmento de un arreglo plano, en una sola pasada vectorizada y
+    sin crear ningún objeto de Python por segmento (a diferencia de llamar a insertion_sort o
+    sorted sobre cada lista pequeña, donde el costo del intérprete domina).
+
+    Métodos:
+      - "composite": un solo np.sort sobre la clave compuesta segmento·span + valor en 64
+        bits (ver _composite_sort); el más rápido, para números sin NaN cuyo rango,
+        multiplicado por el número de segmentos, cabe en 64 bits.
+      - "lexsort": np.lexsort sobre la clave compuesta (segmento, valor); sirve para
+        cualquier ancho y cualquier tipo ordenable por NumPy (NaN al final de su segmento).
+      - "network": red de transposición par-impar sobre una matriz de m x ancho máximo;
+        O(m·w²) operaciones vectorizadas, más rápida para segmentos estrechos. Solo números
+        sin NaN.
+      - "auto": "composite" si la clave compuesta cabe en 64 bits; si no, "network" si los
+        valores son números sin NaN y ningún segmento supera NETWORK_MAX_WIDTH; si no, "lexsort".
+
+    Args:
+        values: Arreglo plano (o secuencia) con todos los segmentos concatenados.
+        offsets: Arreglo de m + 1 posiciones: el segmento s es values[offsets[s]:offsets[s + 1]].
+        method: "auto", "composite", "lexsort" o "network".
+        reverse: Si es True, cada segmento queda de mayor a menor.
+
+    Returns:
+        numpy.ndarray: Un arreglo nuevo con el mismo formato plano y los segmentos ordenados.
+    """
+    values, offsets, segment_ids = _segment_layout(values, offsets)
+    if method not in ("auto", "composite", "lexsort", "network"):
+        raise ValueError("Método no válido. Use 'auto', 'composite', 'lexsort' o 'network'.")
+    kind = values.dtype.kind
+    numeric = kind in "biuf" and not (kind == "f" and np.isnan(values).any()) # Números sin NaN.
+
+    result = None
+    if method in ("auto", "composite") and numeric:
+        result = _composite_sort(values, segment_ids, offsets.size - 1)
+    if result is None: # La clave compuesta no se pidió o no es aplicable.
+        if method == "composite":
+            raise ValueError("La clave compuesta no cabe en 64 bits (o los valores no son números sin NaN). "
+                             "Use 'lexsort'.")
+        if method == "auto":
+            narrow = offsets.size < 2 or int(np.diff(offsets).max()) <= NETWORK_MAX_WIDTH
+            method = "network" if numeric and narrow else "lexsort"
+        if method == "network":
+            if not numeric:
+                raise ValueError("El método 'network' solo admite números sin NaN. Use 'lexsort'.")
+            result = _network_sort(values, offsets, segment_ids)
+        else:
+            result = values[np.lexsort((values, segment_ids))]
+
+    if reverse: # Orden descendente dentro de cada segmento.
+        result = _mirror_segments(result, offsets, segment_ids)
+    return result
+
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
+if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
+    import time
+
+    # Tres ventanas de eventos de distinto tamaño, concatenadas en un solo arreglo.
+    valores = [5, 1, 4, 9, 7, 8, 3, 2, 6]
+    offsets = [0, 3, 4, 9] # Segmentos: [5, 1, 4], [9] y [7, 8, 3, 2, 6].
+    print(f"Valores: {valores}, offsets: {offsets}") # Imprime la entrada.
+    print(f"Ordenado por segmento (clave compuesta): {segmented_sort(valores, offsets, method='composite').tolist()}")
+    print(f"Ordenado por segmento (lexsort): {segmented_sort(valores, offsets, method='lexsort').tolist()}")
+    print(f"Ordenado por segmento (red par-impar): {segmented_sort(valores, offsets, method='network').tolist()}")
+    print(f"Descendente: {segmented_sort(valores, offsets, reverse=True).tolist()}")
+
+    print("\n--- Un millón de segmentos de 5 a 50 elementos ---") # Imprime un separador.
+    rng = np.random.default_rng(0)
+    longitudes = rng.integers(5, 51, size=1_000_000) # Tamaño de cada ventana.
+    offsets = np.concatenate(([0], np.cumsum(longitudes)))
+    valores = rng.integers(0, 10**9, size=int(offsets[-1]))
+    inicio = time.perf_counter()
+    resultado = segmented_sort(valores, offsets)
+    print(f"{valores.size:,} valores ordenados en {time.perf_counter() - inicio:.2f} s") # Imprime el tiempo.
+    muestra = resultado[offsets[7]:offsets[8]] # Un segmento cualquiera del resultado.
+    print(f"¿Segmento 7 ordenado? {bool((muestra[:-1] <= muestra[1:]).all())}") # Verifica un segmento.
@@ -1,13 +1,28 @@
-def selection_sort(arr): # Define una función llamada selection_sort que toma una lista 'arr' como argumento.
+import heapq # Cola de prioridad acotada para top_k.
+import math # Para el límite de profundidad de la selección introspectiva.
+
+from Inserción import binary_insertion_sort # Caso base para tramos pequeños.
+from KeySupport import sort_with_key # Interfaz común key=/reverse=.
+from QuickSort import INSERTION_SORT_CUTOFF, _choose_pivot, _heap_sort_range, _partition_three_way, introsort
+
+def selection_sort(arr, key=None, reverse=False, values=None): # Define una función llamada selection_sort que toma una lista 'arr' como argumento.
     """
     Ordena una lista de elementos utilizando el algoritmo de Selection Sort. # Docstring: Describe la función.
 
     Args: # Docstring: Describe los argumentos.
         arr: La lista de elementos a ordenar. # Docstring: Especifica el argumento 'arr'.
+        key: Función que extrae la clave de comparación de cada elemento (se calcula una sola vez por elemento). # Docstring: Especifica el argumento 'key'.
+        reverse: Si es True, ordena de mayor a menor. # Docstring: Especifica el argumento 'reverse'.
+        values: Si se da, 'arr' son las claves ya calculadas y 'values' se mueve a la par (ver KeySupport.py). # Docstring: Especifica el argumento 'values'.
 
     Returns: # Docstring: Describe lo que la función retorna.
         La lista ordenada. # Docstring: Especifica que retorna la lista ordenada.
+
+    Estable: no (el intercambio puede saltar por encima de un elemento igual). # Docstring: Indica si el algoritmo es estable.
     """
+    if key is not None or reverse: # Con clave u orden inverso se usa la interfaz común (ver KeySupport.py).
+        return sort_with_key(arr, key, reverse, selection_sort, _selection_sort_keyed)
+
     n = len(arr) # Obtiene la longitud de la lista 'arr' y la guarda en 'n'.
 
     # Recorre toda la lista. El bucle externo es para la posición actual del elemento a ordenar.
@@ -24,9 +39,138 @@ def selection_sort(arr): # Define una función llamada selection_sort que toma u
         # Intercambia el elemento mínimo encontrado con el primer elemento de la parte no ordenada.
         # Esto coloca el elemento mínimo en su posición correcta en la parte ordenada.
         arr[i], arr[min_idx] = arr[min_idx], arr[i] # Realiza el intercambio de los valores.
+        if values is not None: # Mismo intercambio para los valores.
+            values[i], values[min_idx] = values[min_idx], values[i]
 
     return arr # Retorna la lista 'arr' una vez que ha sido completamente ordenada.
 
+def _selection_sort_keyed(keys, values): # Selection Sort sobre 'keys', moviendo 'values' a la par.
+    selection_sort(keys, values=values)
+    return values
+
+# --- Selección parcial ---
+# Cuando solo se necesitan los k menores (o mayores) o una mediana, no hace falta ordenar todo.
+
+def top_k(arr, k, key=None, reverse=False): # Los k menores (o mayores) elementos, ordenados.
+    """
+    Retorna los k elementos menores de 'arr' (los k mayores con reverse=True), ordenados, # Docstring: Describe la función.
+    sin ordenar la entrada: recorre los datos una sola vez manteniendo una cola de prioridad
+    de a lo sumo k elementos (heapq.nsmallest / heapq.nlargest), en O(n log k) y con O(k)
+    memoria extra. Acepta cualquier iterable (también generadores o archivos).
+
+    Args: # Docstring: Describe los argumentos.
+        arr: Los elementos (no se modifican). # Docstring: Especifica el argumento 'arr'.
+        k: Cuántos elementos retornar (si k >= n se retornan todos, ordenados). # Docstring: Especifica el argumento 'k'.
+        key: Función que extrae la clave de comparación de cada elemento. # Docstring: Especifica el argumento 'key'.
+        reverse: Si es True, retorna los k mayores, de mayor a menor. # Docstring: Especifica el argumento 'reverse'.
+
+    Returns: # Docstring: Describe lo que la función retorna.
+        Una lista nueva con los k elementos seleccionados. # Docstring: Especifica lo que retorna.
+
+    Estable: sí (entre iguales se conserva el orden de la entrada). # Docstring: Indica si el algoritmo es estable.
+    """
+    if k <= 0: # Nada que seleccionar.
+        return []
+    if reverse:
+        return heapq.nlargest(k, arr, key=key)
+    return heapq.nsmallest(k, arr, key=key)
+
+def nth_element(arr, k, key=None, reverse=False): # Selección in-place del k-ésimo elemento (quickselect).
+    """
+    Reordena 'arr' in-place para que arr[k] sea el elemento que ocuparía esa posición si la # Docstring: Describe la función.
+    lista estuviera ordenada, con arr[:k] <= arr[k] <= arr[k + 1:] (sin ordenar cada lado).
+    Por ejemplo, nth_element(arr, len(arr) // 2) deja la mediana en el centro.
+
+    Usa selección introspectiva (introselect): quickselect con el pivote y la partición en
+    tres vías de Introsort, que solo sigue el lado que contiene k, en O(n) en promedio. Si
+    la profundidad supera 2*log2(n) (particiones malas, datos adversos), el tramo restante
+    se termina con HeapSort, así que el peor caso queda acotado en O(n log n).
+
+    Args: # Docstring: Describe los argumentos.
+        arr: La lista a reordenar. # Docstring: Especifica el argumento 'arr'.
+        k: Posición buscada; acepta índices negativos, como las listas. # Docstring: Especifica el argumento 'k'.
+        key: Función que extrae la clave de comparación de cada elemento. # Docstring: Especifica el argumento 'key'.
+        reverse: Si es True, el orden es de mayor a menor (arr[k] es el k-ésimo mayor). # Docstring: Especifica el argumento 'reverse'.
+
+    Returns: # Docstring: Describe lo que la función retorna.
+        La lista 'arr'. # Docstring: Especifica lo que retorna.
+
+    Raises: # Docstring: Describe los errores.
+        IndexError: Si k está fuera de rango. # Docstring: Especifica el error.
+    """
+    n = len(arr)
+    if k < 0: # Índice negativo: se cuenta desde el final.
+        k += n
+    if not 0 <= k < n:
+        raise IndexError("Posición fuera de rango.")
+    target = n - 1 - k if reverse else k # Con reverse, los datos se invierten antes y después (ver KeySupport.py).
+    if key is not None or reverse:
+        return sort_with_key(arr, key, reverse, lambda data: _introselect(data, target, 0, n),
+                             lambda keys, values: _introselect(keys, target, 0, n, values))
+    return _introselect(arr, k, 0, n)
+
+def partial_sort(arr, k, key=None, reverse=False): # Ordena solo las primeras k posiciones.
+    """
+    Reordena 'arr' in-place para que arr[:k] contenga los k menores (los k mayores con # Docstring: Describe la función.
+    reverse=True) en orden, y el resto quede en cualquier orden: nth_element separa los k
+    primeros y luego solo esos k se ordenan con Introsort, en O(n + k log k).
+
+    Args: # Docstring: Describe los argumentos.
+        arr: La lista a reordenar. # Docstring: Especifica el argumento 'arr'.
+        k: Cuántas posiciones ordenar (si k >= n se ordena toda la lista). # Docstring: Especifica el argumento 'k'.
+        key: Función que extrae la clave de comparación de cada elemento. # Docstring: Especifica el argumento 'key'.
+        reverse: Si es True, arr[:k] queda con los k mayores, de mayor a menor. # Docstring: Especifica el argumento 'reverse'.
+
+    Returns: # Docstring: Describe lo que la función retorna.
+        La lista 'arr'. # Docstring: Especifica lo que retorna.
+
+    Estable: no (las particiones intercambian elementos lejanos). # Docstring: Indica si el algoritmo es estable.
+    """
+    if k < 0:
+        raise ValueError("k no puede ser negativo.")
+    n = len(arr)
+    k = min(k, n)
+    # Con reverse, los datos se invierten antes y después (ver KeySupport.py): las k primeras
+    # posiciones del resultado son las k últimas de la lista invertida.
+    start, stop = (n - k, n) if reverse else (0, k)
+    if key is not None or reverse:
+        return sort_with_key(arr, key, reverse, lambda data: _sort_ranks(data, start, stop),
+                             lambda keys, values: _sort_ranks(keys, start, stop, values))
+    return _sort_ranks(arr, start, stop)
+
+def _introselect(arr, k, lo, hi, values=None): # Deja en arr[k] el elemento de rango k de arr[lo:hi], particionando.
+    result = arr if values is None else values # Con claves, el resultado son los valores movidos a la par.
+    if hi - lo <= 1:
+        return result
+    depth = 2 * int(math.log2(hi - lo)) # Particiones permitidas antes de recurrir a HeapSort.
+    while hi - lo > INSERTION_SORT_CUTOFF:
+        if depth == 0: # Demasiadas particiones malas: HeapSort sobre lo que queda.
+            _heap_sort_range(arr, lo, hi, values)
+            return result
+        depth -= 1
+        pivot = arr[_choose_pivot(arr, lo, hi)]
+        lt, gt = _partition_three_way(arr, lo, hi, pivot, values) # arr[lo:lt] < pivote, arr[lt:gt] == pivote, arr[gt:hi] > pivote.
+        if k < lt: # k está entre los menores.
+            hi = lt
+        elif k >= gt: # k está entre los mayores.
+            lo = gt
+        else: # k cayó en la zona de iguales: ya está en su lugar.
+            return result
+    binary_insertion_sort(arr, lo, hi, values=values) # Tramo pequeño: se ordena entero.
+    return result
+
+def _sort_ranks(arr, start, stop, values=None): # Coloca ordenados en arr[start:stop] los elementos de esos rangos.
+    result = arr if values is None else values # Con claves, el resultado son los valores movidos a la par.
+    n = len(arr)
+    if start >= stop:
+        return result
+    if start > 0: # Separa los 'start' menores del resto.
+        _introselect(arr, start, 0, n, values)
+    if stop < n: # Separa los que van hasta 'stop' de los mayores.
+        _introselect(arr, stop - 1, start, n, values)
+    introsort(arr, start, stop, values) # Solo se ordena el tramo pedido.
+    return result
+
 # --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
 if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
     lista_desordenada = [64, 25, 12, 22, 11] # Crea una lista de ejemplo desordenada.
@@ -63,4 +207,15 @@ if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute
     lista_un_elemento = [7] # Crea una lista con un solo elemento.
     print(f"Lista de un solo elemento: {lista_un_elemento}") # Imprime la lista de un solo elemento.
     selection_sort(lista_un_elemento) # Intenta ordenar una lista de un solo elemento.
-    print(f"Lista ordenada (Selection Sort): {lista_un_elemento}") # Imprime la lista de un solo elemento (permanece igual).
\ No newline at end of file
+    print(f"Lista ordenada (Selection Sort): {lista_un_elemento}") # Imprime la lista de un solo elemento (permanece igual).
+
+    print("\n--- Ejemplo de selección parcial ---") # Imprime un separador.
+    import random
+    datos = [random.randint(0, 10**6) for _ in range(100000)] # Muchos datos: ordenarlos todos sería un desperdicio.
+    print(f"Los 5 menores (top_k): {top_k(datos, 5)}") # Cola de prioridad de 5 elementos.
+    print(f"Los 5 mayores (top_k): {top_k(datos, 5, reverse=True)}") # De mayor a menor.
+    mitad = len(datos) // 2
+    nth_element(datos, mitad) # Quickselect: la mediana queda en el centro.
+    print(f"Mediana (nth_element): {datos[mitad]}") # Imprime la mediana.
+    partial_sort(datos, 5) # Solo las 5 primeras posiciones quedan ordenadas.
+    print(f"Primeras 5 posiciones (partial_sort): {datos[:5]}") # Imprime las posiciones ordenadas.
\ No newline at end of file
@@ -0,0 +1,171 @@
+# Códecs para los archivos de tramos (spill files) del ordenamiento externo.
+#
+# En volúmenes de red, cada pasada de ExternalSort.py está limitada por los bytes que se
+# leen y escriben, no por la CPU. Los tramos están ordenados y se comprimen muy bien, así
+# que escribirlos comprimidos reduce los bytes de cada pasada en la misma proporción.
+#
+#   - "raw": el texto de siempre (un registro por línea), solo con el formato por bloques.
+#   - "zlib" / "lzma": el mismo texto, comprimido bloque a bloque con la biblioteca estándar.
+#   - "delta": solo para enteros. Cada bloque guarda el primer valor y luego la diferencia
+#     con el anterior, en varint (7 bits por byte). En un tramo ordenado las diferencias son
+#     pequeñas y casi todas ocupan 1 o 2 bytes, en lugar de un número de ~10 cifras en texto.
+#     Las diferencias pasan por zigzag (0, -1, 1, -2... -> 0, 1, 2, 3...), así que también
+#     funciona con negativos o con datos sin ordenar, solo que comprime menos.
+#
+# Formato por bloques: cada bloque es una cabecera de 8 bytes (tamaño del contenido y número
+# de registros, little-endian) seguida del contenido codificado. read_run descomprime un
+# bloque a la vez, así que una fusión de k tramos solo tiene k bloques en memoria.
+
+import io
+import lzma
+import struct
+import zlib
+
+BLOCK_RECORDS = 4096 # Registros por bloque: más grandes comprimen mejor pero ocupan más memoria al fusionar.
+_HEADER = struct.Struct("<II") # Bytes del contenido y registros del bloque.
+
+
+def _encode_text(records, serialize): # Un registro por línea, igual que write_records.
+    return "".join(serialize(record) + "\n" for record in records).encode()
+
+
+def _decode_text(payload, parse): # Líneas partidas solo en b"\n", igual que read_records al leer un archivo.
+    return [parse(line) for line in io.BytesIO(payload)] # splitlines también partiría en \r, \x0b, \x85...
+
+
+def _zigzag(value): # Entero con signo -> sin signo: 0, -1, 1, -2... -> 0, 1, 2, 3...
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _encode_delta(records, serialize): # 'serialize' no se usa: los enteros se codifican en binario.
+    out = bytearray()
+    previous = 0
+    for record in records:
+        if type(record) is not int:
+            raise ValueError("El códec 'delta' solo admite registros enteros.")
+        value = _zigzag(record - previous) # El primero se guarda entero (diferencia con 0).
+        previous = record
+        while value >= 0x80: # Varint: 7 bits por byte, el bit alto indica que sigue otro byte.
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def _decode_delta(payload, parse): # 'parse' no se usa: los registros ya son enteros.
+    records = []
+    previous = value = shift = 0
+    for byte in payload:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            previous += _unzigzag(value)
+            records.append(previous)
+            value = shift = 0
+    return records
+
+
+CODECS = { # Nombre -> (codificar un bloque, decodificar un bloque).
+    "raw": (_encode_text, _decode_text),
+    "zlib": (lambda records, serialize: zlib.compress(_encode_text(records, serialize), 6),
+             lambda payload, parse: _decode_text(zlib.decompress(payload), parse)),
+    "lzma": (lambda records, serialize: lzma.compress(_encode_text(records, serialize)),
+             lambda payload, parse: _decode_text(lzma.decompress(payload), parse)),
+    "delta": (_encode_delta, _decode_delta),
+}
+
+
+def get_codec(codec): # Retorna las funciones (codificar, decodificar) del códec indicado.
+    try:
+        return CODECS[codec]
+    except KeyError:
+        raise ValueError("Códec no válido. Use 'raw', 'zlib', 'lzma' o 'delta'.") from None
+
+
+def write_run(path, records, codec="raw", serialize=str, block_records=BLOCK_RECORDS, io_buffer_size=1 << 16):
+    """
+    Escribe un tramo en bloques codificados con 'codec'.
+
+    Parameters:
+    path (str): Ruta del archivo del tramo (se sobrescribe).
+    records (iterable): Registros a escribir; se consumen en flujo, un bloque a la vez.
+    codec (str): "raw", "zlib", "lzma" o "delta" (solo enteros).
+    serialize (callable): Convierte cada registro en texto (no se usa con "delta").
+    block_records (int): Registros por bloque.
+    io_buffer_size (int): Tamaño del buffer de escritura del archivo, en bytes.
+
+    Returns:
+    int: El número de bytes escritos (cabeceras incluidas).
+    """
+    encode, _ = get_codec(codec)
+    if block_records <= 0:
+        raise ValueError("El número de registros por bloque debe ser mayor que 0.")
+    records = iter(records)
+    with open(path, "wb", buffering=io_buffer_size) as f:
+        while True:
+            block = []
+            for record in records: # Toma hasta 'block_records' registros sin materializar el tramo.
+                block.append(record)
+                if len(block) == block_records:
+                    break
+            if not block:
+                return f.tell()
+            payload = encode(block, serialize)
+            f.write(_HEADER.pack(len(payload), len(block)))
+            f.write(payload)
+
+
+def read_run(path, codec="raw", parse=int, io_buffer_size=1 << 16):
+    """
+    Lee de forma perezosa un tramo escrito con write_run, descomprimiendo un bloque a la vez.
+
+    Parameters:
+    path (str): Ruta del archivo del tramo.
+    codec (str): El mismo códec con el que se escribió.
+    parse (callable): Convierte cada línea (bytes) en un registro (no se usa con "delta").
+    io_buffer_size (int): Tamaño del buffer de lectura del archivo, en bytes.
+
+    Yields:
+    El siguiente registro del tramo, en el orden en el que se escribió.
+    """
+    _, decode = get_codec(codec)
+    with open(path, "rb", buffering=io_buffer_size) as f:
+        while True:
+            header = f.read(_HEADER.size)
+            if not header:
+                return
+            if len(header) < _HEADER.size:
+                raise ValueError(f"Tramo truncado: cabecera incompleta en {path}.")
+            size, count = _HEADER.unpack(header)
+            payload = f.read(size)
+            if len(payload) < size:
+                raise ValueError(f"Tramo truncado: bloque incompleto en {path}.")
+            block = decode(payload, parse)
+            if len(block) != count:
+                raise ValueError(f"Tramo corrupto: se esperaban {count} registros y se leyeron {len(block)}.")
+            yield from block
+
+
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
+if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
+    import os
+    import random
+    import shutil
+    import tempfile
+
+    demo_dir = tempfile.mkdtemp(prefix="spill_codecs_demo_")
+    try:
+        tramo = sorted(random.randint(0, 10**9) for _ in range(100000)) # Un tramo ordenado típico.
+        for nombre in CODECS:
+            ruta = os.path.join(demo_dir, f"tramo.{nombre}")
+            escritos = write_run(ruta, tramo, codec=nombre)
+            correcto = list(read_run(ruta, codec=nombre)) == tramo
+            print(f"{nombre:>5}: {escritos:>9,} bytes ({escritos / len(tramo):.2f} bytes por registro), "
+                  f"¿se recupera igual? {correcto}")
+    finally:
+        shutil.rmtree(demo_dir, ignore_errors=True)
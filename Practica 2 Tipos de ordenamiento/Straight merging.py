@@ -1,90 +1,49 @@
-def straight_merging(arr): # Define la función principal para el Ordenamiento por Fusión Directa.
+from BufferSupport import allocate_like, as_sequence # Entradas con protocolo de buffer.
+from KeySupport import sort_with_key # Interfaz común key=/reverse=.
+from MergeKernel import bottom_up_merge_sort # Núcleo de mezcla ascendente compartido con Natural merging.
+
+def straight_merging(arr, base_block=32, key=None, reverse=False): # Define la función principal para el Ordenamiento por Fusión Directa.
     """
     Ordena una lista de elementos utilizando el algoritmo de Fusión Directa (Straight Merging).
 
+    Las pasadas de mezcla alternan entre 'arr' y una lista temporal (sin copiar de vuelta en
+    cada mezcla), y la primera pasada parte de bloques de 'base_block' elementos ordenados por
+    inserción en lugar de sublistas de tamaño 1. Ver MergeKernel.bottom_up_merge_sort.
+
     Args:
-        arr: La lista de elementos a ordenar.
+        arr: La lista de elementos a ordenar (o cualquier buffer escribible: array.array, memoryview, NumPy, mmap... (ver BufferSupport.py)).
+        base_block: Tamaño de los bloques iniciales (1 = fusión directa clásica desde elementos individuales).
+        key: Función que extrae la clave de comparación de cada elemento (se calcula una sola vez por elemento).
+        reverse: Si es True, ordena de mayor a menor.
 
     Returns:
         La lista ordenada.
+
+    Estable: sí (en las mezclas, en empate va primero el elemento del tramo izquierdo).
     """
+    view = as_sequence(arr) # Vista indexable de la entrada, sin copiarla.
+    if view is not arr: # mmap, bytearray u otro buffer: se ordena a través de un memoryview.
+        straight_merging(view, base_block, key, reverse)
+        return arr
+    if key is not None or reverse: # Con clave u orden inverso se usa la interfaz común (ver KeySupport.py).
+        return sort_with_key(arr, key, reverse, lambda data: straight_merging(data, base_block),
+                             lambda keys, data: _straight_merging_keyed(keys, data, base_block))
+
     n = len(arr) # Obtiene la longitud de la lista.
     if n <= 1: # Si la lista tiene 0 o 1 elemento, ya está ordenada.
         return arr # Retorna la lista tal cual.
 
-    # Lista temporal para almacenar los resultados de la mezcla.
-    temp_arr = [0] * n # Crea una lista temporal del mismo tamaño que la original.
-
-    # 'current_size' es el tamaño de las sublistas a mezclar en la pasada actual.
-    # Comienza con sublistas de tamaño 1 (elementos individuales).
-    current_size = 1 # Inicializa el tamaño actual de las sublistas ordenadas.
-
-    # El bucle principal controla las pasadas de mezcla.
-    # Continúa mientras el tamaño de las sublistas sea menor que el tamaño total de la lista.
-    while current_size < n: # Este bucle externo se ejecuta log(n) veces.
-
-        # 'left_start' es el índice de inicio de la primera sublista en cada par a mezclar.
-        # Itera a través de la lista para encontrar pares de sublistas a fusionar.
-        left_start = 0 # Inicializa el inicio de la sublista izquierda.
-        while left_start < n - 1: # Itera mientras haya al menos dos sublistas para mezclar.
+    # Buffer temporal para almacenar los resultados de la mezcla.
+    temp_arr = allocate_like(arr, n) # Del mismo tamaño y tipo que la original (mismo typecode si es un buffer).
 
-            # Define los límites de las dos sublistas a mezclar.
-            # La sublista izquierda va de left_start a min(left_start + current_size - 1, n - 1).
-            mid = min(left_start + current_size - 1, n - 1) # Calcula el índice final de la sublista izquierda.
-            # La sublista derecha va de mid + 1 a min(left_start + 2 * current_size - 1, n - 1).
-            right_end = min(left_start + 2 * current_size - 1, n - 1) # Calcula el índice final de la sublista derecha.
+    # Pasadas de mezcla con tramos de tamaño base_block, 2*base_block, 4*base_block, ...
+    return bottom_up_merge_sort(arr, temp_arr, base_block) # Retorna la lista ya ordenada.
 
-            # Realiza la fusión de las dos sublistas.
-            _merge(arr, temp_arr, left_start, mid, right_end) # Llama a la función auxiliar _merge para fusionar.
+def _straight_merging_keyed(keys, values, base_block): # Fusión Directa según 'keys', moviendo 'values' a la par.
+    bottom_up_merge_sort(keys, base_block=base_block, values=values)
+    return values
 
-            # Mueve al inicio del siguiente par de sublistas.
-            left_start += 2 * current_size # Avanza al inicio del siguiente par de sublistas.
-
-        # Duplica el tamaño de las sublistas para la próxima pasada.
-        current_size *= 2 # Incrementa el tamaño de las sublistas que se van a mezclar en la siguiente iteración.
-
-    return arr # Retorna la lista ya ordenada.
-
-def _merge(arr, temp_arr, left, mid, right): # Función auxiliar para mezclar dos sub-arreglos.
-    """
-    Combina dos sub-arreglos de 'arr' en 'temp_arr' y luego los copia de vuelta a 'arr'.
-    El primer sub-arreglo es arr[left..mid].
-    El segundo sub-arreglo es arr[mid+1..right].
-    """
-    i = left # Índice para el sub-arreglo izquierdo.
-    j = mid + 1 # Índice para el sub-arreglo derecho.
-    k = left # Índice para la lista temporal 'temp_arr'.
-
-    # Compara elementos de ambas sublistas y los añade a 'temp_arr' en orden.
-    while i <= mid and j <= right: # Mientras haya elementos en ambas sublistas para comparar.
-        if arr[i] <= arr[j]: # Si el elemento del sub-arreglo izquierdo es menor o igual.
-            temp_arr[k] = arr[i] # Añade el elemento a 'temp_arr'.
-            i += 1 # Avanza al siguiente elemento en el sub-arreglo izquierdo.
-        else: # Si el elemento del sub-arreglo derecho es menor.
-            temp_arr[k] = arr[j] # Añade el elemento a 'temp_arr'.
-            j += 1 # Avanza al siguiente elemento en el sub-arreglo derecho.
-        k += 1 # Avanza al siguiente espacio en 'temp_arr'.
-
-    # Copia los elementos restantes del sub-arreglo izquierdo (si los hay).
-    while i <= mid: # Si quedan elementos en el sub-arreglo izquierdo.
-        temp_arr[k] = arr[i] # Añádelos directamente a 'temp_arr'.
-        i += 1 # Avanza el índice del sub-arreglo izquierdo.
-        k += 1 # Avanza el índice de 'temp_arr'.
-
-    # Copia los elementos restantes del sub-arreglo derecho (si los hay).
-    while j <= right: # Si quedan elementos en el sub-arreglo derecho.
-        temp_arr[k] = arr[j] # Añádelos directamente a 'temp_arr'.
-        j += 1 # Avanza el índice del sub-arreglo derecho.
-        k += 1 # Avanza el índice de 'temp_arr'.
-
-    # Copia los elementos de 'temp_arr' de vuelta a 'arr' en las posiciones correctas.
-    for idx in range(left, right + 1): # Itera sobre el rango que acaba de ser mezclado.
-        arr[idx] = temp_arr[idx] # Copia los elementos ordenados de vuelta a la lista original.
-
----
-### Ejemplo de Uso
-
-```python
+# --- Ejemplo de uso --- # Sección para demostrar cómo usar la función.
 if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute cuando el script se corre directamente.
     lista_desordenada = [38, 27, 43, 3, 9, 82, 10] # Crea una lista de ejemplo desordenada.
     print(f"Lista desordenada: {lista_desordenada}") # Imprime la lista original.
@@ -104,6 +63,11 @@ if __name__ == "__main__": # Esto asegura que el código dentro solo se ejecute
     straight_merging(lista_impar) # Ordena la lista impar.
     print(f"Lista ordenada (Straight Merging): {lista_impar}") # Imprime la lista impar ordenada.
 
+    print("\n--- Ejemplo con key= y reverse= ---") # Imprime un separador.
+    palabras = ["sol", "luna", "mar", "estrella", "río", "nube"] # Palabras de distintas longitudes.
+    straight_merging(palabras, key=len, reverse=True) # Por longitud, de mayor a menor (estable).
+    print(f"Por longitud, descendente: {palabras}") # 'sol', 'mar' y 'río' conservan su orden.
+
     print("\n--- Ejemplo con lista vacía ---") # Imprime un separador.
     lista_vacia = [] # Crea una lista vacía.
     print(f"Lista vacía: {lista_vacia}") # Imprime la lista vacía.